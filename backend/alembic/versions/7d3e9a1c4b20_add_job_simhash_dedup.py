@@ -0,0 +1,44 @@
+"""add_job_simhash_dedup
+
+Revision ID: 7d3e9a1c4b20
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3e9a1c4b20'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('simhash', sa.BigInteger(), nullable=True))
+    op.add_column('jobs', sa.Column('canonical_job_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key('fk_jobs_canonical_job_id', 'jobs', 'jobs', ['canonical_job_id'], ['id'])
+    op.create_index(op.f('ix_jobs_canonical_job_id'), 'jobs', ['canonical_job_id'], unique=False)
+
+    op.create_table(
+        'job_signature_buckets',
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('band', sa.SmallInteger(), nullable=False),
+        sa.Column('bucket', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id']),
+        sa.PrimaryKeyConstraint('job_id', 'band', 'bucket'),
+    )
+    op.create_index('ix_job_signature_buckets_band_bucket', 'job_signature_buckets', ['band', 'bucket'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_signature_buckets_band_bucket', table_name='job_signature_buckets')
+    op.drop_table('job_signature_buckets')
+    op.drop_index(op.f('ix_jobs_canonical_job_id'), table_name='jobs')
+    op.drop_constraint('fk_jobs_canonical_job_id', 'jobs', type_='foreignkey')
+    op.drop_column('jobs', 'canonical_job_id')
+    op.drop_column('jobs', 'simhash')
@@ -0,0 +1,40 @@
+"""add_resume_batches
+
+Revision ID: 9f4b2d7e1c35
+Revises: e5c1a9f3b782
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9f4b2d7e1c35'
+down_revision: Union[str, None] = 'e5c1a9f3b782'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'resume_batches',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('total_files', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('duplicates', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('rejected', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.add_column('resumes', sa.Column('batch_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key('fk_resumes_batch_id', 'resumes', 'resume_batches', ['batch_id'], ['id'])
+    op.create_index(op.f('ix_resumes_batch_id'), 'resumes', ['batch_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resumes_batch_id'), table_name='resumes')
+    op.drop_constraint('fk_resumes_batch_id', 'resumes', type_='foreignkey')
+    op.drop_column('resumes', 'batch_id')
+    op.drop_table('resume_batches')
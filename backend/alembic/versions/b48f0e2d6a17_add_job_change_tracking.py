@@ -0,0 +1,32 @@
+"""add_job_change_tracking
+
+Revision ID: b48f0e2d6a17
+Revises: 7d3e9a1c4b20
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b48f0e2d6a17'
+down_revision: Union[str, None] = '7d3e9a1c4b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('content_hash', sa.String(), nullable=True))
+    op.add_column('jobs', sa.Column('last_seen_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+    # Existing jobs count as seen when they were created
+    op.execute("UPDATE jobs SET last_seen_at = COALESCE(created_at, now())")
+    op.create_index(op.f('ix_jobs_last_seen_at'), 'jobs', ['last_seen_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_jobs_last_seen_at'), table_name='jobs')
+    op.drop_column('jobs', 'last_seen_at')
+    op.drop_column('jobs', 'content_hash')
@@ -0,0 +1,28 @@
+"""add_parsed_documents
+
+Revision ID: c3d8e6a2f914
+Revises: 9f4b2d7e1c35
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8e6a2f914'
+down_revision: Union[str, None] = '9f4b2d7e1c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('parsed_document', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('tailored_resumes', sa.Column('tailored_document', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('tailored_resumes', 'tailored_document')
+    op.drop_column('resumes', 'parsed_document')
@@ -0,0 +1,25 @@
+"""add_job_requirement_digest
+
+Revision ID: d7a4f1b9e2c6
+Revises: c3d8e6a2f914
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a4f1b9e2c6'
+down_revision: Union[str, None] = 'c3d8e6a2f914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('requirement_digest', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('jobs', 'requirement_digest')
@@ -0,0 +1,30 @@
+"""add_resume_scored_at
+
+Revision ID: e8c3a5f7b1d2
+Revises: d7a4f1b9e2c6
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c3a5f7b1d2'
+down_revision: Union[str, None] = 'd7a4f1b9e2c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('scored_at', sa.DateTime(timezone=True), nullable=True))
+    # Resumes scored before this column existed
+    op.execute(
+        "UPDATE resumes SET scored_at = now() "
+        "WHERE id IN (SELECT DISTINCT resume_id FROM ats_scores)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('resumes', 'scored_at')
@@ -9,6 +9,7 @@ from app.api import deps
 from app.models.job import Job
 from app.models.company import Company
 from app.models.job_source import JobSource
+from app.models.load_profiles import JOB_TEXT
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -30,6 +31,7 @@ def _row_to_dict(row) -> dict:
         "posted_at": job.posted_at.isoformat() if job.posted_at else None,
         "created_at": job.created_at.isoformat() if job.created_at else None,
         "is_active": job.is_active,
+        "canonical_job_id": str(job.canonical_job_id) if job.canonical_job_id else None,
     }
 
 
@@ -57,6 +59,7 @@ async def list_jobs(
         )
         .join(Company, Job.company_id == Company.id)
         .join(JobSource, Job.source_id == JobSource.id)
+        .options(*JOB_TEXT)  # description_text is part of the response
         .offset(skip)
         .limit(limit)
     )
@@ -88,6 +91,7 @@ async def get_job(job_id: str, db: AsyncSession = Depends(deps.get_db)):
         )
         .join(Company, Job.company_id == Company.id)
         .join(JobSource, Job.source_id == JobSource.id)
+        .options(*JOB_TEXT)  # description_text is part of the response
         .filter(Job.id == job_uuid)
     )
 
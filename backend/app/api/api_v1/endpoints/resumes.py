@@ -1,19 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-import shutil
+from sqlalchemy import desc, func, insert
+from typing import Dict, List, Tuple
+from uuid import UUID, uuid4
 import os
-from uuid import uuid4
 import pdfminer.high_level
 
 from app.api import deps
+from app.core.config import settings
+from app.models.load_profiles import RESUME_DETAIL
 from app.models.resume import Resume
+from app.models.resume_batch import ResumeBatch
 from app.schemas.resume import Resume as ResumeSchema
+from app.services.storage import get_storage
+from app.services.uploads import (
+    ZIP_MAGIC, StoredUpload, UploadRejected, UploadTooLargeError, save_upload, save_zip_entries,
+)
 
 router = APIRouter()
 
-UPLOAD_DIR = "uploads/resumes"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# Resumes in these states can stand in for an identical upload: PARSED ones
+# already have text, skills and scores; the others have a parse queued.
+REUSABLE_STATUSES = ("PARSED", "PARSING", "UPLOADED")
 
 def extract_text_from_pdf(file_path: str) -> str:
     try:
@@ -23,6 +32,17 @@ def extract_text_from_pdf(file_path: str) -> str:
         print(f"Error extracting text: {e}")
         return ""
 
+async def find_reusable_resume(db: AsyncSession, content_hash: str):
+    """Most useful existing resume with the same content: PARSED first, then in-flight."""
+    result = await db.execute(
+        select(Resume)
+        .options(*RESUME_DETAIL)
+        .filter(Resume.content_hash == content_hash, Resume.status.in_(REUSABLE_STATUSES))
+        .order_by(Resume.status != "PARSED", desc(Resume.uploaded_at))
+        .limit(1)
+    )
+    return result.scalars().first()
+
 @router.post("/", response_model=ResumeSchema)
 async def upload_resume(
     candidate_name: str = Form(...),
@@ -32,18 +52,28 @@ async def upload_resume(
 ):
     """
     Upload a resume (PDF) and parse it.
+    Re-uploading an identical file returns the existing resume without
+    re-parsing or re-scoring it.
     """
-    file_id = str(uuid4())
-    ext = file.filename.split('.')[-1]
-    file_path = f"{UPLOAD_DIR}/{file_id}.{ext}"
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # Streamed in chunks (size limit, PDF magic bytes, SHA-256 on the fly)
+    try:
+        upload = await save_upload(file)
+    except UploadRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    file_path = upload.key  # storage key
+    content_hash = upload.content_hash
+
+    existing = await find_reusable_resume(db, content_hash)
+    if existing:
+        await get_storage().delete(file_path)
+        print(f"Upload matches resume {existing.id} ({existing.status}); skipping parse")
+        return existing
     
     resume = Resume(
         candidate_name=candidate_name,
         email=email,
         file_path=file_path,
+        content_hash=content_hash,
         parsed_text=None,
         skills_extracted={},
         status="UPLOADED"
@@ -51,7 +81,8 @@ async def upload_resume(
     
     db.add(resume)
     await db.commit()
-    await db.refresh(resume)
+    # Only the server default; a full refresh would unload parsed_text (deferred)
+    await db.refresh(resume, ["uploaded_at"])
     
     # Trigger Async Parsing
     from app.workers.parsing import parse_resume_task
@@ -59,12 +90,168 @@ async def upload_resume(
     
     return resume
 
+async def _remove_uploads(keys: List[str]) -> None:
+    storage = get_storage()
+    for key in keys:
+        await storage.delete(key)
+
+@router.post("/bulk")
+async def upload_resume_batch(
+    files: List[UploadFile] = File(...),
+    db: AsyncSession = Depends(deps.get_db)
+):
+    """
+    Bulk intake: any mix of PDFs and ZIP archives of PDFs.
+    All new resumes are inserted in one statement, parsed in chunked batch
+    tasks and scored through the coalesced scoring queue; poll
+    GET /resumes/bulk/{batch_id} for progress.
+    Files identical to an existing resume reuse it (see upload_resume).
+    """
+    stored: List[Tuple[str, StoredUpload]] = []
+    rejected: List[Dict[str, str]] = []
+
+    for file in files:
+        head = await file.read(len(ZIP_MAGIC))
+        await file.seek(0)
+        if head == ZIP_MAGIC:
+            try:
+                entries, bad = await save_zip_entries(file.file)
+            except UploadRejected as e:
+                await _remove_uploads([u.key for _, u in stored])
+                raise HTTPException(status_code=e.status_code, detail=f"{file.filename}: {e}")
+            stored.extend(entries)
+            rejected.extend(bad)
+        else:
+            try:
+                stored.append((file.filename, await save_upload(file)))
+            except UploadRejected as e:
+                rejected.append({"filename": file.filename, "reason": str(e)})
+
+        if len(stored) > settings.RESUME_BULK_MAX_FILES:
+            await _remove_uploads([u.key for _, u in stored])
+            error = UploadTooLargeError(f"Batch exceeds {settings.RESUME_BULK_MAX_FILES} files")
+            raise HTTPException(status_code=error.status_code, detail=str(error))
+
+    if not stored:
+        raise HTTPException(status_code=400, detail={"message": "No valid PDF files in upload", "rejected": rejected})
+
+    # Reuse existing resumes with identical content (PARSED preferred)
+    hashes = list({u.content_hash for _, u in stored})
+    result = await db.execute(
+        select(Resume.id, Resume.content_hash)
+        .filter(Resume.content_hash.in_(hashes), Resume.status.in_(REUSABLE_STATUSES))
+        .order_by(Resume.status != "PARSED", desc(Resume.uploaded_at))
+    )
+    resume_by_hash: Dict[str, UUID] = {}
+    for resume_id, content_hash in result.all():
+        resume_by_hash.setdefault(content_hash, resume_id)
+
+    batch = ResumeBatch(id=uuid4(), total_files=len(stored) + len(rejected), rejected=rejected)
+    db.add(batch)
+    await db.flush()
+
+    new_rows = []
+    new_hashes = set()
+    duplicate_files: List[Tuple[str, StoredUpload]] = []
+    for filename, upload in stored:
+        if upload.content_hash in resume_by_hash or upload.content_hash in new_hashes:
+            duplicate_files.append((filename, upload))
+            continue
+        new_hashes.add(upload.content_hash)
+        new_rows.append({
+            "candidate_name": os.path.splitext(os.path.basename(filename or ""))[0] or "Unknown",
+            "file_path": upload.key,
+            "content_hash": upload.content_hash,
+            "skills_extracted": {},
+            "status": "UPLOADED",
+            "batch_id": batch.id,
+        })
+
+    new_ids: List[str] = []
+    if new_rows:
+        # One INSERT ... VALUES (...), (...) RETURNING for the whole batch
+        result = await db.execute(
+            insert(Resume).values(new_rows).returning(Resume.id, Resume.content_hash)
+        )
+        for resume_id, content_hash in result.all():
+            resume_by_hash[content_hash] = resume_id
+            new_ids.append(str(resume_id))
+
+    batch.duplicates = [
+        {"filename": filename, "resume_id": str(resume_by_hash[upload.content_hash])}
+        for filename, upload in duplicate_files
+    ]
+    await db.commit()
+    await _remove_uploads([u.key for _, u in duplicate_files])
+
+    # Trigger chunked batch parsing (each chunk scores its resumes together)
+    if new_ids:
+        from celery import group
+        from app.workers.parsing import parse_resume_batch_task
+        chunk_size = settings.RESUME_BULK_CHUNK_SIZE
+        group(
+            parse_resume_batch_task.s(new_ids[i:i + chunk_size])
+            for i in range(0, len(new_ids), chunk_size)
+        ).apply_async()
+
+    return {
+        "batch_id": str(batch.id),
+        "total_files": batch.total_files,
+        "accepted": len(new_ids),
+        "duplicates": batch.duplicates,
+        "rejected": rejected,
+    }
+
+@router.get("/bulk/{batch_id}")
+async def get_resume_batch(
+    batch_id: str,
+    db: AsyncSession = Depends(deps.get_db)
+):
+    """Aggregate progress of a bulk intake."""
+    try:
+        batch_uuid = UUID(batch_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid UUID")
+
+    batch = await db.get(ResumeBatch, batch_uuid)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    result = await db.execute(
+        select(Resume.status, func.count()).filter(Resume.batch_id == batch_uuid).group_by(Resume.status)
+    )
+    by_status = {status: count for status, count in result.all()}
+    # Scoring completion, not score rows: a run against zero jobs writes none
+    scored = await db.scalar(
+        select(func.count())
+        .select_from(Resume)
+        .filter(Resume.batch_id == batch_uuid, Resume.status == "PARSED", Resume.scored_at.is_not(None))
+    )
+
+    total = sum(by_status.values())
+    parsed = by_status.get("PARSED", 0)
+    failed = by_status.get("FAILED", 0)
+    pending = total - parsed - failed
+    return {
+        "batch_id": str(batch.id),
+        "created_at": batch.created_at,
+        "total_files": batch.total_files,
+        "resumes": total,
+        "pending": pending,
+        "parsed": parsed,
+        "failed": failed,
+        "scored": scored or 0,
+        "duplicates": batch.duplicates or [],
+        "rejected": batch.rejected or [],
+        "status": "COMPLETED" if pending == 0 and (scored or 0) >= parsed else "PROCESSING",
+    }
+
 @router.get("/latest")
 async def get_latest_resume(db: AsyncSession = Depends(deps.get_db)):
     """Return the most recently uploaded PARSED resume, or 404 if none exists."""
-    from sqlalchemy import desc
     result = await db.execute(
         select(Resume)
+        .options(*RESUME_DETAIL)
         .filter(Resume.status == "PARSED")
         .order_by(desc(Resume.uploaded_at))
         .limit(1)
@@ -75,6 +262,13 @@ async def get_latest_resume(db: AsyncSession = Depends(deps.get_db)):
     return resume
 
 
+@router.get("/parsing/stats")
+async def get_parsing_stats():
+    """PDF extraction latency percentiles, outcome counts and timeout rate."""
+    from app.services.parsing.pdf_extraction import extraction_stats
+    return await extraction_stats()
+
+
 @router.get("/{resume_id}", response_model=ResumeSchema)
 async def get_resume(
     resume_id: str,
@@ -86,7 +280,7 @@ async def get_resume(
     except:
         raise HTTPException(status_code=400, detail="Invalid UUID")
         
-    result = await db.execute(select(Resume).filter(Resume.id == resume_uuid))
+    result = await db.execute(select(Resume).options(*RESUME_DETAIL).filter(Resume.id == resume_uuid))
     resume = result.scalars().first()
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -32,11 +32,12 @@ async def analyze_resume_against_market(
     """
     from app.models.job import Job
     
-    # 1. Fetch all active jobs
-    result = await db.execute(select(Job).filter(Job.is_active == True))
-    jobs = result.scalars().all()
+    # 1. Check there is at least one active canonical job
+    result = await db.execute(
+        select(Job.id).filter(Job.is_active == True, Job.canonical_job_id.is_(None)).limit(1)
+    )
     
-    if not jobs:
+    if result.scalar() is None:
         raise HTTPException(status_code=404, detail="No active jobs found to analyze")
 
     # 2. Trigger Batch Celery Task
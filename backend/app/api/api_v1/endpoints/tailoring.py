@@ -1,15 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
 from sqlalchemy.future import select
+from typing import Dict, Tuple
 from uuid import UUID
 import io
 
 from app.api import deps
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.load_profiles import TAILORED_CONTENT, TAILORED_RENDER
 from app.models.tailored_resume import TailoredResume
 from app.models.resume import Resume
 from app.models.job import Job
 from app.models.company import Company
+from app.schemas.tailoring import TailorBatchRequest
+from app.services.tailoring.events import format_sse, subscribe_events
 
 router = APIRouter()
 
@@ -44,9 +51,8 @@ async def tailor_resume(
         raise HTTPException(status_code=422, detail=f"Resume status is '{resume.status}'; must be PARSED")
 
     # Validate job exists
-    job_result = await db.execute(select(Job).filter(Job.id == job_uuid))
-    job = job_result.scalars().first()
-    if not job:
+    job_result = await db.execute(select(Job.id).filter(Job.id == job_uuid))
+    if job_result.scalar() is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
     # Idempotency: return existing non-FAILED record for same resume+job
@@ -62,11 +68,12 @@ async def tailor_resume(
     if existing:
         return {"tailored_resume_id": str(existing.id), "status": existing.status}
 
-    # Create new TailoredResume record
+    # Create new TailoredResume record (resume text is only fetched here)
+    parsed_text = await db.scalar(select(Resume.parsed_text).filter(Resume.id == resume_uuid))
     tailored = TailoredResume(
         resume_id=resume_uuid,
         job_id=job_uuid,
-        original_text=resume.parsed_text or "",
+        original_text=parsed_text or "",
         status="PENDING",
     )
     db.add(tailored)
@@ -80,6 +87,118 @@ async def tailor_resume(
     return {"tailored_resume_id": str(tailored.id), "status": "PENDING"}
 
 
+# ---------------------------------------------------------------------------
+# POST /resumes/{resume_id}/tailor-batch
+# ---------------------------------------------------------------------------
+
+@router.post("/{resume_id}/tailor-batch", status_code=202)
+async def tailor_resume_batch(
+    resume_id: str,
+    request: TailorBatchRequest,
+    db: AsyncSession = Depends(deps.get_db),
+):
+    """
+    Trigger tailoring of one resume for many jobs in a single task.
+    Returns one {job_id, tailored_resume_id, status} entry per job; jobs
+    that already have a non-FAILED record keep it (same idempotency as the
+    single-job endpoint).
+    """
+    try:
+        resume_uuid = UUID(resume_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid UUID format")
+
+    job_uuids = list(dict.fromkeys(request.job_ids))
+    if len(job_uuids) > settings.TAILORING_BATCH_MAX_JOBS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {settings.TAILORING_BATCH_MAX_JOBS} jobs per batch",
+        )
+
+    res_result = await db.execute(select(Resume.status).filter(Resume.id == resume_uuid))
+    status = res_result.scalar()
+    if status is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    if status != "PARSED":
+        raise HTTPException(status_code=422, detail=f"Resume status is '{status}'; must be PARSED")
+
+    job_result = await db.execute(select(Job.id).filter(Job.id.in_(job_uuids)))
+    unknown = set(job_uuids) - set(job_result.scalars().all())
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Jobs not found: {', '.join(sorted(map(str, unknown)))}")
+
+    # Idempotency: newest non-FAILED record per job
+    existing_result = await db.execute(
+        select(TailoredResume.job_id, TailoredResume.id, TailoredResume.status)
+        .filter(TailoredResume.resume_id == resume_uuid)
+        .filter(TailoredResume.job_id.in_(job_uuids))
+        .filter(TailoredResume.status.in_(["PENDING", "DRAFT", "APPROVED", "DOWNLOADED"]))
+        .order_by(TailoredResume.created_at.desc())
+    )
+    existing: Dict[UUID, Tuple[UUID, str]] = {}
+    for job_uuid, tailored_uuid, tailored_status in existing_result:
+        existing.setdefault(job_uuid, (tailored_uuid, tailored_status))
+
+    new_job_ids = [j for j in job_uuids if j not in existing]
+    created: Dict[UUID, UUID] = {}
+    if new_job_ids:
+        parsed_text = await db.scalar(select(Resume.parsed_text).filter(Resume.id == resume_uuid))
+        insert_result = await db.execute(
+            insert(TailoredResume)
+            .values([
+                {"resume_id": resume_uuid, "job_id": j, "original_text": parsed_text or "", "status": "PENDING"}
+                for j in new_job_ids
+            ])
+            .returning(TailoredResume.job_id, TailoredResume.id)
+        )
+        created = dict(insert_result.all())
+        await db.commit()
+
+        from app.workers.tailoring import tailor_resume_batch_task
+        tailor_resume_batch_task.delay(str(resume_uuid), [str(t) for t in created.values()])
+
+    return [
+        {
+            "job_id": str(j),
+            "tailored_resume_id": str(created[j]) if j in created else str(existing[j][0]),
+            "status": "PENDING" if j in created else existing[j][1],
+        }
+        for j in job_uuids
+    ]
+
+
+# ---------------------------------------------------------------------------
+# GET /resumes/tailoring/cache-stats, /scheduler-stats, /usage-stats, /breaker
+# ---------------------------------------------------------------------------
+
+@router.get("/tailoring/cache-stats")
+async def get_llm_cache_stats():
+    """LLM response cache hit ratio and tokens saved."""
+    from app.services.llm.cache import cache_stats
+    return await cache_stats()
+
+
+@router.get("/tailoring/scheduler-stats")
+async def get_llm_scheduler_stats():
+    """LLM scheduler admissions, throttling and queue wait per lane."""
+    from app.services.llm.scheduler import scheduler_stats
+    return await scheduler_stats()
+
+
+@router.get("/tailoring/usage-stats")
+async def get_llm_usage_stats():
+    """LLM prompt/cached/completion tokens and latency per prompt version."""
+    from app.services.llm.usage import usage_stats
+    return await usage_stats()
+
+
+@router.get("/tailoring/breaker")
+async def get_llm_breaker_state():
+    """LLM provider circuit breaker state, recent failures and trips."""
+    from app.services.llm.breaker import breaker_stats
+    return await breaker_stats()
+
+
 # ---------------------------------------------------------------------------
 # GET /resumes/tailored  (list all)
 # ---------------------------------------------------------------------------
@@ -134,7 +253,7 @@ async def get_tailored_resume(
         raise HTTPException(status_code=400, detail="Invalid UUID format")
 
     result = await db.execute(
-        select(TailoredResume).filter(TailoredResume.id == tailored_uuid)
+        select(TailoredResume).options(*TAILORED_CONTENT).filter(TailoredResume.id == tailored_uuid)
     )
     tailored = result.scalars().first()
     if not tailored:
@@ -167,6 +286,61 @@ async def get_tailored_resume(
     }
 
 
+# ---------------------------------------------------------------------------
+# GET /resumes/tailored/{id}/events  (SSE)
+# ---------------------------------------------------------------------------
+
+@router.get("/tailored/{tailored_id}/events")
+async def stream_tailoring_events(
+    tailored_id: str,
+    request: Request,
+):
+    """
+    Server-Sent Events for a tailoring run: started, per-section progress
+    (section_started, shot1_result, shot2_retry, shot2_result),
+    rule_based_fallback, optional model tokens, then done/failed.
+    Replaces polling GET /resumes/tailored/{id}; reconnects resume from
+    Last-Event-ID. A record that is no longer PENDING gets its final state
+    as a single event.
+
+    The status is read in a short-lived session of its own: a request-scoped
+    session would hold a pooled connection for the whole stream.
+    """
+    try:
+        tailored_uuid = UUID(tailored_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid UUID format")
+
+    async with AsyncSessionLocal() as db:
+        status = await db.scalar(select(TailoredResume.status).filter(TailoredResume.id == tailored_uuid))
+    if status is None:
+        raise HTTPException(status_code=404, detail="Tailored resume not found")
+
+    try:
+        last_seq = int(request.headers.get("last-event-id", 0))
+    except ValueError:
+        last_seq = 0
+
+    async def event_stream():
+        if status != "PENDING":
+            event_type = "failed" if status == "FAILED" else "done"
+            yield format_sse(0, {"type": event_type, "status": status})
+            return
+        async for item in subscribe_events(tailored_id, last_seq):
+            if await request.is_disconnected():
+                break
+            if item is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(*item)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ---------------------------------------------------------------------------
 # POST /resumes/tailored/{id}/approve
 # ---------------------------------------------------------------------------
@@ -221,7 +395,7 @@ async def download_tailored_resume(
         raise HTTPException(status_code=400, detail="Invalid UUID format")
 
     result = await db.execute(
-        select(TailoredResume).filter(TailoredResume.id == tailored_uuid)
+        select(TailoredResume).options(*TAILORED_RENDER).filter(TailoredResume.id == tailored_uuid)
     )
     tailored = result.scalars().first()
     if not tailored:
@@ -233,15 +407,17 @@ async def download_tailored_resume(
         )
 
     # Get candidate name for PDF metadata
-    resume_result = await db.execute(
-        select(Resume).filter(Resume.id == tailored.resume_id)
-    )
-    resume = resume_result.scalars().first()
-    candidate_name = resume.candidate_name if resume else ""
+    candidate_name = await db.scalar(
+        select(Resume.candidate_name).filter(Resume.id == tailored.resume_id)
+    ) or ""
 
     # Generate PDF
     from app.services.tailoring.pdf_generator import generate_pdf
-    pdf_bytes = generate_pdf(tailored.tailored_text or "", candidate_name=candidate_name)
+    pdf_bytes = generate_pdf(
+        tailored.tailored_text or "",
+        candidate_name=candidate_name,
+        section_spans=(tailored.tailored_document or {}).get("sections"),
+    )
 
     # Mark as DOWNLOADED
     if tailored.status == "APPROVED":
@@ -39,8 +39,120 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str = "redis://redis:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://redis:6379/0"
 
+    # Scraper
+    # Optional override for RecursiveScraper's dataset (.json array or .jsonl)
+    SCRAPER_DATASET_PATH: Optional[str] = None
+    # When set, ingestion crawls this listing site with HttpScraper instead
+    SCRAPER_HTTP_BASE_URL: Optional[str] = None
+    SCRAPER_HTTP_MAX_CONNECTIONS: int = 10
+    SCRAPER_HTTP_TIMEOUT_SECONDS: float = 15.0
+    SCRAPER_HTTP_MAX_PAGES: int = 50
+
+    # Near-duplicate job detection (SimHash Hamming distance; values <= 3 are
+    # guaranteed to share an LSH band, larger values may miss candidates)
+    DEDUP_SIMHASH_MAX_DISTANCE: int = 3
+
+    # Jobs not seen by any crawl within this window are marked inactive
+    JOB_STALE_AFTER_HOURS: int = 72
+    JOB_STALE_SWEEP_INTERVAL_MINUTES: int = 60
+
+    # Blob storage for uploaded documents: "local" (sharded directory under
+    # STORAGE_LOCAL_ROOT) or "s3" (any S3-compatible endpoint, e.g. MinIO)
+    STORAGE_BACKEND: str = "local"
+    STORAGE_LOCAL_ROOT: str = "uploads"
+    S3_BUCKET: str = "nexusai-uploads"
+    S3_ENDPOINT_URL: Optional[str] = None
+    S3_REGION: Optional[str] = None
+    S3_ACCESS_KEY_ID: Optional[str] = None
+    S3_SECRET_ACCESS_KEY: Optional[str] = None
+    S3_MAX_CONNECTIONS: int = 20
+    S3_MULTIPART_CHUNK_BYTES: int = 8 * 1024 * 1024
+
+    # Resume uploads larger than this are rejected with 413
+    RESUME_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    # Bulk intake (POST /resumes/bulk): whole request, file count, and
+    # resumes per parse/score task
+    RESUME_BULK_MAX_UPLOAD_BYTES: int = 500 * 1024 * 1024
+    RESUME_BULK_MAX_FILES: int = 1000
+    RESUME_BULK_CHUNK_SIZE: int = 25
+
+    # Coalesced scoring: resumes parsed within the window (or until the batch
+    # is full) are scored together against one load of the job corpus
+    SCORING_BATCH_WINDOW_SECONDS: float = 2.0
+    SCORING_BATCH_MAX_SIZE: int = 100
+    # A batch not acknowledged within the lease (worker died) is requeued by
+    # the sweep, which runs every SCORING_SWEEP_INTERVAL_SECONDS under beat
+    SCORING_BATCH_LEASE_SECONDS: int = 1800
+    SCORING_SWEEP_INTERVAL_SECONDS: int = 60
+    # Jobs per server-side cursor partition when scoring against the corpus
+    SCORING_JOB_PARTITION_SIZE: int = 1000
+
+    # Resume PDF extraction limits (process pool)
+    PDF_EXTRACTION_WORKERS: int = 2
+    PDF_EXTRACTION_TIMEOUT_SECONDS: float = 30.0
+    PDF_MAX_PAGES: int = 20
+    PDF_MAX_BYTES: int = 10 * 1024 * 1024
+    # "accurate" (pdfminer layout analysis) or "fast" (stream-order text, no layout analysis)
+    PDF_EXTRACTION_PROFILE: str = "accurate"
+    # Documents with at least this many pages are extracted page-parallel
+    PDF_PARALLEL_MIN_PAGES: int = 4
+
     # OpenAI
     OPENAI_API_KEY: Optional[str] = None
+    # Shared client (app/services/llm/client.py). OPENAI_BASE_URL redirects
+    # every call, e.g. to a local stand-in server.
+    OPENAI_BASE_URL: Optional[str] = None
+    OPENAI_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    OPENAI_READ_TIMEOUT_SECONDS: float = 60.0
+    OPENAI_MAX_RETRIES: int = 3
+    OPENAI_MAX_CONNECTIONS: int = 20
+    # LLM response cache (app/services/llm/cache.py): Redis, plus an
+    # optional on-disk tier when LLM_CACHE_DIR is set
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    LLM_CACHE_DIR: Optional[str] = None
+    # Shared LLM rate limits (app/services/llm/scheduler.py). The bulk lane
+    # (batch tailoring) leaves LLM_INTERACTIVE_RESERVE of both buckets free.
+    LLM_RPM_LIMIT: int = 500
+    LLM_TPM_LIMIT: int = 200000
+    LLM_INTERACTIVE_RESERVE: float = 0.2
+    LLM_SCHEDULER_MAX_WAIT_SECONDS: float = 120.0
+    # Provider circuit breaker (app/services/llm/breaker.py): opens when at
+    # least LLM_BREAKER_FAILURE_RATE of the window's calls (min calls) errored
+    # or took longer than LLM_BREAKER_SLOW_SECONDS
+    LLM_BREAKER_FAILURE_RATE: float = 0.5
+    LLM_BREAKER_SLOW_SECONDS: float = 30.0
+    LLM_BREAKER_MIN_CALLS: int = 10
+    LLM_BREAKER_WINDOW_SECONDS: int = 60
+    LLM_BREAKER_COOLDOWN_SECONDS: int = 30
+    # Resume sections (or chunks of long sections) optimized concurrently
+    # per tailoring run
+    TAILORING_SECTION_CONCURRENCY: int = 6
+    # EXPERIENCE sections longer than this (estimated tokens) are split at
+    # role or bullet-group boundaries into chunks of at most this size,
+    # optimized concurrently (app/services/tailoring/chunking.py); 0 disables
+    TAILORING_CHUNK_MAX_TOKENS: int = 600
+    # Shot execution per section: "serial" (Shot 2 only after Shot 1 made no
+    # change) or "hedged" (Shot 2 also starts speculatively once Shot 1 has
+    # run TAILORING_HEDGE_AFTER_SECONDS, or at once for sections whose recent
+    # Shot 1 no-op rate is at least TAILORING_HEDGE_NOOP_RATE over at least
+    # TAILORING_HEDGE_MIN_SAMPLES runs; the first acceptable result wins)
+    TAILORING_SHOT_MODE: str = "serial"
+    TAILORING_HEDGE_AFTER_SECONDS: float = 6.0
+    TAILORING_HEDGE_NOOP_RATE: float = 0.6
+    TAILORING_HEDGE_MIN_SAMPLES: int = 20
+    # POST /resumes/{id}/tailor-batch: jobs per request, and distinct
+    # prompt groups tailored concurrently per batch task
+    TAILORING_BATCH_MAX_JOBS: int = 50
+    TAILORING_BATCH_CONCURRENCY: int = 4
+    # Progress events (GET /resumes/tailored/{id}/events): replay log
+    # lifetime, SSE keep-alive interval, and whether model tokens are streamed
+    TAILORING_EVENTS_TTL_SECONDS: int = 3600
+    TAILORING_EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    TAILORING_STREAM_TOKENS: bool = False
+    # Size of the per-job requirement digest sent in place of the full job
+    # description in section prompts (app/services/tailoring/digest.py)
+    TAILORING_DIGEST_MAX_TOKENS: int = 250
     
     class Config:
         case_sensitive = True
@@ -0,0 +1,34 @@
+import asyncio
+from typing import Dict
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+class RedisClients:
+    """
+    Lazily created, process-wide Redis clients (both are connection pools).
+    Async clients are bound to an event loop, so one is kept per loop.
+    """
+    sync_client: redis.Redis = None
+    async_clients: Dict[int, aioredis.Redis] = {}
+
+    def get(self) -> redis.Redis:
+        if self.sync_client is None:
+            self.sync_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self.sync_client
+
+    def get_async(self) -> aioredis.Redis:
+        loop_id = id(asyncio.get_running_loop())
+        if loop_id not in self.async_clients:
+            self.async_clients[loop_id] = aioredis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self.async_clients[loop_id]
+
+redis_clients = RedisClients()
+
+def get_redis() -> redis.Redis:
+    return redis_clients.get()
+
+def get_async_redis() -> aioredis.Redis:
+    return redis_clients.get_async()
@@ -31,6 +31,14 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+from app.services.uploads import ContentLengthLimitMiddleware
+
+# Refuse oversized resume uploads before their body is read
+app.add_middleware(ContentLengthLimitMiddleware, limits={
+    f"{settings.API_V1_STR}/resumes": settings.RESUME_MAX_UPLOAD_BYTES,
+    f"{settings.API_V1_STR}/resumes/bulk": settings.RESUME_BULK_MAX_UPLOAD_BYTES,
+})
+
 @app.get("/")
 def root():
     return {"message": "NexusAI API is running"}
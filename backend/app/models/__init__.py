@@ -2,7 +2,9 @@ from app.db.base_class import Base
 from app.models.company import Company
 from app.models.job_source import JobSource
 from app.models.job import Job
+from app.models.job_signature import JobSignatureBucket
 from app.models.resume import Resume
+from app.models.resume_batch import ResumeBatch
 from app.models.score import ATSScore
 from app.models.skills import ResumeSkill, JobSkill
 from app.models.tailored_resume import TailoredResume
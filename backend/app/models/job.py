@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Boolean, Text
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -15,7 +15,11 @@ class Job(Base):
     source_id = Column(Integer, ForeignKey("job_sources.id"), nullable=False)
     external_id = Column(String, index=True, nullable=True) # ID from the source system
     location = Column(String, nullable=True)
-    description_text = Column(Text, nullable=True)
+    # Deferred (raise if not loaded); see app/models/load_profiles.py
+    description_text = deferred(Column(Text, nullable=True), raiseload=True)
+    # Requirement lines of the description, condensed for tailoring prompts
+    # (app/services/tailoring/digest.py); NULL until first computed
+    requirement_digest = deferred(Column(Text, nullable=True), raiseload=True)
     
     salary_min = Column(Integer, nullable=True)
     salary_max = Column(Integer, nullable=True)
@@ -28,8 +32,19 @@ class Job(Base):
     # Hash for deduplication (title + company + location)
     job_hash = Column(String, unique=True, index=True, nullable=False)
 
+    # Change detection for re-crawls: hash of mutable content + last crawl sighting.
+    # Jobs unseen for JOB_STALE_AFTER_HOURS are deactivated by a scheduled sweep.
+    content_hash = Column(String, nullable=True)
+    last_seen_at = Column(DateTime(timezone=True), index=True, server_default=func.now())
+
+    # Near-duplicate detection: SimHash of the normalized description.
+    # Jobs linked to a canonical job are syndicated copies and are not scored.
+    simhash = Column(BigInteger, nullable=True)
+    canonical_job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), index=True, nullable=True)
+
     company = relationship("Company", back_populates="jobs")
     source = relationship("JobSource", back_populates="jobs")
     ats_scores = relationship("ATSScore", back_populates="job")
     skills = relationship("JobSkill", back_populates="job", cascade="all, delete-orphan")
     tailored_resumes = relationship("TailoredResume", back_populates="job")
+    signature_buckets = relationship("JobSignatureBucket", back_populates="job", cascade="all, delete-orphan")
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, SmallInteger, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+class JobSignatureBucket(Base):
+    """
+    LSH bucket entry for a canonical job's SimHash band.
+    Only canonical jobs are indexed, so lookups stay bounded by bucket size.
+    """
+    __tablename__ = "job_signature_buckets"
+
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), primary_key=True)
+    band = Column(SmallInteger, primary_key=True)
+    bucket = Column(Integer, primary_key=True)
+
+    job = relationship("Job", back_populates="signature_buckets")
+
+    __table_args__ = (
+        Index("ix_job_signature_buckets_band_bucket", "band", "bucket"),
+    )
@@ -0,0 +1,36 @@
+"""
+Loader option profiles for the deferred (large Text/JSONB) columns.
+
+Resume.parsed_text / parsed_document, Job.description_text /
+requirement_digest and the TailoredResume content group are deferred with
+raiseload: a query that does not ask for them never transfers them, and
+touching one that was not loaded raises immediately instead of attempting
+a lazy load (which cannot work under asyncio anyway). Code paths that need
+them opt in:
+
+    select(Resume).options(*RESUME_ANALYSIS)
+"""
+
+from sqlalchemy.orm import undefer, undefer_group
+
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.tailored_resume import TailoredResume
+
+# ResumeSchema responses (include parsed_text)
+RESUME_DETAIL = (undefer(Resume.parsed_text),)
+
+# Parsing/scoring/tailoring: the text plus its stored analysis
+RESUME_ANALYSIS = (undefer(Resume.parsed_text), undefer(Resume.parsed_document))
+
+# Job text for API payloads and text-based (legacy) scoring
+JOB_TEXT = (undefer(Job.description_text),)
+
+# Tailoring: job text (rescoring) plus its prompt digest
+JOB_PROMPT = (undefer(Job.description_text), undefer(Job.requirement_digest))
+
+# Full TailoredResume (original/tailored text, change summary, document)
+TAILORED_CONTENT = (undefer_group("content"),)
+
+# PDF rendering: tailored text and its section spans only
+TAILORED_RENDER = (undefer(TailoredResume.tailored_text), undefer(TailoredResume.tailored_document))
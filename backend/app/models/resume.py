@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, DateTime, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 import uuid
@@ -14,13 +14,19 @@ class Resume(Base):
     email = Column(String, nullable=True)
     phone = Column(String, nullable=True)
     profile_image_url = Column(String, nullable=True)
-    file_path = Column(String, nullable=False)
-    parsed_text = Column(Text, nullable=True)
+    file_path = Column(String, nullable=False) # blob storage key (legacy rows: local path)
+    content_hash = Column(String(64), nullable=True, index=True) # SHA-256 of the uploaded file
+    # Large columns are deferred (raise if not loaded); see app/models/load_profiles.py
+    parsed_text = deferred(Column(Text, nullable=True), raiseload=True)
     skills_extracted = Column(JSONB, nullable=True)
+    parsed_document = deferred(Column(JSONB, nullable=True), raiseload=True) # sections/contacts/skills with offsets (see services/parsing/document.py)
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
     status = Column(String, default="UPLOADED", nullable=False) # UPLOADED, PARSING, PARSED, FAILED
     error_reason = Column(Text, nullable=True)
+    scored_at = Column(DateTime(timezone=True), nullable=True) # last completed scoring run (even with no jobs); cleared on re-parse
+    batch_id = Column(UUID(as_uuid=True), ForeignKey("resume_batches.id"), nullable=True, index=True)
 
     ats_scores = relationship("ATSScore", back_populates="resume")
     skills = relationship("ResumeSkill", back_populates="resume", cascade="all, delete-orphan")
     tailored_resumes = relationship("TailoredResume", back_populates="resume")
+    batch = relationship("ResumeBatch", back_populates="resumes")
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+
+from app.db.base_class import Base
+
+
+class ResumeBatch(Base):
+    """One bulk intake (ZIP or multi-file upload); progress is derived from its resumes."""
+    __tablename__ = "resume_batches"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    total_files = Column(Integer, nullable=False, default=0)
+    duplicates = Column(JSONB, nullable=True)  # list[{filename, resume_id}] reused existing resumes
+    rejected = Column(JSONB, nullable=True)    # list[{filename, reason}]
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    resumes = relationship("Resume", back_populates="batch")
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, DateTime, Text, Float, ForeignKey, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 import uuid
@@ -13,9 +13,12 @@ class TailoredResume(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id"), nullable=False)
     job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=False)
-    original_text = Column(Text, nullable=False)
-    tailored_text = Column(Text, nullable=True)   # null while PENDING
-    change_summary = Column(JSONB, nullable=True)  # list[ResumeDiff]
+    # Content columns are deferred as one group (raise if not loaded);
+    # see app/models/load_profiles.py
+    original_text = deferred(Column(Text, nullable=False), group="content", raiseload=True)
+    tailored_text = deferred(Column(Text, nullable=True), group="content", raiseload=True)   # null while PENDING
+    change_summary = deferred(Column(JSONB, nullable=True), group="content", raiseload=True)  # list[ResumeDiff]
+    tailored_document = deferred(Column(JSONB, nullable=True), group="content", raiseload=True)  # {"sections": [...]} spans within tailored_text
     ats_score_before = Column(Float, nullable=True)
     ats_score_after = Column(Float, nullable=True)
     status = Column(String, default="PENDING", nullable=False)
@@ -30,6 +30,7 @@ class JobInDBBase(JobBase):
     created_at: datetime
     is_active: bool
     job_hash: str
+    canonical_job_id: Optional[UUID] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -19,6 +19,7 @@ class ResumeInDBBase(ResumeBase):
     phone: Optional[str] = None
     profile_image_url: Optional[str] = None
     file_path: str
+    content_hash: Optional[str] = None
     parsed_text: Optional[str] = None
     skills_extracted: Optional[Any] = None  # stored as list[str] by parser, dict by legacy code
     uploaded_at: datetime
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+from typing import List
+from uuid import UUID
+
+class TailorBatchRequest(BaseModel):
+    job_ids: List[UUID] = Field(..., min_length=1)
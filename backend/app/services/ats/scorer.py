@@ -1,5 +1,5 @@
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from app.services.skills.extraction import extract_skills, flatten_skills
 from app.services.scoring.ats_logic import extract_keywords  # Re-use Spacy noun extraction
 import re
@@ -42,21 +42,27 @@ def calculate_experience_score(job_text: str, resume_text: str) -> float:
     
     return 100.0 # Assume valid for junior roles
 
-def calculate_ats_score(job_text: str, resume_text: str) -> Dict[str, Any]:
+def calculate_ats_score(job_text: str, resume_text: str,
+                        resume_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Deterministic Weighted Scoring System.
     Weights:
     - Hard Skills (Languages, Frameworks, Tools): 60%
     - Keywords (Nouns/Context): 25%
     - Experience/semantic (Heuristic): 15%
+
+    resume_profile ({"skills", "keywords"}, see
+    app.services.parsing.document.resume_profile) skips re-analyzing the
+    resume text when it was already analyzed at parse time.
     """
     
     # 1. Skill Extraction
     job_skills_map = extract_skills(job_text)
-    resume_skills_map = extract_skills(resume_text)
-    
     job_flat = flatten_skills(job_skills_map)
-    resume_flat = flatten_skills(resume_skills_map)
+    if resume_profile is not None:
+        resume_flat = resume_profile["skills"]
+    else:
+        resume_flat = flatten_skills(extract_skills(resume_text))
     
     # Skill Match Score (60%)
     if not job_flat:
@@ -69,7 +75,7 @@ def calculate_ats_score(job_text: str, resume_text: str) -> Dict[str, Any]:
     # 2. Keyword Context Score (25%) - Using Spacy Nouns
     # Re-using existing logic but keeping it light
     job_kws = set(extract_keywords(job_text))
-    resume_kws = set(extract_keywords(resume_text))
+    resume_kws = resume_profile["keywords"] if resume_profile is not None else set(extract_keywords(resume_text))
     
     if not job_kws:
         kw_score = 0.0
@@ -0,0 +1,81 @@
+"""
+SimHash signatures + LSH banding for near-duplicate job detection.
+
+The same posting syndicated through several sources usually differs only in
+whitespace, punctuation or a few title words. A 64-bit SimHash over word
+shingles of the normalized description puts such copies within a small
+Hamming distance of each other.
+
+LSH banding: the signature is split into SIMHASH_BANDS bands of 16 bits.
+Two signatures within Hamming distance < SIMHASH_BANDS must agree exactly on
+at least one band (pigeonhole), so candidate lookup is an indexed equality
+match on (band, bucket) rather than a scan of every stored signature.
+"""
+
+import hashlib
+import re
+from typing import List, Optional, Tuple
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+SHINGLE_SIZE = 3
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def normalize_description(text: str) -> List[str]:
+    """Lowercase word tokens with punctuation and whitespace differences removed."""
+    return _WORD_RE.findall((text or "").lower())
+
+
+def _shingles(words: List[str]) -> List[str]:
+    if len(words) <= SHINGLE_SIZE:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    64-bit SimHash of the normalized text (unsigned).
+    Returns None when there is nothing to sign (empty description).
+    """
+    shingles = _shingles(normalize_description(text))
+    if not shingles:
+        return None
+
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        h = _hash64(shingle)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & ((1 << SIMHASH_BITS) - 1)).count("1")
+
+
+def lsh_bands(signature: int) -> List[Tuple[int, int]]:
+    """(band_index, bucket_value) pairs used as LSH bucket keys."""
+    mask = (1 << BAND_BITS) - 1
+    return [(band, (signature >> (band * BAND_BITS)) & mask) for band in range(SIMHASH_BANDS)]
+
+
+# Postgres BIGINT is signed; store signatures in two's complement.
+
+def to_signed64(signature: int) -> int:
+    return signature - (1 << SIMHASH_BITS) if signature >= 1 << (SIMHASH_BITS - 1) else signature
+
+
+def from_signed64(value: int) -> int:
+    return value + (1 << SIMHASH_BITS) if value < 0 else value
@@ -0,0 +1 @@
+from app.services.llm.client import close_openai_clients, get_async_openai_client, get_openai_client
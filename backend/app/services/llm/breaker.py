@@ -0,0 +1,114 @@
+"""
+Cluster-wide circuit breaker for the LLM provider.
+
+Every model call reports its outcome. A call fails if it raised, or if it
+took longer than LLM_BREAKER_SLOW_SECONDS. Outcomes are counted in Redis
+in 10-second buckets. When at least LLM_BREAKER_MIN_CALLS calls fell in
+the last LLM_BREAKER_WINDOW_SECONDS and LLM_BREAKER_FAILURE_RATE of them
+failed, the breaker opens for LLM_BREAKER_COOLDOWN_SECONDS. Tripping
+clears the window.
+
+While the breaker is open, calls raise LLMCircuitOpen before they queue
+for rate-limit capacity. Tailoring then goes straight to its rule-based
+fallback instead of waiting out timeouts and retries. When the cooldown
+expires, calls are let through again (half-open). If the provider is
+still unhealthy, the next full window trips the breaker again.
+
+If Redis is unreachable the breaker stays closed and calls proceed.
+"""
+
+import time
+from typing import Any, Dict
+
+from app.core.config import settings
+
+_OPEN_KEY = "llm:breaker:open"
+_BUCKET_KEY = "llm:breaker:bucket:{bucket}"
+_STATS_KEY = "llm:breaker:stats"
+_BUCKET_SECONDS = 10
+
+# KEYS[1] open flag, KEYS[2] current bucket, KEYS[3..] rest of the window.
+# ARGV: failed (0/1), min calls, failure rate, cooldown, bucket ttl.
+# Returns 1 if this outcome tripped the breaker.
+_RECORD_LUA = """
+redis.call('HINCRBY', KEYS[2], 'calls', 1)
+redis.call('HINCRBY', KEYS[2], 'failures', tonumber(ARGV[1]))
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+local calls, failures = 0, 0
+for i = 2, #KEYS do
+  local b = redis.call('HMGET', KEYS[i], 'calls', 'failures')
+  calls = calls + (tonumber(b[1]) or 0)
+  failures = failures + (tonumber(b[2]) or 0)
+end
+if calls >= tonumber(ARGV[2]) and failures >= calls * tonumber(ARGV[3]) then
+  redis.call('SET', KEYS[1], 1, 'EX', ARGV[4])
+  for i = 2, #KEYS do redis.call('DEL', KEYS[i]) end
+  return 1
+end
+return 0
+"""
+
+
+class LLMCircuitOpen(Exception):
+    """The provider is failing or slow; skip the model call."""
+
+
+def _window_keys() -> list:
+    current = int(time.time()) // _BUCKET_SECONDS
+    buckets = max(1, settings.LLM_BREAKER_WINDOW_SECONDS // _BUCKET_SECONDS)
+    return [_BUCKET_KEY.format(bucket=current - i) for i in range(buckets)]
+
+
+async def check() -> None:
+    """Raise LLMCircuitOpen while the breaker is open."""
+    try:
+        from app.db.redis import get_async_redis
+        redis = get_async_redis()
+        is_open = await redis.exists(_OPEN_KEY)
+        if is_open:
+            await redis.hincrby(_STATS_KEY, "short_circuited", 1)
+    except Exception as e:
+        print(f"LLM breaker unavailable, proceeding: {e}")
+        return
+    if is_open:
+        raise LLMCircuitOpen("LLM provider circuit is open")
+
+
+async def record(failed: bool, latency: float) -> None:
+    """Report one model call's outcome (errors and slow calls count as failed)."""
+    failed = failed or latency > settings.LLM_BREAKER_SLOW_SECONDS
+    try:
+        from app.db.redis import get_async_redis
+        redis = get_async_redis()
+        keys = _window_keys()
+        tripped = await redis.eval(
+            _RECORD_LUA, 1 + len(keys), _OPEN_KEY, *keys,
+            int(failed), settings.LLM_BREAKER_MIN_CALLS, settings.LLM_BREAKER_FAILURE_RATE,
+            settings.LLM_BREAKER_COOLDOWN_SECONDS, settings.LLM_BREAKER_WINDOW_SECONDS + _BUCKET_SECONDS,
+        )
+        if int(tripped):
+            await redis.hincrby(_STATS_KEY, "trips", 1)
+            print(f"LLM breaker opened for {settings.LLM_BREAKER_COOLDOWN_SECONDS}s")
+    except Exception as e:
+        # Metrics must never fail a call
+        print(f"LLM breaker unavailable: {e}")
+
+
+async def breaker_stats() -> Dict[str, Any]:
+    """Current state, the window's failure counts, trips and short-circuited calls."""
+    from app.db.redis import get_async_redis
+    redis = get_async_redis()
+    calls = failures = 0
+    for key in _window_keys():
+        bucket = await redis.hgetall(key)
+        calls += int(bucket.get("calls", 0))
+        failures += int(bucket.get("failures", 0))
+    stats = {k: int(v) for k, v in (await redis.hgetall(_STATS_KEY)).items()}
+    return {
+        "open": bool(await redis.exists(_OPEN_KEY)),
+        "closes_in_seconds": max(0, await redis.ttl(_OPEN_KEY)),
+        "window_calls": calls,
+        "window_failures": failures,
+        "trips": stats.get("trips", 0),
+        "short_circuited": stats.get("short_circuited", 0),
+    }
@@ -0,0 +1,127 @@
+"""
+Content-addressed cache of LLM responses.
+
+Keys are the SHA-256 of (model, system prompt, user message, temperature,
+prompt version), so byte-identical requests (re-tailoring after a FAILED
+run, the same section against near-identical jobs) are answered without a
+model call. Callers derive prompt_version from their templates: editing a
+template changes every key, and entries written under the old version are
+never read again and age out via LLM_CACHE_TTL_SECONDS.
+
+Tiers: Redis (shared by all workers), then an optional on-disk directory
+(LLM_CACHE_DIR) that outlives Redis flushes. A disk hit is promoted back
+to Redis. Hits, misses and tokens saved are counted in Redis.
+
+Only responses the caller accepted are written (the tailoring engine
+stores a reply after it finished normally and parsed into an edit), so a
+truncated or failed answer is never replayed.
+
+Cache failures are never fatal: an unreachable tier is treated as a miss.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+import anyio
+
+from app.core.config import settings
+
+_KEY_PREFIX = "llm:cache"
+_STATS_KEY = "llm:cache:stats"
+
+
+def cache_key(model: str, system: str, user: str, temperature: float, prompt_version: str) -> str:
+    payload = json.dumps([model, system, user, temperature, prompt_version], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _disk_path(key: str) -> str:
+    return os.path.join(settings.LLM_CACHE_DIR, key[:2], f"{key}.json")
+
+
+def _read_disk(key: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_disk_path(key), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_disk(key: str, entry: Dict[str, Any]) -> None:
+    path = _disk_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.part"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    os.replace(tmp, path)
+
+
+async def _count(field: str, amount: int = 1) -> None:
+    try:
+        from app.db.redis import get_async_redis
+        await get_async_redis().hincrby(_STATS_KEY, field, amount)
+    except Exception as e:
+        print(f"LLM cache metrics unavailable: {e}")
+
+
+async def get_cached(key: str) -> Optional[Dict[str, Any]]:
+    """Cached entry {"content", "tokens"} or None; records the hit/miss."""
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+
+    entry = None
+    try:
+        from app.db.redis import get_async_redis
+        raw = await get_async_redis().get(f"{_KEY_PREFIX}:{key}")
+        entry = json.loads(raw) if raw else None
+    except Exception as e:
+        print(f"LLM cache (redis) unavailable: {e}")
+
+    if entry is None and settings.LLM_CACHE_DIR:
+        entry = await anyio.to_thread.run_sync(_read_disk, key)
+        if entry is not None:
+            await _store_redis(key, entry)
+
+    if entry is None:
+        await _count("misses")
+        return None
+    await _count("hits")
+    await _count("tokens_saved", int(entry.get("tokens") or 0))
+    return entry
+
+
+async def _store_redis(key: str, entry: Dict[str, Any]) -> None:
+    try:
+        from app.db.redis import get_async_redis
+        await get_async_redis().set(
+            f"{_KEY_PREFIX}:{key}", json.dumps(entry), ex=settings.LLM_CACHE_TTL_SECONDS
+        )
+    except Exception as e:
+        print(f"LLM cache (redis) unavailable: {e}")
+
+
+async def set_cached(key: str, content: str, tokens: int = 0) -> None:
+    if not settings.LLM_CACHE_ENABLED:
+        return
+    entry = {"content": content, "tokens": tokens}
+    await _store_redis(key, entry)
+    if settings.LLM_CACHE_DIR:
+        try:
+            await anyio.to_thread.run_sync(_write_disk, key, entry)
+        except OSError as e:
+            print(f"LLM cache (disk) unavailable: {e}")
+
+
+async def cache_stats() -> Dict[str, Any]:
+    """Hit ratio and tokens saved across workers."""
+    from app.db.redis import get_async_redis
+    stats = {k: int(v) for k, v in (await get_async_redis().hgetall(_STATS_KEY)).items()}
+    hits, misses = stats.get("hits", 0), stats.get("misses", 0)
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        "tokens_saved": stats.get("tokens_saved", 0),
+    }
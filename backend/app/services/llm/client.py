@@ -0,0 +1,80 @@
+"""
+Process-wide OpenAI clients.
+
+One sync client per process and one async client per event loop (httpx
+async pools are loop-bound), each over a keep-alive connection pool with
+explicit connect/read timeouts. Retries on 429/5xx/timeouts are the SDK's
+own (exponential backoff with jitter, honouring Retry-After), bounded by
+OPENAI_MAX_RETRIES. OPENAI_BASE_URL points every call at a stand-in server
+when set.
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+from app.core.config import settings
+
+_sync_client: Optional[OpenAI] = None
+_async_clients: Dict[int, AsyncOpenAI] = {}
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        settings.OPENAI_READ_TIMEOUT_SECONDS,
+        connect=settings.OPENAI_CONNECT_TIMEOUT_SECONDS,
+    )
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+        keepalive_expiry=60.0,
+    )
+
+
+def _client_kwargs() -> dict:
+    return {
+        # Stand-in servers accept any key
+        "api_key": settings.OPENAI_API_KEY or "unused",
+        "base_url": settings.OPENAI_BASE_URL,
+        "timeout": _timeout(),
+        "max_retries": settings.OPENAI_MAX_RETRIES,
+    }
+
+
+def get_openai_client() -> OpenAI:
+    """Shared sync client (thread-safe)."""
+    global _sync_client
+    if _sync_client is None or _sync_client.is_closed():
+        _sync_client = OpenAI(
+            http_client=httpx.Client(limits=_limits(), timeout=_timeout()),
+            **_client_kwargs(),
+        )
+    return _sync_client
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """Shared async client for the running event loop."""
+    key = id(asyncio.get_running_loop())
+    client = _async_clients.get(key)
+    if client is None or client.is_closed():
+        client = AsyncOpenAI(
+            http_client=httpx.AsyncClient(limits=_limits(), timeout=_timeout()),
+            **_client_kwargs(),
+        )
+        _async_clients[key] = client
+    return client
+
+
+async def close_openai_clients() -> None:
+    global _sync_client
+    for key, client in list(_async_clients.items()):
+        await client.close()
+        del _async_clients[key]
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
@@ -0,0 +1,197 @@
+"""
+Cluster-wide LLM admission control.
+
+A Redis token bucket pair shared by every worker tracks requests/minute
+(LLM_RPM_LIMIT) and estimated tokens/minute (LLM_TPM_LIMIT); both refill
+continuously. Each model call acquires one request and its estimated
+tokens before it is sent, and waits (queues) while the buckets are short.
+
+Two lanes:
+  interactive  single-resume tailoring; may drain the buckets completely
+  bulk         batch tailoring; admitted only while LLM_INTERACTIVE_RESERVE
+               of both buckets would remain, so a bulk burst cannot starve
+               interactive requests
+
+The lane comes from a context variable (use_lane), so callers deep in the
+engine need no extra arguments. Token cost is estimated from the prompt
+size (~4 characters per token) plus the completion budget; the unused part
+of the estimate is refunded once the real usage is known.
+
+Admissions, throttles, timeouts and queue-wait samples are recorded per
+lane. The scheduler fails open: if Redis is unreachable calls proceed.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import random
+import time
+from typing import Any, Dict, Iterator
+
+from app.core.config import settings
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+_lane: contextvars.ContextVar[str] = contextvars.ContextVar("llm_lane", default=INTERACTIVE)
+
+_BUCKET_KEY = "llm:scheduler:bucket"
+_STATS_KEY = "llm:scheduler:stats"
+_WAIT_KEY = "llm:scheduler:wait_ms:{lane}"
+_WAIT_SAMPLES = 5000
+
+# Refill, then take 1 request + ARGV[3] tokens if at least ARGV[4] (reserve
+# fraction) of each bucket would be left. Returns "0" when admitted, else
+# the seconds until enough would have refilled (as a string: Lua numbers
+# are truncated to integers on the way out).
+_ACQUIRE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local rpm, tpm = tonumber(ARGV[1]), tonumber(ARGV[2])
+local cost, reserve = tonumber(ARGV[3]), tonumber(ARGV[4])
+local b = redis.call('HMGET', KEYS[1], 'req', 'tok', 'ts')
+local req = tonumber(b[1]) or rpm
+local tok = tonumber(b[2]) or tpm
+local elapsed = math.max(0, now - (tonumber(b[3]) or now))
+req = math.min(rpm, req + elapsed * rpm / 60)
+tok = math.min(tpm, tok + elapsed * tpm / 60)
+-- An oversized request must still fit in the lane's share eventually
+cost = math.min(cost, tpm * (1 - reserve))
+local need_req, need_tok = 1 + reserve * rpm, cost + reserve * tpm
+local wait = 0
+if req >= need_req and tok >= need_tok then
+  req = req - 1
+  tok = tok - cost
+else
+  wait = math.max((need_req - req) * 60 / rpm, (need_tok - tok) * 60 / tpm)
+end
+redis.call('HSET', KEYS[1], 'req', req, 'tok', tok, 'ts', now)
+redis.call('EXPIRE', KEYS[1], 120)
+return tostring(wait)
+"""
+
+_REFUND_LUA = """
+local tok = tonumber(redis.call('HGET', KEYS[1], 'tok'))
+if tok then
+  redis.call('HSET', KEYS[1], 'tok', math.min(tonumber(ARGV[2]), tok + tonumber(ARGV[1])))
+end
+return 1
+"""
+
+
+class LLMSchedulerTimeout(Exception):
+    """No capacity within LLM_SCHEDULER_MAX_WAIT_SECONDS."""
+
+
+def current_lane() -> str:
+    return _lane.get()
+
+
+@contextlib.contextmanager
+def use_lane(lane: str) -> Iterator[None]:
+    """Run the enclosed LLM calls (including spawned tasks) in `lane`."""
+    token = _lane.set(lane)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+def estimate_tokens(system: str, user: str, max_tokens: int) -> int:
+    """Prompt tokens (~4 chars per token) plus the completion budget."""
+    return (len(system) + len(user)) // 4 + max_tokens
+
+
+async def acquire(estimated_tokens: int) -> float:
+    """
+    Wait until the current lane may send a request costing
+    `estimated_tokens`; returns the seconds spent queued.
+    """
+    from app.db.redis import get_async_redis
+
+    lane = current_lane()
+    reserve = settings.LLM_INTERACTIVE_RESERVE if lane == BULK else 0.0
+    started = time.monotonic()
+    throttled = False
+    try:
+        redis = get_async_redis()
+        while True:
+            wait = float(await redis.eval(
+                _ACQUIRE_LUA, 1, _BUCKET_KEY,
+                settings.LLM_RPM_LIMIT, settings.LLM_TPM_LIMIT, estimated_tokens, reserve,
+            ))
+            if wait <= 0:
+                break
+            if not throttled:
+                throttled = True
+                await _record(lane, "throttled")
+            if time.monotonic() - started + wait > settings.LLM_SCHEDULER_MAX_WAIT_SECONDS:
+                await _record(lane, "timeouts")
+                raise LLMSchedulerTimeout(f"No LLM capacity for the {lane} lane")
+            # Jitter spreads waiting workers so they do not retry in lockstep
+            await asyncio.sleep(wait * random.uniform(1.0, 1.2))
+    except LLMSchedulerTimeout:
+        raise
+    except Exception as e:
+        print(f"LLM scheduler unavailable, proceeding: {e}")
+        return 0.0
+
+    waited = time.monotonic() - started
+    await _record(lane, "admitted", waited)
+    return waited
+
+
+async def settle(estimated_tokens: int, actual_tokens: int) -> None:
+    """
+    Return the unused part of an estimate to the token bucket (all of it
+    when actual_tokens is 0: the call failed or was cancelled).
+    """
+    unused = estimated_tokens - actual_tokens
+    if actual_tokens < 0 or unused <= 0:
+        return
+    try:
+        from app.db.redis import get_async_redis
+        await get_async_redis().eval(_REFUND_LUA, 1, _BUCKET_KEY, unused, settings.LLM_TPM_LIMIT)
+    except Exception as e:
+        print(f"LLM scheduler unavailable: {e}")
+
+
+async def _record(lane: str, outcome: str, waited: float = 0.0) -> None:
+    try:
+        from app.db.redis import get_async_redis
+        pipe = get_async_redis().pipeline()
+        pipe.hincrby(_STATS_KEY, f"{lane}:{outcome}", 1)
+        if outcome == "admitted":
+            key = _WAIT_KEY.format(lane=lane)
+            pipe.lpush(key, round(waited * 1000, 1))
+            pipe.ltrim(key, 0, _WAIT_SAMPLES - 1)
+        await pipe.execute()
+    except Exception as e:
+        # Metrics must never fail a call
+        print(f"LLM scheduler metrics unavailable: {e}")
+
+
+def _percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+async def scheduler_stats() -> Dict[str, Any]:
+    """Per-lane admissions, throttles, timeouts and queue-wait percentiles."""
+    from app.db.redis import get_async_redis
+    redis = get_async_redis()
+    counts = {k: int(v) for k, v in (await redis.hgetall(_STATS_KEY)).items()}
+    lanes = {}
+    for lane in (INTERACTIVE, BULK):
+        waits = sorted(float(v) for v in await redis.lrange(_WAIT_KEY.format(lane=lane), 0, -1))
+        lanes[lane] = {
+            "admitted": counts.get(f"{lane}:admitted", 0),
+            "throttled": counts.get(f"{lane}:throttled", 0),
+            "timeouts": counts.get(f"{lane}:timeouts", 0),
+            "wait_p50_ms": _percentile(waits, 50),
+            "wait_p95_ms": _percentile(waits, 95),
+            "wait_max_ms": waits[-1] if waits else 0.0,
+        }
+    return {"rpm_limit": settings.LLM_RPM_LIMIT, "tpm_limit": settings.LLM_TPM_LIMIT, "lanes": lanes}
@@ -0,0 +1,88 @@
+"""
+Per-call LLM usage metadata: prompt, cached-prompt and completion tokens
+and latency, aggregated in Redis per prompt version so template layouts
+can be compared (e.g. how much of each prompt the provider served from
+its prefix cache).
+
+cached_tokens comes from usage.prompt_tokens_details when the provider
+reports it (OpenAI does for prompts of 1024+ tokens); it is 0 otherwise.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from app.services.llm.scheduler import _percentile
+
+_STATS_KEY = "llm:usage:stats"
+_LATENCY_KEY = "llm:usage:latency_ms:{version}"
+_VERSIONS_KEY = "llm:usage:versions"
+_LATENCY_SAMPLES = 5000
+
+
+def usage_counts(usage: Any) -> Tuple[int, int, int]:
+    """
+    (prompt, cached prompt, completion) tokens from a response's usage,
+    whether the SDK parsed it into an object or kept it as a plain dict
+    (streamed chunks, fields newer than the SDK).
+    """
+    def field(obj: Any, name: str) -> Any:
+        return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+    if usage is None:
+        return 0, 0, 0
+    details = field(usage, "prompt_tokens_details")
+    cached = field(details, "cached_tokens") if details is not None else 0
+    return (
+        int(field(usage, "prompt_tokens") or 0),
+        int(cached or 0),
+        int(field(usage, "completion_tokens") or 0),
+    )
+
+
+async def record_usage(
+    prompt_version: str,
+    latency: float,
+    prompt_tokens: int = 0,
+    cached: int = 0,
+    completion_tokens: int = 0,
+) -> None:
+    try:
+        from app.db.redis import get_async_redis
+        pipe = get_async_redis().pipeline()
+        pipe.sadd(_VERSIONS_KEY, prompt_version)
+        pipe.hincrby(_STATS_KEY, f"{prompt_version}:calls", 1)
+        pipe.hincrby(_STATS_KEY, f"{prompt_version}:prompt_tokens", prompt_tokens)
+        pipe.hincrby(_STATS_KEY, f"{prompt_version}:cached_tokens", cached)
+        pipe.hincrby(_STATS_KEY, f"{prompt_version}:completion_tokens", completion_tokens)
+        key = _LATENCY_KEY.format(version=prompt_version)
+        pipe.lpush(key, round(latency * 1000, 1))
+        pipe.ltrim(key, 0, _LATENCY_SAMPLES - 1)
+        await pipe.execute()
+    except Exception as e:
+        # Metrics must never fail a call
+        print(f"LLM usage metrics unavailable: {e}")
+
+
+async def usage_stats(prompt_version: Optional[str] = None) -> Dict[str, Any]:
+    """Token totals, cached share and latency percentiles per prompt version."""
+    from app.db.redis import get_async_redis
+    redis = get_async_redis()
+    counts = {k: int(v) for k, v in (await redis.hgetall(_STATS_KEY)).items()}
+    versions = [prompt_version] if prompt_version else sorted(await redis.smembers(_VERSIONS_KEY))
+
+    report = {}
+    for version in versions:
+        prompt_tokens = counts.get(f"{version}:prompt_tokens", 0)
+        cached = counts.get(f"{version}:cached_tokens", 0)
+        latencies = sorted(
+            float(v) for v in await redis.lrange(_LATENCY_KEY.format(version=version), 0, -1)
+        )
+        report[version] = {
+            "calls": counts.get(f"{version}:calls", 0),
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached,
+            "cached_ratio": round(cached / prompt_tokens, 4) if prompt_tokens else 0.0,
+            "completion_tokens": counts.get(f"{version}:completion_tokens", 0),
+            "latency_p50_ms": _percentile(latencies, 50),
+            "latency_p95_ms": _percentile(latencies, 95),
+        }
+    return report
@@ -0,0 +1,105 @@
+"""
+Structured resume document, built once at parse time and stored in
+Resume.parsed_document (JSONB) so scoring, tailoring and PDF generation
+read it instead of re-analyzing parsed_text:
+
+    {
+      "version": 1,
+      "taxonomy_version": "<skills taxonomy hash>",
+      "length": <len(parsed_text)>,
+      "sections": [{"key", "name", "start", "heading_end", "end"}],
+      "contacts": {"email"|"phone"|"name": {"value", "start", "end"}},
+      "skills": [{"skill", "category", "spans"}],      # SKILL_DB hits
+      "skill_keywords": [{"skill", "spans"}],          # SKILL_KEYWORDS hits
+      "keywords": [...]                                # spaCy nouns/entities
+    }
+
+All offsets index parsed_text. A document is only trusted if it was built
+for the same text length and taxonomy version (see is_current).
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from app.services.skills.extraction import TAXONOMY_VERSION, find_keyword_hits, find_skill_hits
+from app.services.parsing.sections import find_section_spans, sections_from_spans
+
+DOCUMENT_VERSION = 1
+
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_RE = re.compile(r'(\+\d{1,3}[-.]?)?\(?\d{3}\)?[-.]?\d{3}[-.]?\d{4}')
+
+
+def _field(match_value: str, start: int) -> Dict[str, Any]:
+    return {"value": match_value, "start": start, "end": start + len(match_value)}
+
+
+def extract_contacts(text: str) -> Dict[str, Dict[str, Any]]:
+    contacts: Dict[str, Dict[str, Any]] = {}
+
+    email_match = EMAIL_RE.search(text)
+    if email_match:
+        contacts["email"] = _field(email_match.group(0), email_match.start())
+
+    phone_match = PHONE_RE.search(text)
+    if phone_match:
+        contacts["phone"] = _field(phone_match.group(0), phone_match.start())
+
+    # Name: first non-empty line, if it is short enough to be one
+    for m in re.finditer(r'[^\n]+', text):
+        line = m.group(0).strip()
+        if line:
+            if len(line) < 50:
+                contacts["name"] = _field(line, m.start() + m.group(0).index(line))
+            break
+
+    return contacts
+
+
+def build_parsed_document(text: str) -> Dict[str, Any]:
+    from app.services.scoring.ats_logic import extract_keywords  # loads spaCy
+
+    return {
+        "version": DOCUMENT_VERSION,
+        "taxonomy_version": TAXONOMY_VERSION,
+        "length": len(text),
+        "sections": find_section_spans(text),
+        "contacts": extract_contacts(text),
+        "skills": find_skill_hits(text),
+        "skill_keywords": find_keyword_hits(text),
+        "keywords": sorted(extract_keywords(text)),
+    }
+
+
+def is_current(document: Optional[Dict[str, Any]], text: Optional[str]) -> bool:
+    return bool(
+        document
+        and text is not None
+        and document.get("version") == DOCUMENT_VERSION
+        and document.get("taxonomy_version") == TAXONOMY_VERSION
+        and document.get("length") == len(text)
+    )
+
+
+def document_sections(document: Optional[Dict[str, Any]], text: str) -> Optional[Dict[str, str]]:
+    """Section texts from a stored document, or None if it does not describe `text`."""
+    if not is_current(document, text):
+        return None
+    return sections_from_spans(text, document["sections"])
+
+
+def resume_profile(document: Optional[Dict[str, Any]], text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Precomputed resume side of calculate_ats_score (skill set and spaCy
+    keywords), or None if the stored document is missing or stale.
+    """
+    if not is_current(document, text):
+        return None
+    return {
+        "skills": {hit["skill"] for hit in document["skills"]},
+        "keywords": set(document["keywords"]),
+    }
+
+
+def skill_keyword_names(document: Dict[str, Any]) -> List[str]:
+    return [hit["skill"] for hit in document["skill_keywords"]]
@@ -0,0 +1,410 @@
+"""
+PDF text extraction engine, run in dedicated worker processes.
+
+pdfminer is pure Python and CPU-bound; a pathological or malformed PDF can
+run for minutes. Extraction therefore runs out of the event loop in
+PDF_EXTRACTION_WORKERS worker processes with hard limits:
+
+  - PDF_MAX_BYTES                    size cap, checked before any parsing
+  - PDF_MAX_PAGES                    page cap, checked by a cheap page walk
+  - PDF_EXTRACTION_TIMEOUT_SECONDS   wall-clock cap per step (probe or page
+                                     range), counted from when a worker
+                                     picks the step up; on expiry only that
+                                     worker's process is killed and replaced
+
+Each worker process is owned by one dispatch thread. Steps queue for a
+free thread, so time spent waiting behind other documents does not count
+toward the timeout, and killing an overrunning worker leaves extractions
+running in the other workers untouched.
+
+Pipeline per document:
+  1. probe   — walk the page tree (no layout analysis) to count pages and
+               look for font resources, including those of Form XObjects
+               drawn on the page; a document without any text layer
+               (scanned images) fails fast with PDFNoTextLayerError, as
+               does one whose extraction comes back empty
+  2. extract — larger documents are split into contiguous page ranges that
+               are extracted in parallel across the workers, then merged in
+               page order
+  3. profile — "accurate" runs pdfminer's layout analysis (text boxes and
+               their reading order); "fast" skips it and writes characters
+               in content-stream order, breaking lines where the baseline
+               moves and adding spaces across horizontal gaps. Resumes are
+               mostly single-flow text, for which this gives the same words
+               (and skills) at roughly two thirds of the CPU time; compare
+               both on real uploads with scripts/bench_pdf_extraction.py
+               before switching PDF_EXTRACTION_PROFILE
+
+Failures raise a PDFExtractionError subclass whose `reason` code is
+suitable for Resume.error_reason. Latency and outcome of every extraction
+are recorded in Redis (see extraction_stats()).
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+
+# Directory holding the `app` package, importable by worker processes
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class PDFExtractionError(Exception):
+    reason = "extraction_failed"
+
+    def __str__(self) -> str:
+        detail = super().__str__()
+        return f"{self.reason}: {detail}" if detail else self.reason
+
+
+class PDFTooLargeError(PDFExtractionError):
+    reason = "file_too_large"
+
+
+class PDFTooManyPagesError(PDFExtractionError):
+    reason = "too_many_pages"
+
+
+class PDFTimeoutError(PDFExtractionError):
+    reason = "timeout"
+
+
+class PDFMalformedError(PDFExtractionError):
+    reason = "malformed_pdf"
+
+
+class PDFNoTextLayerError(PDFExtractionError):
+    reason = "no_text_layer"
+
+
+PROFILES = ("accurate", "fast")
+
+
+# ---------------------------------------------------------------------------
+# Child-process side
+# ---------------------------------------------------------------------------
+
+def _has_fonts(resources: Any, seen: set) -> bool:
+    """Font resources here or in any Form XObject drawn from here."""
+    from pdfminer.pdftypes import resolve1
+
+    resources = resolve1(resources)
+    if not isinstance(resources, dict) or id(resources) in seen:
+        return False
+    seen.add(id(resources))
+    if resolve1(resources.get("Font")):
+        return True
+    xobjects = resolve1(resources.get("XObject"))
+    for xobject in (xobjects.values() if isinstance(xobjects, dict) else ()):
+        xobject = resolve1(xobject)
+        attrs = getattr(xobject, "attrs", None) or {}
+        subtype = resolve1(attrs.get("Subtype"))
+        if getattr(subtype, "name", None) == "Form" and _has_fonts(attrs.get("Resources"), seen):
+            return True
+    return False
+
+
+def _probe_in_process(path: str, max_pages: int) -> int:
+    """Count pages (up to max_pages + 1) and confirm a text layer exists."""
+    from pdfminer.pdfpage import PDFPage
+
+    pages = 0
+    has_fonts = False
+    with open(path, "rb") as fp:
+        for page in PDFPage.get_pages(fp, maxpages=max_pages + 1):
+            pages += 1
+            if not has_fonts:
+                has_fonts = _has_fonts(page.resources, set())
+
+    if pages > max_pages:
+        raise PDFTooManyPagesError(f"more than {max_pages} pages")
+    if not has_fonts:
+        raise PDFNoTextLayerError("no fonts on any page (scanned document?)")
+    return pages
+
+
+def _extract_stream_order(path: str, page_numbers: List[int]) -> str:
+    """The "fast" profile: characters in drawing order, no layout analysis."""
+    from io import StringIO
+
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LTChar, LTContainer
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    class StreamOrderConverter(TextConverter):
+        def receive_layout(self, ltpage) -> None:
+            last = None
+
+            def render(item) -> None:
+                nonlocal last
+                if isinstance(item, LTContainer):
+                    for child in item:
+                        render(child)
+                elif isinstance(item, LTChar):
+                    if last is not None:
+                        size = min(item.size, last.size)
+                        if abs(item.y0 - last.y0) > size / 2:
+                            self.write_text("\n")
+                        elif (item.x0 - last.x1 > size / 4 or item.x1 < last.x0) \
+                                and not last.get_text().isspace() and not item.get_text().isspace():
+                            # A gap, or a jump back left (another column)
+                            self.write_text(" ")
+                    self.write_text(item.get_text())
+                    last = item
+
+            render(ltpage)
+            self.write_text("\n\f")
+
+    output = StringIO()
+    rsrcmgr = PDFResourceManager(caching=True)
+    interpreter = PDFPageInterpreter(rsrcmgr, StreamOrderConverter(rsrcmgr, output, laparams=None))
+    with open(path, "rb") as fp:
+        for page in PDFPage.get_pages(fp, page_numbers):
+            interpreter.process_page(page)
+    return output.getvalue()
+
+
+def _extract_pages_in_process(path: str, page_numbers: List[int], profile: str) -> str:
+    if profile == "fast":
+        return _extract_stream_order(path, page_numbers)
+
+    from pdfminer.high_level import extract_text
+
+    # pdfminer's default LAParams
+    return extract_text(path, page_numbers=page_numbers)
+
+
+def _worker_main(read_fd: int, write_fd: int) -> None:
+    """Worker process loop: run (function, args) jobs sent over the pipes."""
+    from multiprocessing.connection import Connection
+
+    jobs = Connection(read_fd, writable=False)
+    results = Connection(write_fd, readable=False)
+    while True:
+        try:
+            fn, args = jobs.recv()
+        except EOFError:
+            return
+        try:
+            result = ("ok", fn(*args))
+        except Exception as e:
+            result = ("error", e)
+        try:
+            results.send(result)
+        except Exception:
+            # Unpicklable exception from pdfminer
+            results.send(("error", PDFMalformedError(str(result[1]))))
+
+
+def _page_chunks(pages: int, workers: int) -> List[List[int]]:
+    """Contiguous page ranges, one per worker; small documents stay whole."""
+    if pages < settings.PDF_PARALLEL_MIN_PAGES or workers <= 1:
+        return [list(range(pages))]
+    size = -(-pages // workers)
+    return [list(range(i, min(i + size, pages))) for i in range(0, pages, size)]
+
+
+# ---------------------------------------------------------------------------
+# Worker management
+# ---------------------------------------------------------------------------
+
+class _Worker:
+    """
+    One extraction process and its pipes.
+
+    Started as a plain subprocess rather than a multiprocessing.Process:
+    Celery's prefork pool runs tasks in daemonic processes, which
+    multiprocessing does not allow to have children.
+    """
+
+    _BOOTSTRAP = (
+        "import sys; from app.services.parsing.pdf_extraction import _worker_main; "
+        "_worker_main(int(sys.argv[1]), int(sys.argv[2]))"
+    )
+
+    def __init__(self):
+        from multiprocessing.connection import Connection
+
+        job_read, job_write = os.pipe()
+        result_read, result_write = os.pipe()
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [_APP_ROOT, env.get("PYTHONPATH")]))
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, "-c", self._BOOTSTRAP, str(job_read), str(result_write)],
+                pass_fds=(job_read, result_write), stdin=subprocess.DEVNULL, env=env,
+            )
+        except BaseException:
+            for fd in (job_read, job_write, result_read, result_write):
+                os.close(fd)
+            raise
+        # The child holds its own copies; with ours closed, EOF on either
+        # side means the other end is gone
+        os.close(job_read)
+        os.close(result_write)
+        self.jobs = Connection(job_write, readable=False)
+        self.results = Connection(result_read, writable=False)
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.wait()
+        self.jobs.close()
+        self.results.close()
+
+
+_dispatch: Optional[ThreadPoolExecutor] = None
+_dispatch_lock = threading.Lock()
+_local = threading.local()
+
+
+def _get_dispatch() -> ThreadPoolExecutor:
+    global _dispatch
+    with _dispatch_lock:
+        if _dispatch is None:
+            _dispatch = ThreadPoolExecutor(
+                max_workers=settings.PDF_EXTRACTION_WORKERS, thread_name_prefix="pdf-extraction",
+            )
+        return _dispatch
+
+
+def _run_in_worker(fn: Callable, args: tuple, timeout: float) -> Any:
+    """
+    Run fn(*args) in this dispatch thread's worker process (spawned on
+    first use) with a deadline from now. A worker that overruns or dies is
+    killed and replaced on the thread's next step.
+    """
+    worker = getattr(_local, "worker", None)
+    if worker is None or not worker.is_alive():
+        try:
+            worker = _local.worker = _Worker()
+        except OSError as e:
+            raise PDFExtractionError(f"could not start extraction process: {e}") from e
+    try:
+        worker.jobs.send((fn, args))
+        if not worker.results.poll(timeout):
+            raise PDFTimeoutError(f"exceeded {timeout}s")
+        status, value = worker.results.recv()
+    except PDFTimeoutError:
+        _local.worker = None
+        worker.kill()
+        raise
+    except (EOFError, OSError):
+        _local.worker = None
+        worker.kill()
+        raise PDFExtractionError("extraction process crashed")
+    if status == "error":
+        if isinstance(value, PDFExtractionError):
+            raise value
+        # pdfminer gave up on the document itself
+        raise PDFMalformedError(str(value)) from value
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+_LATENCY_KEY = "pdf_extraction:latency_ms"
+_OUTCOME_KEY = "pdf_extraction:outcomes"
+_LATENCY_SAMPLES = 10000
+
+
+async def _record(latency_ms: float, outcome: str) -> None:
+    try:
+        from app.db.redis import get_async_redis
+        pipe = get_async_redis().pipeline()
+        pipe.lpush(_LATENCY_KEY, round(latency_ms, 1))
+        pipe.ltrim(_LATENCY_KEY, 0, _LATENCY_SAMPLES - 1)
+        pipe.hincrby(_OUTCOME_KEY, outcome, 1)
+        await pipe.execute()
+    except Exception as e:
+        # Metrics must never fail a parse
+        print(f"PDF extraction metrics unavailable: {e}")
+    print(f"PDF extraction: {outcome} in {latency_ms:.0f}ms")
+
+
+def _percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+async def extraction_stats() -> Dict[str, Any]:
+    """Latency percentiles (recent samples) and outcome counts across workers."""
+    from app.db.redis import get_async_redis
+    redis = get_async_redis()
+    latencies = sorted(float(v) for v in await redis.lrange(_LATENCY_KEY, 0, -1))
+    outcomes = {k: int(v) for k, v in (await redis.hgetall(_OUTCOME_KEY)).items()}
+    total = sum(outcomes.values())
+    return {
+        "samples": len(latencies),
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "p99_ms": _percentile(latencies, 99),
+        "outcomes": outcomes,
+        "timeout_rate": round(outcomes.get(PDFTimeoutError.reason, 0) / total, 4) if total else 0.0,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+async def extract_pdf_text(path: str, profile: Optional[str] = None) -> str:
+    """
+    Extract text from the PDF at `path` in the extraction pool, enforcing
+    size, page and time limits. Raises PDFExtractionError subclasses.
+    `profile` defaults to PDF_EXTRACTION_PROFILE ("accurate" or "fast").
+    """
+    profile = profile or settings.PDF_EXTRACTION_PROFILE
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown PDF extraction profile: {profile}")
+
+    started = time.perf_counter()
+    elapsed_ms = lambda: (time.perf_counter() - started) * 1000
+    timeout = settings.PDF_EXTRACTION_TIMEOUT_SECONDS
+
+    size = os.path.getsize(path)
+    if size > settings.PDF_MAX_BYTES:
+        await _record(elapsed_ms(), PDFTooLargeError.reason)
+        raise PDFTooLargeError(f"{size} bytes exceeds {settings.PDF_MAX_BYTES}")
+
+    loop = asyncio.get_running_loop()
+    dispatch = _get_dispatch()
+
+    def step(fn: Callable, *args):
+        return loop.run_in_executor(dispatch, _run_in_worker, fn, args, timeout)
+
+    try:
+        pages = await step(_probe_in_process, path, settings.PDF_MAX_PAGES)
+        chunks = _page_chunks(pages, settings.PDF_EXTRACTION_WORKERS)
+        parts = await asyncio.gather(*[
+            step(_extract_pages_in_process, path, chunk, profile) for chunk in chunks
+        ])
+        # pdfminer ends every page with a form feed, so parts concatenate cleanly
+        text = "".join(parts)
+        if not text.strip():
+            # Fonts declared but nothing drawn with them
+            raise PDFNoTextLayerError("no extractable text")
+    except PDFExtractionError as e:
+        await _record(elapsed_ms(), e.reason)
+        raise
+    except Exception as e:
+        # Not the document's fault (dispatch or pipe trouble): failures
+        # inside the worker already arrive as PDFMalformedError
+        await _record(elapsed_ms(), PDFExtractionError.reason)
+        raise PDFExtractionError(str(e)) from e
+
+    await _record(elapsed_ms(), "ok")
+    return text
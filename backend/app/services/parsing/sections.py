@@ -0,0 +1,95 @@
+"""
+Resume section detection.
+
+Sections start at a line holding one of the known headings
+(SECTION_HEADERS); spans are offsets into the text so a parsed document
+can store them once and every consumer (scoring, tailoring, PDF
+generation) slices the same boundaries.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+SECTION_HEADERS = {
+    "SUMMARY": re.compile(
+        r"^(SUMMARY|PROFESSIONAL SUMMARY|OBJECTIVE|PROFILE|ABOUT ME)\s*$",
+        re.IGNORECASE | re.MULTILINE,
+    ),
+    "EXPERIENCE": re.compile(
+        r"^(EXPERIENCE|WORK EXPERIENCE|PROFESSIONAL EXPERIENCE|EMPLOYMENT HISTORY|WORK HISTORY)\s*$",
+        re.IGNORECASE | re.MULTILINE,
+    ),
+    "SKILLS": re.compile(
+        r"^(SKILLS|TECHNICAL SKILLS|CORE COMPETENCIES|KEY SKILLS|TECHNOLOGIES|TECH STACK)\s*$",
+        re.IGNORECASE | re.MULTILINE,
+    ),
+    "EDUCATION": re.compile(
+        r"^(EDUCATION|ACADEMIC BACKGROUND|QUALIFICATIONS)\s*$",
+        re.IGNORECASE | re.MULTILINE,
+    ),
+    "PROJECTS": re.compile(
+        r"^(PROJECTS|PERSONAL PROJECTS|KEY PROJECTS|NOTABLE PROJECTS)\s*$",
+        re.IGNORECASE | re.MULTILINE,
+    ),
+    "CERTIFICATIONS": re.compile(
+        r"^(CERTIFICATIONS|CERTIFICATES|LICENSES)\s*$",
+        re.IGNORECASE | re.MULTILINE,
+    ),
+}
+
+
+def find_section_spans(text: str) -> List[Dict[str, Any]]:
+    """
+    Section boundaries as offsets into text:
+    [{"key", "name", "start", "heading_end", "end"}] in document order.
+    "key" matches parse_sections (repeated headings get a suffix); HEADER
+    is the untitled text before the first heading (heading_end == start).
+    """
+    hits: List[Tuple[int, int, str]] = []
+    for name, pattern in SECTION_HEADERS.items():
+        for m in pattern.finditer(text):
+            hits.append((m.start(), m.end(), name))
+
+    if not hits:
+        return [{"key": "HEADER", "name": "HEADER", "start": 0, "heading_end": 0, "end": len(text)}]
+
+    hits.sort(key=lambda x: x[0])
+
+    spans: List[Dict[str, Any]] = []
+    keys = set()
+    if hits[0][0] > 0:
+        spans.append({"key": "HEADER", "name": "HEADER", "start": 0, "heading_end": 0, "end": hits[0][0]})
+        keys.add("HEADER")
+
+    for i, (start, end, name) in enumerate(hits):
+        body_end = hits[i + 1][0] if i + 1 < len(hits) else len(text)
+        key = name if name not in keys else f"{name}_{i}"
+        keys.add(key)
+        spans.append({"key": key, "name": name, "start": start, "heading_end": end, "end": body_end})
+
+    return spans
+
+
+def sections_from_spans(text: str, spans: List[Dict[str, Any]]) -> Dict[str, str]:
+    return {span["key"]: text[span["start"]:span["end"]] for span in spans}
+
+
+def parse_sections(text: str) -> Dict[str, str]:
+    return sections_from_spans(text, find_section_spans(text))
+
+
+def reconstruct_text(sections: Dict[str, str]) -> str:
+    return "\n".join(sections.values())
+
+
+def reconstructed_section_spans(sections: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Spans (as in find_section_spans) of each section within reconstruct_text(sections)."""
+    spans: List[Dict[str, Any]] = []
+    offset = 0
+    for key, body in sections.items():
+        name = "HEADER" if key == "HEADER" else key.split("_")[0]
+        heading_end = offset if name == "HEADER" else offset + len(body.split("\n")[0])
+        spans.append({"key": key, "name": name, "start": offset, "heading_end": heading_end,
+                      "end": offset + len(body)})
+        offset += len(body) + 1  # joined with "\n"
+    return spans
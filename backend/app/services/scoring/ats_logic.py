@@ -57,14 +57,13 @@ def calculate_keyword_score(job_description: str, resume_text: str) -> Tuple[flo
 
 def get_embedding(text: str) -> List[float]:
     """Generates embedding using OpenAI or Fake fallback."""
-    if not settings.OPENAI_API_KEY:
+    if not (settings.OPENAI_API_KEY or settings.OPENAI_BASE_URL):
         # Mock embedding
         return [0.1] * 1536
     
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        response = client.embeddings.create(input=text, model="text-embedding-3-small")
+        from app.services.llm import get_openai_client
+        response = get_openai_client().embeddings.create(input=text, model="text-embedding-3-small")
         return response.data[0].embedding
     except Exception as e:
         print(f"OpenAI Error: {e}")
@@ -0,0 +1,54 @@
+"""
+Skill-match scoring for a block of resumes × jobs as one matrix product.
+
+Each resume and each job is a binary row over a shared skill vocabulary
+(the union of all job skills; resume skills outside it can never match).
+R (resumes × V) @ Jᵀ (V × jobs) gives the matched-skill count for every
+pair at once; dividing by each job's skill count gives the score.
+"""
+
+from typing import List, Sequence, Set, Tuple
+
+import numpy as np
+
+
+class SkillMatrix:
+    """Job side of the product, built once per job corpus."""
+
+    def __init__(self, job_skill_sets: Sequence[Set[str]]):
+        self.vocabulary: List[str] = sorted(set().union(*job_skill_sets)) if job_skill_sets else []
+        self._index = {skill: i for i, skill in enumerate(self.vocabulary)}
+        self._names = np.array(self.vocabulary, dtype=object)
+
+        # Per-job vocabulary indices (used to list matched/missing names)
+        self.job_indices: List[np.ndarray] = [
+            np.array(sorted(self._index[s] for s in skills), dtype=np.intp) for skills in job_skill_sets
+        ]
+        self.jobs = np.zeros((len(job_skill_sets), len(self.vocabulary)), dtype=np.float64)
+        for row, indices in enumerate(self.job_indices):
+            self.jobs[row, indices] = 1.0
+        self.job_sizes = self.jobs.sum(axis=1)
+
+    def encode(self, resume_skill_sets: Sequence[Set[str]]) -> np.ndarray:
+        """Binary resumes × vocabulary matrix."""
+        resumes = np.zeros((len(resume_skill_sets), len(self.vocabulary)), dtype=np.float64)
+        for row, skills in enumerate(resume_skill_sets):
+            indices = [self._index[s] for s in skills if s in self._index]
+            resumes[row, indices] = 1.0
+        return resumes
+
+    def scores(self, resumes: np.ndarray) -> np.ndarray:
+        """
+        resumes × jobs matrix of (matched / required) * 100, rounded to one
+        decimal. Jobs without skills score 0 here (callers text-score them).
+        """
+        matched = resumes @ self.jobs.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(self.job_sizes > 0, matched / self.job_sizes, 0.0)
+        return np.round(ratio * 100, 1)
+
+    def split(self, resume_row: np.ndarray, job: int) -> Tuple[List[str], List[str]]:
+        """(matched, missing) skill names for one resume row against one job."""
+        indices = self.job_indices[job]
+        hits = resume_row[indices] > 0
+        return self._names[indices[hits]].tolist(), self._names[indices[~hits]].tolist()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 class BaseScraper(ABC):
     def __init__(self, base_url: str):
@@ -19,3 +19,17 @@ class BaseScraper(ABC):
         Convert raw job data into the standard JobCreate schema format.
         """
         pass
+
+
+def parse_salary_range(salary_str: str) -> Tuple[int, int]:
+    """
+    Very basic parsing for listing salaries like "AED 25,000 - 35,000 / Month".
+    Returns (min, max), (0, 0) when no figures are found.
+    """
+    try:
+        nums = [int(s.replace(',', '')) for s in (salary_str or '').split() if s.replace(',', '').isdigit()]
+        if nums:
+            return min(nums), max(nums)
+    except Exception:
+        pass
+    return 0, 0
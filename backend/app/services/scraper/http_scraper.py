@@ -0,0 +1,287 @@
+"""
+HTTP scraper base.
+
+- One pooled httpx.AsyncClient per source (HTTP/1.1 keep-alive, bounded
+  connections), shared by every HttpScraper instance in the process.
+- Conditional requests: ETag / Last-Modified validators are stored per page
+  URL together with the jobs parsed from it, so a 304 Not Modified response
+  replays the stored jobs without re-downloading or re-parsing the page.
+- Listing pages are parsed incrementally with lxml's HTMLPullParser as bytes
+  arrive; finished job elements are cleared so memory stays bounded.
+
+Default listing markup (override parse_job_element / is_job_element for
+other sites):
+
+    <article class="job" data-external-id="...">
+      <h2 class="title">...</h2>
+      <span class="company">...</span>
+      <span class="location">...</span>
+      <span class="salary">...</span>
+      <span class="source">...</span>
+      <time class="posted-at" datetime="2026-02-19T13:33:15"></time>
+      <div class="description">...</div>
+    </article>
+    <a rel="next" href="/jobs?page=2">Next</a>
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import httpx
+from lxml import etree
+
+from app.core.config import settings
+from app.services.scraper.base import BaseScraper, parse_salary_range
+from app.schemas.job import JobCreate
+
+
+# ---------------------------------------------------------------------------
+# Shared pooled clients
+# ---------------------------------------------------------------------------
+
+_clients: Dict[Tuple[str, int], httpx.AsyncClient] = {}
+
+
+def get_http_client(base_url: str) -> httpx.AsyncClient:
+    """Pooled client for a source; one per event loop since clients are loop-bound."""
+    key = (base_url, id(asyncio.get_running_loop()))
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=False,
+            limits=httpx.Limits(
+                max_connections=settings.SCRAPER_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SCRAPER_HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(settings.SCRAPER_HTTP_TIMEOUT_SECONDS),
+            headers={"User-Agent": f"{settings.PROJECT_NAME}-scraper/1.0"},
+            follow_redirects=True,
+        )
+        _clients[key] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    for key, client in list(_clients.items()):
+        await client.aclose()
+        del _clients[key]
+
+
+# ---------------------------------------------------------------------------
+# Validator stores
+# ---------------------------------------------------------------------------
+
+class MemoryValidatorStore:
+    """Per-process validator store (tests, local runs)."""
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    async def get(self, url: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(url)
+
+    async def set(self, url: str, entry: Dict[str, Any]) -> None:
+        self._entries[url] = entry
+
+
+class RedisValidatorStore:
+    """Validator store shared by all workers."""
+
+    def __init__(self, prefix: str = "scraper:validators", ttl_seconds: int = 7 * 24 * 3600):
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self, url: str) -> Optional[Dict[str, Any]]:
+        from app.db.redis import get_async_redis
+        raw = await get_async_redis().get(f"{self.prefix}:{url}")
+        return json.loads(raw) if raw else None
+
+    async def set(self, url: str, entry: Dict[str, Any]) -> None:
+        from app.db.redis import get_async_redis
+        await get_async_redis().set(f"{self.prefix}:{url}", json.dumps(entry), ex=self.ttl_seconds)
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ScrapeMetrics:
+    pages_fetched: int = 0
+    pages_not_modified: int = 0
+    bytes_received: int = 0
+    bytes_saved: int = 0        # body bytes skipped thanks to 304 responses
+    jobs_parsed: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        total = self.pages_fetched + self.pages_not_modified
+        return total / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def jobs_per_second(self) -> float:
+        return self.jobs_parsed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["pages_per_second"] = round(self.pages_per_second, 1)
+        data["jobs_per_second"] = round(self.jobs_per_second, 1)
+        return data
+
+
+# ---------------------------------------------------------------------------
+# Scraper
+# ---------------------------------------------------------------------------
+
+def _text(el, path: str) -> str:
+    found = el.find(path)
+    return "".join(found.itertext()).strip() if found is not None else ""
+
+
+class HttpScraper(BaseScraper):
+    """
+    Scrapes paginated HTML listing pages over a pooled HTTP client.
+    """
+
+    listing_path = "/jobs"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        source_name: str = "Aggregator",
+        validator_store=None,
+        max_pages: Optional[int] = None,
+    ):
+        super().__init__(base_url or settings.SCRAPER_HTTP_BASE_URL)
+        self.source_name = source_name
+        self.validator_store = validator_store or RedisValidatorStore()
+        self.max_pages = max_pages or settings.SCRAPER_HTTP_MAX_PAGES
+        self.metrics = ScrapeMetrics()
+
+    # -- parsing hooks -------------------------------------------------------
+
+    def is_job_element(self, el) -> bool:
+        return el.tag == "article" and "job" in (el.get("class") or "").split()
+
+    def is_next_link(self, el) -> bool:
+        return el.tag == "a" and el.get("rel") == "next"
+
+    def parse_job_element(self, el) -> Dict[str, Any]:
+        posted = el.find(".//*[@class='posted-at']")
+        return {
+            "external_id": el.get("data-external-id"),
+            "title": _text(el, ".//*[@class='title']"),
+            "company": _text(el, ".//*[@class='company']"),
+            "location": _text(el, ".//*[@class='location']"),
+            "salary": _text(el, ".//*[@class='salary']"),
+            "source": _text(el, ".//*[@class='source']") or self.source_name,
+            "posted_at": posted.get("datetime") if posted is not None else None,
+            "description": _text(el, ".//*[@class='description']"),
+        }
+
+    # -- fetching --------------------------------------------------------------
+
+    async def _fetch_page(self, url: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one listing page; returns (jobs, next_url)."""
+        client = get_http_client(self.base_url)
+        cached = await self.validator_store.get(url)
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and cached:
+                self.metrics.pages_not_modified += 1
+                self.metrics.bytes_saved += cached.get("content_length", 0)
+                return cached["jobs"], cached.get("next_url")
+            response.raise_for_status()
+
+            jobs: List[Dict[str, Any]] = []
+            next_url: Optional[str] = None
+            received = 0
+            parser = etree.HTMLPullParser(events=("end",))
+
+            def drain():
+                nonlocal next_url
+                for _, el in parser.read_events():
+                    if self.is_job_element(el):
+                        jobs.append(self.parse_job_element(el))
+                        # Drop parsed elements so large pages stay memory-bounded
+                        el.clear()
+                        parent = el.getparent()
+                        while parent is not None and el.getprevious() is not None:
+                            del parent[0]
+                    elif self.is_next_link(el) and el.get("href"):
+                        next_url = urljoin(str(response.url), el.get("href"))
+
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                parser.feed(chunk)
+                drain()
+            parser.close()
+            drain()
+
+            self.metrics.pages_fetched += 1
+            self.metrics.bytes_received += received
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                await self.validator_store.set(url, {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "content_length": received,
+                    "next_url": next_url,
+                    "jobs": jobs,
+                })
+            return jobs, next_url
+
+    async def fetch_jobs(self, query: str, location: str) -> List[Dict[str, Any]]:
+        """
+        Walks listing pages (following rel=next) up to max_pages.
+        """
+        started = time.perf_counter()
+        request = httpx.Request("GET", urljoin(self.base_url, self.listing_path),
+                                params={"q": query, "location": location})
+        url: Optional[str] = str(request.url)
+
+        results: List[Dict[str, Any]] = []
+        pages = 0
+        while url and pages < self.max_pages:
+            jobs, url = await self._fetch_page(url)
+            results.extend(jobs)
+            pages += 1
+
+        self.metrics.jobs_parsed += len(results)
+        self.metrics.elapsed_seconds += time.perf_counter() - started
+        return results
+
+    def normalize_job(self, raw_job: Dict[str, Any]) -> JobCreate:
+        min_sal, max_sal = parse_salary_range(raw_job.get("salary", "0"))
+        posted_at = raw_job.get("posted_at")
+        return JobCreate(
+            title=raw_job["title"],
+            company_name=raw_job["company"],
+            location=raw_job["location"],
+            description_text=raw_job["description"],
+            salary_min=min_sal,
+            salary_max=max_sal,
+            currency="AED",
+            external_id=raw_job.get("external_id") or str(uuid.uuid4()),
+            source_name=raw_job.get("source") or self.source_name,
+            source_url=self.base_url,
+            posted_at=datetime.fromisoformat(posted_at) if posted_at else datetime.now(),
+        )
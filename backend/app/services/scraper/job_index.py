@@ -0,0 +1,237 @@
+"""
+Process-wide, read-only search index over a scraper dataset.
+
+The dataset is streamed record by record (JSON array or JSON Lines) and
+indexed once per process:
+  - a word index of lowercased, whitespace-delimited title/description
+    words → posting sets, plus a trigram index over that vocabulary
+  - a location index of distinct lowercased locations → posting sets
+
+A query term matches a job when it occurs anywhere in the job's
+lowercased "title description" text, as in the original linear scan
+("ops" finds "devops", "script" finds "typescript"). A term has no
+whitespace, so it can only occur inside one word: its postings are the
+union over the vocabulary words containing it, found through the
+trigram index instead of re-scanning every job.
+
+Jobs themselves are not kept in memory: the index holds each record's
+byte offset and length in the dataset file, and matching records are
+read back (as fresh dicts) when a search returns them.
+"""
+
+import codecs
+import json
+import os
+import threading
+from array import array
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+_READ_CHUNK = 1 << 16
+
+
+def _utf8_len(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Streaming loader
+# ---------------------------------------------------------------------------
+
+def iter_json_spans(path: str, chunk_size: int = _READ_CHUNK) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+    """
+    Yield (byte offset, byte length, record) for each record of a JSON array
+    file (or a .jsonl/.ndjson file), one at a time without materializing the
+    whole document. Seeking to the offset and decoding `length` bytes gives
+    the record back (see JobIndex.get_jobs).
+    """
+    if path.endswith((".jsonl", ".ndjson")):
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    yield offset, len(line), json.loads(line)
+                offset += len(line)
+        return
+
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    with open(path, "rb") as f:
+        buf = ""
+        pos = 0
+        # Byte offset of buf[pos] in the file
+        offset = 0
+        eof = False
+        started = False
+
+        def refill() -> None:
+            nonlocal buf, pos, eof
+            raw = f.read(chunk_size)
+            eof = not raw
+            buf = buf[pos:] + utf8.decode(raw, final=eof)
+            pos = 0
+
+        while True:
+            # Skip whitespace and separators between records (all ASCII)
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+                offset += 1
+
+            if pos >= len(buf):
+                if eof:
+                    if not started:
+                        return  # empty file
+                    raise ValueError(f"Unterminated JSON array in {path}")
+                refill()
+                continue
+
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError(f"Expected a JSON array in {path}")
+                started = True
+                pos += 1
+                offset += 1
+                continue
+
+            if buf[pos] == "]":
+                return
+
+            try:
+                record, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # Record spans the chunk boundary — read more and retry
+                refill()
+                continue
+
+            length = _utf8_len(buf[pos:end])
+            yield offset, length, record
+            pos = end
+            offset += length
+
+
+def iter_json_records(path: str, chunk_size: int = _READ_CHUNK) -> Iterator[Dict[str, Any]]:
+    """Records of a JSON array or JSON Lines file, streamed one at a time."""
+    for _, _, record in iter_json_spans(path, chunk_size):
+        yield record
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class JobIndex:
+    """Immutable word/location index over the records of one dataset file."""
+
+    def __init__(self, path: str, spans: Iterable[Tuple[int, int, Dict[str, Any]]]):
+        self.path = path
+        self._offsets = array("q")
+        self._lengths = array("q")
+        # word → ascending job positions (4 bytes each rather than a set entry)
+        words: Dict[str, array] = {}
+        locations: Dict[str, set] = {}
+
+        for i, (offset, length, job) in enumerate(spans):
+            self._offsets.append(offset)
+            self._lengths.append(length)
+            corpus = f"{job.get('title', '')} {job.get('description', '')}".lower()
+            for word in set(corpus.split()):
+                words.setdefault(word, array("i")).append(i)
+            locations.setdefault((job.get("location") or "").lower(), set()).add(i)
+
+        self._words = words
+        self._vocabulary: List[str] = sorted(words)
+        # trigram → indices into _vocabulary of the words containing it
+        trigrams: Dict[str, array] = {}
+        for w, word in enumerate(self._vocabulary):
+            for gram in {word[k:k + 3] for k in range(len(word) - 2)}:
+                trigrams.setdefault(gram, array("i")).append(w)
+        self._trigrams = trigrams
+        self._locations: Dict[str, FrozenSet[int]] = {l: frozenset(p) for l, p in locations.items()}
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def iter_jobs(self) -> Iterator[Dict[str, Any]]:
+        """Every job, in dataset order, streamed from the file."""
+        if len(self):
+            yield from iter_json_records(self.path)
+
+    def get_jobs(self, positions: Iterable[int]) -> List[Dict[str, Any]]:
+        """The jobs at `positions`, read back from the file as fresh dicts."""
+        positions = list(positions)
+        if not positions:
+            return []
+        with open(self.path, "rb") as f:
+            jobs = []
+            for i in positions:
+                f.seek(self._offsets[i])
+                jobs.append(json.loads(f.read(self._lengths[i])))
+        return jobs
+
+    def _words_containing(self, term: str) -> List[str]:
+        if len(term) < 3:
+            # Too short for a trigram: scan the vocabulary
+            return [word for word in self._vocabulary if term in word]
+        grams = sorted(
+            (self._trigrams.get(term[k:k + 3], ()) for k in range(len(term) - 2)), key=len,
+        )
+        candidates = set(grams[0])
+        for gram_words in grams[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(gram_words)
+        return [self._vocabulary[w] for w in candidates if term in self._vocabulary[w]]
+
+    def term_postings(self, term: str) -> FrozenSet[int]:
+        """
+        Jobs whose lowercased title/description contains `term` (one
+        whitespace-free query term) anywhere, e.g. "dev" in "developer" or
+        "ops" in "devops".
+        """
+        term = term.lower()
+        if not term:
+            return frozenset()
+        return frozenset().union(*(self._words[word] for word in self._words_containing(term)))
+
+    def location_postings(self, location_term: str) -> FrozenSet[int]:
+        """Jobs whose location contains `location_term` (distinct locations are few)."""
+        matches = [p for loc, p in self._locations.items() if location_term in loc]
+        return frozenset().union(*matches) if matches else frozenset()
+
+    def search(self, query_terms: List[str], location_term: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Jobs matching ANY query term, intersected with the location postings
+        (skipped when `location_term` is None). Results keep dataset order.
+        """
+        matched: FrozenSet[int] = frozenset().union(*(self.term_postings(t) for t in query_terms)) \
+            if query_terms else frozenset()
+        if location_term is not None and matched:
+            matched = matched & self.location_postings(location_term)
+        return self.get_jobs(sorted(matched))
+
+
+_indexes: Dict[str, Tuple[float, JobIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_job_index(path: str) -> JobIndex:
+    """
+    Return the shared index for `path`, building it on first use in this
+    process. Rebuilt only if the file's mtime changes.
+    """
+    if not os.path.exists(path):
+        return JobIndex(path, iter(()))
+
+    mtime = os.path.getmtime(path)
+    cached = _indexes.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with _indexes_lock:
+        cached = _indexes.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        index = JobIndex(path, iter_json_spans(path))
+        _indexes[path] = (mtime, index)
+        return index
@@ -3,87 +3,70 @@ import json
 import os
 import uuid
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from app.services.scraper.base import BaseScraper
+from app.core.config import settings
+from app.services.scraper.base import BaseScraper, parse_salary_range
+from app.services.scraper.job_index import JobIndex, get_job_index
 from app.schemas.job import JobCreate
 
 class RecursiveScraper(BaseScraper):
     """
     Simulates a high-fidelity Recursive Scraper that 'crawls' sources
     by loading a curated realistic dataset.
+
+    The dataset is streamed into a process-wide inverted index on first use
+    (see job_index.py), so queries are posting-list lookups rather than
+    linear scans, and matching jobs are read back from the file. Point SCRAPER_DATASET_PATH at a larger .json/.jsonl dump
+    to crawl beyond the bundled file.
     """
     
-    def __init__(self):
-        self.data_path = os.path.join(os.path.dirname(__file__), 'data', 'dubai_tech_jobs.json')
-        self._cache = None
-        
-    def _load_data(self) -> List[Dict[str, Any]]:
-        if self._cache:
-            return self._cache
-            
-        if not os.path.exists(self.data_path):
-             # Fallback if file missing
-             return []
-             
-        with open(self.data_path, 'r') as f:
-            self._cache = json.load(f)
-        return self._cache
+    def __init__(self, data_path: Optional[str] = None):
+        self.data_path = data_path or settings.SCRAPER_DATASET_PATH or os.path.join(
+            os.path.dirname(__file__), 'data', 'dubai_tech_jobs.json'
+        )
+
+    def _load_data(self) -> JobIndex:
+        # Shared per process: fresh scraper instances reuse the same index
+        return get_job_index(self.data_path)
+
+    def _with_live_metadata(self, job: Dict[str, Any], max_days_ago: int) -> Dict[str, Any]:
+        job_copy = job.copy()
+        job_copy['external_id'] = str(uuid.uuid4())
+        # Jitter posted date slightly to look like live feed
+        days_ago = random.randint(0, max_days_ago)
+        job_copy['posted_at'] = (datetime.now() - timedelta(days=days_ago)).isoformat()
+        return job_copy
 
     async def fetch_jobs(self, query: str, location: str) -> List[Dict[str, Any]]:
         """
         Fetches jobs from the dataset, filtering by query and location to simulate a search engine.
         """
-        all_jobs = self._load_data()
-        
-        # Simple fuzzy filtering
-        filtered_jobs = []
-        query_terms = query.lower().split()
-        location_term = location.lower()
+        index = self._load_data()
+
         # Special case: "*" returns all jobs for bulk ingestion
         if query == "*":
-            # Add dynamic metadata to all
-            for job in all_jobs:
-                 job_copy = job.copy()
-                 job_copy['external_id'] = str(uuid.uuid4())
-                 days_ago = random.randint(0, 5)
-                 job_copy['posted_at'] = (datetime.now() - timedelta(days=days_ago)).isoformat()
-                 filtered_jobs.append(job_copy)
-            return filtered_jobs
+            return [self._with_live_metadata(job, 5) for job in index.iter_jobs()]
+
+        location_term = location.lower()
+        # Check Location (loose match); "UAE" or "*" means no location filter
+        if 'uae' in location_term or location == "*":
+            location_term = None
+
+        # Check Query (at least one term match in title or description)
+        matches = index.search(query.lower().split(), location_term)
+        filtered_jobs = [self._with_live_metadata(job, 3) for job in matches]
 
-        for job in all_jobs:
-            # Check Location (loose match)
-            if location_term in job['location'].lower() or 'uae' in location_term or location == "*":
-                # Check Query (at least one term match in title or description)
-                text_corpus = (job['title'] + " " + job['description']).lower()
-                if any(term in text_corpus for term in query_terms):
-                    # Add dynamic metadata to make it look live
-                    job_copy = job.copy()
-                    job_copy['external_id'] = str(uuid.uuid4())
-                    # Jitter posted date slightly to look like live feed
-                    days_ago = random.randint(0, 3)
-                    job_copy['posted_at'] = (datetime.now() - timedelta(days=days_ago)).isoformat()
-                    filtered_jobs.append(job_copy)
-        
         # If no match, return all (fallback behavior for generic queries) or empty
         # For demo purposes, if query is generic like "developer", return a mix
         if not filtered_jobs and ("dev" in query.lower() or " engineer" in query.lower()):
-            return all_jobs[:5] # Return top 5 as fallback
-            
+            return index.get_jobs(range(min(5, len(index)))) # Return top 5 (fresh copies) as fallback
+
         return filtered_jobs
 
     def normalize_job(self, raw_job: Dict[str, Any]) -> JobCreate:
-        salary_str = raw_job.get('salary', '0')
         # Very basic parsing for demo data "AED 25,000 - 35,000"
-        min_sal = 0
-        max_sal = 0
-        try:
-            nums = [int(s.replace(',', '')) for s in salary_str.split() if s.replace(',', '').isdigit()]
-            if nums:
-                min_sal = min(nums)
-                max_sal = max(nums)
-        except:
-            pass
+        min_sal, max_sal = parse_salary_range(raw_job.get('salary', '0'))
 
         return JobCreate(
             title=raw_job["title"],
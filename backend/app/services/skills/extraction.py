@@ -1,6 +1,10 @@
 
+import hashlib
+import json
 import re
-from typing import Set, Dict, List
+from typing import Any, Set, Dict, List, Tuple
+
+from app.core.constants import SKILL_KEYWORDS
 
 # Knowledge Base of Skills (Deterministic)
 SKILL_DB = {
@@ -14,36 +18,52 @@ SKILL_DB = {
 def normalize_text(text: str) -> str:
     return text.lower().replace('/', ' ').replace(',', ' ').replace('.', ' ')
 
-def extract_skills(text: str) -> Dict[str, List[str]]:
+# Skills matched as plain substrings (their punctuation defeats \b boundaries)
+_SUBSTRING_SKILLS = {"C++", "C#", ".NET"}
+
+# Regex boundary match to avoid partial matches (e.g. "Go" in "Good")
+_SKILL_DB_PATTERNS = {
+    skill: re.compile(r'\b' + re.escape(skill.lower()) + r'\b')
+    for skills in SKILL_DB.values() for skill in skills if skill not in _SUBSTRING_SKILLS
+}
+
+def _substring_spans(text: str, needle: str) -> List[Tuple[int, int]]:
+    spans = []
+    start = text.find(needle)
+    while start != -1:
+        spans.append((start, start + len(needle)))
+        start = text.find(needle, start + 1)
+    return spans
+
+def find_skill_hits(text: str) -> List[Dict[str, Any]]:
     """
-    Extracts structured skills from text mapping to the SKILL_DB.
-    Returns: {"Languages": ["Python", ...], "Frameworks": [...]}
+    SKILL_DB skills found in text with every occurrence's (start, end) offset.
+    normalize_text preserves length, so offsets index the original text.
+    Returns: [{"skill": "Python", "category": "Languages", "spans": [[12, 18], ...]}]
     """
     if not text:
-        return {}
-        
+        return []
+
     normalized_text = normalize_text(text)
-    extracted = {}
-    
+    hits = []
     for category, skills in SKILL_DB.items():
-        found_skills = set()
-        for skill in skills:
-            # Regex boundary match to avoid partial matches (e.g. "Go" in "Good")
-            # Escape skill for regex (e.g. C++)
-            escaped_skill = re.escape(skill.lower())
-            
-            # Special case for C++ / C#
-            if skill in ["C++", "C#", ".NET"]:
-                 if skill.lower() in normalized_text: # Simple check for these chars
-                     found_skills.add(skill)
+        for skill in sorted(skills):
+            if skill in _SUBSTRING_SKILLS:
+                spans = _substring_spans(normalized_text, skill.lower())
             else:
-                # Word boundary check
-                if re.search(r'\b' + escaped_skill + r'\b', normalized_text):
-                    found_skills.add(skill)
-        
-        if found_skills:
-            extracted[category] = list(found_skills)
-            
+                spans = [m.span() for m in _SKILL_DB_PATTERNS[skill].finditer(normalized_text)]
+            if spans:
+                hits.append({"skill": skill, "category": category, "spans": [list(span) for span in spans]})
+    return hits
+
+def extract_skills(text: str) -> Dict[str, List[str]]:
+    """
+    Extracts structured skills from text mapping to the SKILL_DB.
+    Returns: {"Languages": ["Python", ...], "Frameworks": [...]}
+    """
+    extracted: Dict[str, List[str]] = {}
+    for hit in find_skill_hits(text):
+        extracted.setdefault(hit["category"], []).append(hit["skill"])
     return extracted
 
 def flatten_skills(skills_dict: Dict[str, List[str]]) -> Set[str]:
@@ -52,3 +72,31 @@ def flatten_skills(skills_dict: Dict[str, List[str]]) -> Set[str]:
     for cat_list in skills_dict.values():
         flat.update(cat_list)
     return flat
+
+# Precompiled word-boundary patterns for the flat SKILL_KEYWORDS list
+# (used for resume_skills / job_skills tagging)
+_KEYWORD_PATTERNS = [
+    (skill, re.compile(r'\b' + re.escape(skill.lower()) + r'\b')) for skill in SKILL_KEYWORDS
+]
+
+def match_skill_keywords(text: str) -> List[str]:
+    """SKILL_KEYWORDS present in text, in taxonomy order."""
+    text_lower = (text or "").lower()
+    # Use regex boundry to avoid partial matches (e.g. "Go" in "Good")
+    return [skill for skill, pattern in _KEYWORD_PATTERNS if pattern.search(text_lower)]
+
+def find_keyword_hits(text: str) -> List[Dict[str, Any]]:
+    """SKILL_KEYWORDS found in text with every occurrence's (start, end) offset."""
+    text_lower = (text or "").lower()
+    hits = []
+    for skill, pattern in _KEYWORD_PATTERNS:
+        spans = [list(m.span()) for m in pattern.finditer(text_lower)]
+        if spans:
+            hits.append({"skill": skill, "spans": spans})
+    return hits
+
+# Identifies the skill taxonomy; stored skill hits computed under a different
+# version are stale and must be recomputed
+TAXONOMY_VERSION = hashlib.sha1(json.dumps(
+    [{c: sorted(s) for c, s in SKILL_DB.items()}, SKILL_KEYWORDS], sort_keys=True
+).encode()).hexdigest()[:12]
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from app.core.config import settings
+from app.services.storage.base import BlobNotFoundError, BlobStorage, BlobWriter
+
+_storage: Optional[BlobStorage] = None
+
+
+def get_storage() -> BlobStorage:
+    """Process-wide storage backend selected by STORAGE_BACKEND ("local" or "s3")."""
+    global _storage
+    if _storage is None:
+        if settings.STORAGE_BACKEND == "s3":
+            from app.services.storage.s3 import S3BlobStorage
+            _storage = S3BlobStorage(
+                bucket=settings.S3_BUCKET,
+                endpoint_url=settings.S3_ENDPOINT_URL,
+                region=settings.S3_REGION,
+                access_key_id=settings.S3_ACCESS_KEY_ID,
+                secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            )
+        elif settings.STORAGE_BACKEND == "local":
+            from app.services.storage.local import LocalBlobStorage
+            _storage = LocalBlobStorage(settings.STORAGE_LOCAL_ROOT)
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND}")
+    return _storage
@@ -0,0 +1,101 @@
+"""
+Blob storage interface for uploaded documents.
+
+Documents are addressed by key (e.g. "resumes/<uuid>.pdf"), never by a
+local path, so API and worker processes can run on different machines.
+Backends stream in both directions: writers accept chunks as they arrive
+and readers yield chunks, optionally for a byte range.
+"""
+
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import anyio
+
+READ_CHUNK_SIZE = 256 * 1024
+
+
+class BlobNotFoundError(Exception):
+    pass
+
+
+class BlobWriter(ABC):
+    """Streaming write handle; nothing is visible under the key until commit()."""
+
+    @abstractmethod
+    async def write(self, chunk: bytes) -> None:
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def abort(self) -> None:
+        pass
+
+
+class BlobStorage(ABC):
+    @abstractmethod
+    async def open_writer(self, key: str) -> BlobWriter:
+        pass
+
+    @abstractmethod
+    def iter_chunks(self, key: str, start: int = 0, end: Optional[int] = None,
+                    chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """
+        Yield the bytes of [start, end) (end=None reads to the end of the
+        blob). Implemented as an async generator.
+        """
+        pass
+
+    @abstractmethod
+    async def size(self, key: str) -> int:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a blob; missing keys are ignored."""
+        pass
+
+    @asynccontextmanager
+    async def writer(self, key: str):
+        """Write a blob in chunks; it is committed on success and discarded on error."""
+        blob = await self.open_writer(key)
+        try:
+            yield blob
+        except BaseException:
+            await blob.abort()
+            raise
+        await blob.commit()
+
+    async def put_stream(self, key: str, chunks: AsyncIterator[bytes]) -> int:
+        size = 0
+        async with self.writer(key) as blob:
+            async for chunk in chunks:
+                size += len(chunk)
+                await blob.write(chunk)
+        return size
+
+    async def read_range(self, key: str, start: int, length: int) -> bytes:
+        return b"".join([chunk async for chunk in self.iter_chunks(key, start, start + length)])
+
+    @asynccontextmanager
+    async def local_copy(self, key: str):
+        """
+        Yield a local filesystem path holding the blob (for libraries such as
+        pdfminer that need a file). Remote backends stream it into a
+        temporary file that is removed afterwards.
+        """
+        fd, path = tempfile.mkstemp(suffix=os.path.splitext(key)[1])
+        os.close(fd)
+        try:
+            async with await anyio.open_file(path, "wb") as out:
+                async for chunk in self.iter_chunks(key):
+                    await out.write(chunk)
+            yield path
+        finally:
+            await anyio.Path(path).unlink(missing_ok=True)
@@ -0,0 +1,93 @@
+"""
+Local filesystem backend, sharded by key hash:
+
+    "resumes/3f2a….pdf"  →  <root>/resumes/9c/41/3f2a….pdf
+
+so no single directory grows unbounded. Keys that start with the root
+itself ("uploads/resumes/<uuid>.pdf") are pre-storage Resume.file_path
+values and resolve to that literal path.
+"""
+
+import hashlib
+import os
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import anyio
+
+from app.services.storage.base import READ_CHUNK_SIZE, BlobNotFoundError, BlobStorage, BlobWriter
+
+
+class _LocalWriter(BlobWriter):
+    def __init__(self, path: str):
+        self.path = path
+        self.part_path = f"{path}.part-{uuid.uuid4().hex}"
+        self._file = None
+
+    async def write(self, chunk: bytes) -> None:
+        if self._file is None:
+            await anyio.Path(os.path.dirname(self.path)).mkdir(parents=True, exist_ok=True)
+            self._file = await anyio.open_file(self.part_path, "wb")
+        await self._file.write(chunk)
+
+    async def commit(self) -> None:
+        if self._file is None:
+            await self.write(b"")
+        await self._file.aclose()
+        # Atomic publish: readers never see a half-written file
+        await anyio.to_thread.run_sync(os.replace, self.part_path, self.path)
+
+    async def abort(self) -> None:
+        if self._file is not None:
+            await self._file.aclose()
+        await anyio.Path(self.part_path).unlink(missing_ok=True)
+
+
+class LocalBlobStorage(BlobStorage):
+    def __init__(self, root: str):
+        self.root = root.rstrip("/")
+
+    def path_for(self, key: str) -> str:
+        if key.startswith(f"{self.root}/"):
+            return key  # legacy unsharded path
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        prefix, name = os.path.split(key)
+        return os.path.join(self.root, prefix, digest[:2], digest[2:4], name)
+
+    async def open_writer(self, key: str) -> BlobWriter:
+        return _LocalWriter(self.path_for(key))
+
+    async def iter_chunks(self, key: str, start: int = 0, end: Optional[int] = None,
+                          chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        try:
+            f = await anyio.open_file(self.path_for(key), "rb")
+        except FileNotFoundError:
+            raise BlobNotFoundError(key)
+        async with f:
+            await f.seek(start)
+            remaining = None if end is None else max(0, end - start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def size(self, key: str) -> int:
+        try:
+            return (await anyio.Path(self.path_for(key)).stat()).st_size
+        except FileNotFoundError:
+            raise BlobNotFoundError(key)
+
+    async def delete(self, key: str) -> None:
+        await anyio.Path(self.path_for(key)).unlink(missing_ok=True)
+
+    @asynccontextmanager
+    async def local_copy(self, key: str):
+        # Already on disk — no copy needed
+        path = self.path_for(key)
+        if not await anyio.Path(path).exists():
+            raise BlobNotFoundError(key)
+        yield path
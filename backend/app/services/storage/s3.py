@@ -0,0 +1,137 @@
+"""
+S3-compatible backend (AWS S3, MinIO, ...). boto3 is imported lazily so
+the local backend has no dependency on it; its blocking calls run in
+worker threads.
+
+Writes buffer up to S3_MULTIPART_CHUNK_BYTES: small blobs are a single
+PutObject, larger ones become a multipart upload streamed part by part.
+"""
+
+from typing import AsyncIterator, Optional
+
+import anyio
+
+from app.core.config import settings
+from app.services.storage.base import READ_CHUNK_SIZE, BlobNotFoundError, BlobStorage, BlobWriter
+
+
+def _is_not_found(error: Exception) -> bool:
+    response = getattr(error, "response", None) or {}
+    return response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+
+class _S3Writer(BlobWriter):
+    def __init__(self, storage: "S3BlobStorage", key: str):
+        self.storage = storage
+        self.key = key
+        self.buffer = bytearray()
+        self.upload_id: Optional[str] = None
+        self.parts = []
+
+    async def _flush_part(self) -> None:
+        client = self.storage.client
+        if self.upload_id is None:
+            created = await anyio.to_thread.run_sync(
+                lambda: client.create_multipart_upload(Bucket=self.storage.bucket, Key=self.key)
+            )
+            self.upload_id = created["UploadId"]
+        number = len(self.parts) + 1
+        body = bytes(self.buffer)
+        self.buffer.clear()
+        uploaded = await anyio.to_thread.run_sync(lambda: client.upload_part(
+            Bucket=self.storage.bucket, Key=self.key, UploadId=self.upload_id,
+            PartNumber=number, Body=body,
+        ))
+        self.parts.append({"PartNumber": number, "ETag": uploaded["ETag"]})
+
+    async def write(self, chunk: bytes) -> None:
+        self.buffer.extend(chunk)
+        if len(self.buffer) >= settings.S3_MULTIPART_CHUNK_BYTES:
+            await self._flush_part()
+
+    async def commit(self) -> None:
+        client = self.storage.client
+        if self.upload_id is None:
+            body = bytes(self.buffer)
+            await anyio.to_thread.run_sync(
+                lambda: client.put_object(Bucket=self.storage.bucket, Key=self.key, Body=body)
+            )
+            return
+        if self.buffer:
+            await self._flush_part()
+        await anyio.to_thread.run_sync(lambda: client.complete_multipart_upload(
+            Bucket=self.storage.bucket, Key=self.key, UploadId=self.upload_id,
+            MultipartUpload={"Parts": self.parts},
+        ))
+
+    async def abort(self) -> None:
+        if self.upload_id is not None:
+            client = self.storage.client
+            await anyio.to_thread.run_sync(lambda: client.abort_multipart_upload(
+                Bucket=self.storage.bucket, Key=self.key, UploadId=self.upload_id,
+            ))
+
+
+class S3BlobStorage(BlobStorage):
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None, region: Optional[str] = None,
+                 access_key_id: Optional[str] = None, secret_access_key: Optional[str] = None):
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.region = region
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            import boto3
+            from botocore.config import Config
+
+            # boto3 clients are thread-safe; one pooled client per process
+            self._client = boto3.client(
+                "s3",
+                endpoint_url=self.endpoint_url,
+                region_name=self.region,
+                aws_access_key_id=self.access_key_id,
+                aws_secret_access_key=self.secret_access_key,
+                config=Config(max_pool_connections=settings.S3_MAX_CONNECTIONS),
+            )
+        return self._client
+
+    async def open_writer(self, key: str) -> BlobWriter:
+        return _S3Writer(self, key)
+
+    async def iter_chunks(self, key: str, start: int = 0, end: Optional[int] = None,
+                          chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        kwargs = {"Bucket": self.bucket, "Key": key}
+        if start or end is not None:
+            if end is not None and end <= start:
+                return
+            kwargs["Range"] = f"bytes={start}-{'' if end is None else end - 1}"
+        try:
+            response = await anyio.to_thread.run_sync(lambda: self.client.get_object(**kwargs))
+        except Exception as e:
+            if _is_not_found(e):
+                raise BlobNotFoundError(key)
+            raise
+        body = response["Body"]
+        try:
+            while chunk := await anyio.to_thread.run_sync(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def size(self, key: str) -> int:
+        try:
+            head = await anyio.to_thread.run_sync(
+                lambda: self.client.head_object(Bucket=self.bucket, Key=key)
+            )
+        except Exception as e:
+            if _is_not_found(e):
+                raise BlobNotFoundError(key)
+            raise
+        return head["ContentLength"]
+
+    async def delete(self, key: str) -> None:
+        await anyio.to_thread.run_sync(lambda: self.client.delete_object(Bucket=self.bucket, Key=key))
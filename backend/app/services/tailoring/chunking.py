@@ -0,0 +1,92 @@
+"""
+Splitting long resume sections into independently optimizable chunks.
+
+A senior EXPERIENCE section can outgrow a single prompt. The response
+(the whole section rewritten, plus its change summary) then gets slow
+and may hit the completion limit. A truncated response fails to parse
+and wastes both shots. Sections over TAILORING_CHUNK_MAX_TOKENS are cut
+at role boundaries, where a heading line follows bullets or a blank line.
+Consecutive roles are packed into chunks within the budget. A single
+role that is still too long is cut between bullets.
+
+Chunks are exact substrings of the section body: joined in order they
+give the body back, so unchanged chunks are stitched back verbatim.
+Tokens are estimated as in the requirement digest (~4 characters each).
+"""
+
+import re
+from typing import List
+
+from app.services.tailoring.digest import estimate_tokens
+
+# Sections that are chunked when long
+CHUNKED_SECTIONS = {"EXPERIENCE"}
+
+_BULLET_RE = re.compile(r"^\s*(?:[-*•·▪‣–]|\d{1,2}[.)])\s+")
+
+
+def _line_kind(line: str) -> str:
+    if not line.strip():
+        return "blank"
+    return "bullet" if _BULLET_RE.match(line) else "text"
+
+
+def role_blocks(body: str) -> List[str]:
+    """Body cut before every heading line that follows bullets or a blank line."""
+    blocks: List[str] = []
+    current: List[str] = []
+    previous = None
+    for line in body.splitlines(keepends=True):
+        kind = _line_kind(line)
+        if kind == "text" and previous in ("bullet", "blank") and any(l.strip() for l in current):
+            blocks.append("".join(current))
+            current = []
+        current.append(line)
+        previous = kind
+    if current:
+        blocks.append("".join(current))
+    return blocks
+
+
+def _split_block(block: str, max_tokens: int) -> List[str]:
+    """An oversized role cut before bullets so each piece fits (a single long line may not)."""
+    pieces: List[str] = []
+    current = ""
+    for line in block.splitlines(keepends=True):
+        if current.strip() and _line_kind(line) == "bullet" \
+                and estimate_tokens(current + line) > max_tokens:
+            pieces.append(current)
+            current = ""
+        current += line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_section_body(body: str, max_tokens: int) -> List[str]:
+    """
+    Chunks of at most max_tokens (where the structure allows), in order;
+    "".join(chunks) == body. A body within budget (or max_tokens <= 0) is
+    one chunk.
+    """
+    if max_tokens <= 0 or estimate_tokens(body) <= max_tokens:
+        return [body]
+
+    units: List[str] = []
+    for block in role_blocks(body):
+        units.extend([block] if estimate_tokens(block) <= max_tokens else _split_block(block, max_tokens))
+
+    chunks: List[str] = []
+    current = ""
+    for unit in units:
+        if current.strip() and estimate_tokens(current + unit) > max_tokens:
+            chunks.append(current)
+            current = ""
+        current += unit
+    if current:
+        # Trailing whitespace alone belongs to the previous chunk
+        if chunks and not current.strip():
+            chunks[-1] += current
+        else:
+            chunks.append(current)
+    return chunks
@@ -0,0 +1,153 @@
+"""
+Per-job requirement digest for tailoring prompts.
+
+Job descriptions are mostly company blurb, benefits and boilerplate; the
+part a section rewrite needs is the requirement, responsibility and stack
+lines. The digest keeps those, ranked by skill density, up to
+TAILORING_DIGEST_MAX_TOKENS:
+
+  1. Split the description into units: bullet lines, and sentences of
+     prose lines, each tagged with the kind of the heading above it
+     (requirements / stack / responsibilities / other)
+  2. Score each unit: skills mentioned per word, plus a weight for its
+     heading kind and for stated years of experience. Units under other
+     headings (About us, Benefits, ...) that name no skill are dropped
+  3. Take units best-first while they fit the budget, then print them in
+     document order under one heading per kind
+
+It is computed once per job (at ingestion, or on first use for older
+rows), stored in Job.requirement_digest, and sent in place of the full
+description in every section prompt for that job. Tokens are estimated
+as ~4 characters each, as for the LLM scheduler.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+from app.core.config import settings
+from app.services.skills.extraction import find_skill_hits, match_skill_keywords
+
+REQUIREMENTS = "requirements"
+STACK = "stack"
+RESPONSIBILITIES = "responsibilities"
+OTHER = "other"
+
+# Digest heading per kind, in output order
+_KIND_LABELS = {
+    REQUIREMENTS: "Requirements",
+    STACK: "Tech stack",
+    RESPONSIBILITIES: "Responsibilities",
+    OTHER: "Also mentioned",
+}
+_KIND_WEIGHTS = {REQUIREMENTS: 3.0, STACK: 3.0, RESPONSIBILITIES: 2.0, OTHER: 0.0}
+
+_HEADING_KINDS = [
+    (STACK, re.compile(r"\b(tech(nology)?\s*stack|tech|technologies|tools|stack|environment)\b", re.I)),
+    (REQUIREMENTS, re.compile(
+        r"\b(requirements?|qualifications?|must[\s-]haves?|nice[\s-]to[\s-]haves?|skills|"
+        r"certifications?|experience|you\s+have|you\s+bring|about\s+you|look(ing)?\s+for|"
+        r"who\s+you\s+are|bonus|preferred)\b", re.I)),
+    (RESPONSIBILITIES, re.compile(
+        r"^(the\s+|your\s+)?role\b|\b(responsibilit(y|ies)|duties|what\s+you('|’)?ll\s+do|what\s+you\s+will\s+do|"
+        r"day[\s-]to[\s-]day|the\s+role\s+involves|your\s+impact|key\s+tasks)\b", re.I)),
+]
+
+# A heading is a short line that ends with ":" or has no sentence punctuation
+_HEADING_RE = re.compile(r"^\s*#*\s*([A-Za-z][^.!?]{1,60}?)\s*:?\s*$")
+_BULLET_RE = re.compile(r"^\s*(?:[-*•·▪‣–]|\d{1,2}[.)])\s+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9])")
+_YEARS_RE = re.compile(r"\b\d+\+?\s*(?:-|to)?\s*\d*\s*years?\b", re.I)
+_WORD_RE = re.compile(r"\w+")
+
+
+class DigestUnit(NamedTuple):
+    position: int
+    kind: str
+    text: str
+    score: float
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + 3) // 4
+
+
+def _heading_kind(line: str) -> Optional[str]:
+    """Kind of a heading line, OTHER for unrecognised headings, None if not a heading."""
+    stripped = line.strip()
+    if _BULLET_RE.match(stripped) or not _HEADING_RE.match(stripped):
+        return None
+    # Without a trailing colon only a short line naming no skill is a heading
+    if not stripped.endswith(":") and (
+        len(_WORD_RE.findall(stripped)) > 5 or match_skill_keywords(stripped) or find_skill_hits(stripped)
+    ):
+        return None
+    for kind, pattern in _HEADING_KINDS:
+        if pattern.search(stripped):
+            return kind
+    return OTHER
+
+
+def _units(description: str) -> List[DigestUnit]:
+    units: List[DigestUnit] = []
+    kind = OTHER
+    for line in description.splitlines():
+        if not line.strip():
+            continue
+        heading = _heading_kind(line)
+        if heading is not None:
+            kind = heading
+            continue
+
+        if _BULLET_RE.match(line):
+            pieces = [_BULLET_RE.sub("", line, count=1)]
+        else:
+            pieces = _SENTENCE_SPLIT_RE.split(line.strip())
+        for piece in pieces:
+            text = " ".join(piece.split())
+            words = len(_WORD_RE.findall(text))
+            skills = {s.lower() for s in match_skill_keywords(text)}
+            skills.update(hit["skill"].lower() for hit in find_skill_hits(text))
+            if not skills and words < 3:
+                continue
+            if kind == OTHER and not skills:
+                continue
+            score = len(skills) / max(words, 1) * 10 + _KIND_WEIGHTS[kind]
+            if _YEARS_RE.search(text):
+                score += 1.0
+            units.append(DigestUnit(len(units), kind, text, score))
+    return units
+
+
+def build_requirement_digest(title: Optional[str], description: Optional[str],
+                             max_tokens: Optional[int] = None) -> str:
+    """Title plus the highest-value requirement lines, within max_tokens."""
+    budget = max_tokens if max_tokens is not None else settings.TAILORING_DIGEST_MAX_TOKENS
+    title_line = (title or "").strip()
+    used = estimate_tokens(title_line)
+
+    seen = set()
+    chosen: List[DigestUnit] = []
+    for unit in sorted(_units(description or ""), key=lambda u: (-u.score, u.position)):
+        normalized = unit.text.lower()
+        if normalized in seen:
+            continue
+        # "- text\n" per line; a kind's heading is charged when it first appears
+        cost = estimate_tokens(unit.text) + 1
+        if not any(c.kind == unit.kind for c in chosen):
+            cost += estimate_tokens(_KIND_LABELS[unit.kind]) + 1
+        if used + cost > budget:
+            continue
+        seen.add(normalized)
+        chosen.append(unit)
+        used += cost
+
+    by_kind: Dict[str, List[DigestUnit]] = {}
+    for unit in sorted(chosen, key=lambda u: u.position):
+        by_kind.setdefault(unit.kind, []).append(unit)
+
+    lines = [title_line] if title_line else []
+    for kind, label in _KIND_LABELS.items():
+        if kind in by_kind:
+            lines.append(f"{label}:")
+            lines.extend(f"- {unit.text}" for unit in by_kind[kind])
+    return "\n".join(lines)
@@ -11,77 +11,32 @@ Two-shot OpenAI strategy per section:
 
 Section flow:
   1. Parse resume into named sections
-  2. For each tailorable section: two-shot OpenAI → rule-based fallback
+  2. For each tailorable section: two-shot OpenAI (sections concurrently,
+     async client; long EXPERIENCE sections as concurrent chunks, stitched
+     back in order) → rule-based fallback
   3. SKILLS section gets injected keywords appended (rule-based path only)
   4. Reconstruct tailored_text
   5. Recalculate ATS score
 """
 
+import asyncio
+import hashlib
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.services.parsing.sections import parse_sections, reconstruct_text, reconstructed_section_spans
+from app.services.tailoring.chunking import CHUNKED_SECTIONS, split_section_body
+from app.services.tailoring.events import Emit
 
 
 # ---------------------------------------------------------------------------
-# Section parsing
+# Tailorable sections (detection: app/services/parsing/sections.py)
 # ---------------------------------------------------------------------------
 
-SECTION_HEADERS = {
-    "SUMMARY": re.compile(
-        r"^(SUMMARY|PROFESSIONAL SUMMARY|OBJECTIVE|PROFILE|ABOUT ME)\s*$",
-        re.IGNORECASE | re.MULTILINE,
-    ),
-    "EXPERIENCE": re.compile(
-        r"^(EXPERIENCE|WORK EXPERIENCE|PROFESSIONAL EXPERIENCE|EMPLOYMENT HISTORY|WORK HISTORY)\s*$",
-        re.IGNORECASE | re.MULTILINE,
-    ),
-    "SKILLS": re.compile(
-        r"^(SKILLS|TECHNICAL SKILLS|CORE COMPETENCIES|KEY SKILLS|TECHNOLOGIES|TECH STACK)\s*$",
-        re.IGNORECASE | re.MULTILINE,
-    ),
-    "EDUCATION": re.compile(
-        r"^(EDUCATION|ACADEMIC BACKGROUND|QUALIFICATIONS)\s*$",
-        re.IGNORECASE | re.MULTILINE,
-    ),
-    "PROJECTS": re.compile(
-        r"^(PROJECTS|PERSONAL PROJECTS|KEY PROJECTS|NOTABLE PROJECTS)\s*$",
-        re.IGNORECASE | re.MULTILINE,
-    ),
-    "CERTIFICATIONS": re.compile(
-        r"^(CERTIFICATIONS|CERTIFICATES|LICENSES)\s*$",
-        re.IGNORECASE | re.MULTILINE,
-    ),
-}
-
 TAILORABLE_SECTIONS = {"EXPERIENCE", "SUMMARY", "PROJECTS", "SKILLS"}
 
 
-def parse_sections(text: str) -> Dict[str, str]:
-    hits: List[Tuple[int, int, str]] = []
-    for name, pattern in SECTION_HEADERS.items():
-        for m in pattern.finditer(text):
-            hits.append((m.start(), m.end(), name))
-
-    if not hits:
-        return {"HEADER": text}
-
-    hits.sort(key=lambda x: x[0])
-
-    sections: Dict[str, str] = {}
-    if hits[0][0] > 0:
-        sections["HEADER"] = text[: hits[0][0]]
-
-    for i, (start, end, name) in enumerate(hits):
-        body_end = hits[i + 1][0] if i + 1 < len(hits) else len(text)
-        key = name if name not in sections else f"{name}_{i}"
-        sections[key] = text[start:body_end]
-
-    return sections
-
-
-def reconstruct_text(sections: Dict[str, str]) -> str:
-    return "\n".join(sections.values())
-
-
 # ---------------------------------------------------------------------------
 # Shot 1 — Standard ATS prompt
 # ---------------------------------------------------------------------------
@@ -124,11 +79,6 @@ _SHOT1_USER = """\
 INPUTS
 ==================================================
 
-Original Resume Section:
-\"\"\"
-{resume_section_text}
-\"\"\"
-
 Job Description (Reference Only):
 \"\"\"
 {job_description}
@@ -137,6 +87,11 @@ Job Description (Reference Only):
 Matched Skills:
 {matched_skills}
 
+Original Resume Section:
+\"\"\"
+{resume_section_text}
+\"\"\"
+
 Missing Skills (DO NOT invent experience):
 {missing_skills}
 """
@@ -210,11 +165,6 @@ _SHOT2_USER = """\
 INPUTS
 ==================================================
 
-Resume Section (SOURCE OF TRUTH):
-\"\"\"
-{resume_section_text}
-\"\"\"
-
 Target Job Description:
 \"\"\"
 {job_description}
@@ -223,17 +173,50 @@ Target Job Description:
 Matched Skills (already present):
 {matched_skills}
 
+Resume Section (SOURCE OF TRUTH):
+\"\"\"
+{resume_section_text}
+\"\"\"
+
 Missing Skills (ATS gaps):
 {missing_skills}
 """
 
 
+# Template layout, bumped when the structure (not just wording) changes:
+#   1  resume section, then job description, then skills
+#   2  job description, then skills, then resume section
+#   3  job description, matched skills, resume section, missing skills:
+#      the static system prompt and the job block are a byte-identical
+#      leading prefix for every section and every resume tailored to the
+#      same job, extended by the matched skills within one run; missing
+#      skills differ per chunk of a long section, so they come last.
+#      The shared prefix is ~400-700 tokens with a requirement digest,
+#      under OpenAI's 1024-token caching minimum, so no cached tokens are
+#      expected from it there today; it starts paying off if the static
+#      part grows (longer job blocks, examples in the system prompt)
+PROMPT_LAYOUT_VERSION = 3
+
+# Changes whenever a prompt template is edited; part of every LLM cache key
+# and the key LLM usage metadata is aggregated under
+PROMPT_VERSION = f"v{PROMPT_LAYOUT_VERSION}-" + hashlib.sha1(
+    "\x00".join([_SHOT1_SYSTEM, _SHOT1_USER, _SHOT2_SYSTEM, _SHOT2_USER]).encode("utf-8")
+).hexdigest()[:12]
+
+_MODEL = "gpt-4o-mini"
+
+
 # ---------------------------------------------------------------------------
 # Shared user message builder
 # ---------------------------------------------------------------------------
 
 def _build_user_message(template: str, section_text: str, job_description: str,
                         matched_skills: List[str], missing_skills: List[str]) -> str:
+    """
+    User message in prefix order (see PROMPT_LAYOUT_VERSION). Everything
+    before the section must depend only on the job and the matched skills,
+    so it renders byte-identically for every section and chunk of a run.
+    """
     return template.format(
         resume_section_text=section_text.strip(),
         job_description=job_description.strip()[:1500],
@@ -359,37 +342,136 @@ class _SectionResult:
         return self.optimized_text is not None
 
 
-def _call_openai(
+async def _create_completion(
+    system: str,
+    user: str,
+    max_tokens: int,
+    temperature: float,
+    on_token: Optional[Callable[[str], Awaitable[None]]],
+) -> Tuple[str, Optional[str], Any, float]:
+    """
+    One model request, reported to the provider circuit breaker; returns
+    (content, finish_reason, usage, latency).
+    """
+    from app.services.llm import breaker, get_async_openai_client
+
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user},
+    ]
+    started = time.monotonic()
+    try:
+        if on_token is not None:
+            stream = await get_async_openai_client().chat.completions.create(
+                model=_MODEL, messages=messages, max_tokens=max_tokens,
+                temperature=temperature, stream=True,
+                # Usage arrives in a final chunk without choices
+                extra_body={"stream_options": {"include_usage": True}},
+            )
+            parts: List[str] = []
+            usage = finish_reason = None
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    await on_token(delta)
+                if chunk.choices and chunk.choices[0].finish_reason:
+                    finish_reason = chunk.choices[0].finish_reason
+                usage = getattr(chunk, "usage", None) or usage
+            content = "".join(parts)
+        else:
+            response = await get_async_openai_client().chat.completions.create(
+                model=_MODEL, messages=messages, max_tokens=max_tokens, temperature=temperature,
+            )
+            content = response.choices[0].message.content or ""
+            finish_reason = response.choices[0].finish_reason
+            usage = response.usage
+    except Exception:
+        await breaker.record(failed=True, latency=time.monotonic() - started)
+        raise
+    latency = time.monotonic() - started
+    await breaker.record(failed=False, latency=latency)
+    return content, finish_reason, usage, latency
+
+
+async def _call_openai(
     system: str,
     user: str,
-    api_key: str,
     max_tokens: int = 1200,
     temperature: float = 0.2,
-) -> str:
-    """Low-level OpenAI call; returns raw string content."""
-    from openai import OpenAI
-    client = OpenAI(api_key=api_key)
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
-        max_tokens=max_tokens,
-        temperature=temperature,
-    )
-    return response.choices[0].message.content or ""
+    on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> Tuple[str, Callable[[], Awaitable[None]]]:
+    """
+    Low-level async OpenAI call (shared pooled client); returns the raw
+    string content and a `keep` coroutine function that stores it in the
+    LLM response cache. Callers await keep() only once the response parsed
+    into an accepted result, so truncated, unparseable and no-change
+    replies are never replayed; keep() is a no-op for cache hits and for
+    responses that did not finish normally. Identical requests are served
+    from the cache; the rest wait for admission by the shared rate-limit
+    scheduler (lane from the caller's context), and a call that errors or
+    is cancelled (a hedge's losing shot) returns its whole reservation.
+    With on_token the response is streamed and each delta passed to it.
+    Token usage (including provider-cached prompt tokens) and latency are
+    recorded under PROMPT_VERSION, and the outcome feeds the provider
+    circuit breaker (LLMCircuitOpen while it is open).
+    """
+    from app.services.llm import breaker
+    from app.services.llm.cache import cache_key, get_cached, set_cached
+    from app.services.llm.scheduler import acquire, estimate_tokens, settle
+    from app.services.llm.usage import record_usage, usage_counts
+
+    async def keep_nothing() -> None:
+        pass
+
+    key = cache_key(_MODEL, system, user, temperature, PROMPT_VERSION)
+    cached = await get_cached(key)
+    if cached is not None:
+        return cached["content"], keep_nothing
+
+    # Open circuit → LLMCircuitOpen before any queueing
+    await breaker.check()
+    estimated = estimate_tokens(system, user, max_tokens)
+    await acquire(estimated)
+    try:
+        content, finish_reason, usage, latency = await _create_completion(
+            system, user, max_tokens, temperature, on_token
+        )
+    except BaseException:
+        # Nothing was used; settle in full, also on cancellation
+        await settle(estimated, 0)
+        raise
+
+    prompt_tokens, cached_tokens, completion_tokens = usage_counts(usage)
+    tokens = prompt_tokens + completion_tokens
+    if usage is None:
+        # No usage reported; estimate (~4 chars per token)
+        tokens = (len(system) + len(user) + len(content)) // 4
+    await record_usage(PROMPT_VERSION, latency, prompt_tokens, cached_tokens, completion_tokens)
+    await settle(estimated, tokens)
 
+    async def keep() -> None:
+        await set_cached(key, content, tokens)
 
-def _optimize_section(
+    # Truncated ("length") or filtered output is never cacheable
+    return content, (keep if content and finish_reason == "stop" else keep_nothing)
+
+
+async def _optimize_section(
     section_name: str,
     section_text: str,
     job_description: str,
     matched_skills: List[str],
     missing_skills: List[str],
+    emit: Optional[Emit] = None,
+    chunk: Optional[int] = None,
+    shot1_outcomes: Optional[List[bool]] = None,
 ) -> _SectionResult:
     """
-    Two-shot OpenAI optimisation for a single resume section.
+    Two-shot OpenAI optimisation for a single resume section (or one chunk
+    of a long section; `chunk` is its index, added to progress events).
+    Shot 1 no-op outcomes go to the shot history, or are appended to
+    `shot1_outcomes` when given (chunks; the caller records the section).
 
     Shot 1 (standard prompt):
       - Returns result if text is meaningfully changed
@@ -400,40 +482,64 @@ def _optimize_section(
       - Returns failure if FAILURE_REASON is returned
       - All failure bullets are surfaced in change_summary
 
-    Returns _SectionResult (succeeded=False means fall through to rule-based).
+    TAILORING_SHOT_MODE="hedged" also starts Shot 2 speculatively, alongside
+    a Shot 1 that is still running after TAILORING_HEDGE_AFTER_SECONDS, or
+    together with Shot 1 for sections that usually no-op on it; the first
+    acceptable result wins and the other shot is cancelled.
+
+    Progress (shot outcomes, optionally streamed tokens) goes to `emit`.
+
+    Returns _SectionResult (succeeded=False means fall through to rule-based,
+    also when the provider circuit is open).
     """
+    from app.services.tailoring.shot_history import record_shot1, shot1_noop_rate
+
     try:
         from app.core.config import settings
-        if not settings.OPENAI_API_KEY:
+        # A configured base URL (local stand-in server) needs no key
+        if not (settings.OPENAI_API_KEY or settings.OPENAI_BASE_URL):
             return _SectionResult()
-        api_key = settings.OPENAI_API_KEY
     except Exception:
         return _SectionResult()
 
     original_stripped = section_text.strip()
 
+    async def send(event: Dict[str, Any]) -> None:
+        if emit is not None:
+            extra = {"chunk": chunk} if chunk is not None else {}
+            await emit({"section": section_name, **extra, **event})
+
+    def token_sink(shot: int) -> Optional[Callable[[str], Awaitable[None]]]:
+        if emit is None or not settings.TAILORING_STREAM_TOKENS:
+            return None
+        return lambda text: send({"type": "token", "shot": shot, "text": text})
+
     # ---------- Shot 1 ----------
-    shot1_raw: str = ""
-    try:
-        shot1_raw = _call_openai(
+    async def shot1() -> Optional[_SectionResult]:
+        """Accepted result, or None on no change; raises if OpenAI is unavailable."""
+        shot1_raw, keep = await _call_openai(
             system=_SHOT1_SYSTEM,
             user=_build_user_message(
                 _SHOT1_USER, section_text, job_description, matched_skills, missing_skills
             ),
-            api_key=api_key,
+            on_token=token_sink(1),
         )
-    except Exception:
-        return _SectionResult()  # OpenAI unavailable → rule-based
+        shot1 = _parse_shot1_response(shot1_raw)
 
-    shot1 = _parse_shot1_response(shot1_raw)
+        if shot1 is not None:
+            optimized_text, bullets = shot1
+            # Detect silent no-op: model returned original text unchanged
+            if optimized_text.strip() == original_stripped:
+                shot1 = None  # treat as if it returned NO_SAFE_CHANGES_POSSIBLE
 
-    if shot1 is not None:
-        optimized_text, bullets = shot1
-        # Detect silent no-op: model returned original text unchanged
-        if optimized_text.strip() == original_stripped:
-            shot1 = None  # treat as if it returned NO_SAFE_CHANGES_POSSIBLE
-
-    if shot1 is not None:
+        if shot1_outcomes is not None:
+            shot1_outcomes.append(shot1 is None)
+        else:
+            await record_shot1(section_name, no_op=shot1 is None)
+        await send({"type": "shot1_result", "outcome": "accepted" if shot1 is not None else "no_changes"})
+        if shot1 is None:
+            return None
+        await keep()
         return _SectionResult(
             optimized_text=shot1[0],
             change_bullets=shot1[1],
@@ -441,28 +547,41 @@ def _optimize_section(
         )
 
     # ---------- Shot 2 (retry) ----------
-    shot2_raw: str = ""
-    try:
-        shot2_raw = _call_openai(
+    failure_reasons: List[str] = []
+    shot2_claimed = False
+
+    async def shot2(stream: bool = True) -> Optional[_SectionResult]:
+        """
+        Accepted result, or None (FAILURE_REASON bullets kept); raises if
+        unavailable. Hedged mode may run a second, unstreamed copy; only the
+        first copy to finish reports.
+        """
+        nonlocal shot2_claimed
+        shot2_raw, keep = await _call_openai(
             system=_SHOT2_SYSTEM,
             user=_build_user_message(
                 _SHOT2_USER, section_text, job_description, matched_skills, missing_skills
             ),
-            api_key=api_key,
             temperature=0.4,  # slightly higher — push through the conservatism
+            on_token=token_sink(2) if stream else None,
         )
-    except Exception:
-        return _SectionResult()
-
-    shot2 = _parse_shot2_response(shot2_raw)
-
-    if shot2 is not None:
-        optimized_text, changes, skills = shot2
-        # Guard: if the model still returned original text, treat as failure
-        if optimized_text.strip() == original_stripped:
-            shot2 = None
-
-    if shot2 is not None:
+        if shot2_claimed:
+            return None
+        shot2_claimed = True
+        shot2 = _parse_shot2_response(shot2_raw)
+
+        if shot2 is not None:
+            optimized_text, changes, skills = shot2
+            # Guard: if the model still returned original text, treat as failure
+            if optimized_text.strip() == original_stripped:
+                shot2 = None
+
+        await send({"type": "shot2_result", "outcome": "accepted" if shot2 is not None else "failed"})
+        if shot2 is None:
+            # Both shots failed — surface FAILURE_REASON bullets if available
+            failure_reasons.extend(_parse_shot2_failure_reasons(shot2_raw))
+            return None
+        await keep()
         return _SectionResult(
             optimized_text=shot2[0],
             change_bullets=shot2[1],
@@ -470,11 +589,161 @@ def _optimize_section(
             shot_used=2,
         )
 
-    # Both shots failed — surface FAILURE_REASON bullets if available
-    failure_reasons = _parse_shot2_failure_reasons(shot2_raw)
+    await send({"type": "section_started"})
+
+    if settings.TAILORING_SHOT_MODE == "hedged":
+        noop_rate = await shot1_noop_rate(section_name)
+        speculate = noop_rate is not None and noop_rate >= settings.TAILORING_HEDGE_NOOP_RATE
+        return await _race_shots(shot1, shot2, send, speculate, failure_reasons)
+
+    try:
+        result = await shot1()
+    except Exception:
+        await send({"type": "shot1_result", "outcome": "error"})
+        return _SectionResult()  # OpenAI unavailable → rule-based
+    if result is not None:
+        return result
+
+    await send({"type": "shot2_retry"})
+    try:
+        result = await shot2()
+    except Exception:
+        await send({"type": "shot2_result", "outcome": "error"})
+        return _SectionResult()
+    if result is not None:
+        return result
     return _SectionResult(failure_reasons=failure_reasons)
 
 
+async def _race_shots(
+    shot1: Callable[[], Awaitable[Optional[_SectionResult]]],
+    shot2: Callable[..., Awaitable[Optional[_SectionResult]]],
+    send: Emit,
+    speculate: bool,
+    failure_reasons: List[str],
+) -> _SectionResult:
+    """
+    Hedged shot execution. Shot 2 starts at once when `speculate`, when
+    Shot 1 is still running TAILORING_HEDGE_AFTER_SECONDS after it started,
+    or (as in serial mode) when Shot 1 made no change. A Shot 2 left
+    running alone for TAILORING_HEDGE_AFTER_SECONDS gets one duplicate
+    request. The first accepted result wins and anything still running is
+    cancelled. As in serial mode, a Shot 1 error with no Shot 2 in flight
+    goes to rule-based.
+    """
+    from app.core.config import settings
+
+    loop = asyncio.get_running_loop()
+    running: Dict[asyncio.Task, int] = {asyncio.create_task(shot1()): 1}
+    abandoned: List[asyncio.Task] = []
+    last_launch = loop.time()
+    shot2_started = shot2_hedged = shot2_errored = False
+
+    async def launch_shot2(reason: Optional[str]) -> None:
+        nonlocal last_launch, shot2_started, shot2_hedged
+        await send({"type": "shot2_retry", **({"speculative": reason} if reason else {})})
+        if shot2_started:
+            shot2_hedged = True
+            running[asyncio.create_task(shot2(stream=False))] = 2
+        else:
+            shot2_started = True
+            running[asyncio.create_task(shot2())] = 2
+        last_launch = loop.time()
+
+    try:
+        if speculate:
+            await launch_shot2("history")
+
+        while running:
+            timeout = None
+            if not shot2_started or (not shot2_hedged and set(running.values()) == {2}):
+                timeout = max(0.0, last_launch + settings.TAILORING_HEDGE_AFTER_SECONDS - loop.time())
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                await launch_shot2("hedge" if shot2_started else "latency")
+                continue
+
+            # Shot 1 wins a tie
+            for task in sorted(done, key=lambda t: running.get(t, 3)):
+                if task not in running:
+                    continue  # duplicate of a shot that already finished
+                shot = running.pop(task)
+                copies = [t for t, s in running.items() if s == shot]
+                try:
+                    result = task.result()
+                except Exception:
+                    if not copies:
+                        await send({"type": f"shot{shot}_result", "outcome": "error"})
+                        shot2_errored = shot2_errored or shot == 2
+                    continue
+                for copy in copies:
+                    copy.cancel()
+                    del running[copy]
+                    abandoned.append(copy)
+                if result is not None:
+                    return result
+                if shot == 1 and not shot2_started:
+                    await launch_shot2(None)
+
+        if not shot2_started or shot2_errored:
+            return _SectionResult()  # OpenAI unavailable → rule-based
+        return _SectionResult(failure_reasons=failure_reasons)
+    finally:
+        live = {task: shot for task, shot in running.items() if not task.done()}
+        for task in live:
+            task.cancel()
+        for shot in sorted(set(live.values())):
+            await send({"type": f"shot{shot}_result", "outcome": "cancelled"})
+        await asyncio.gather(*running, *abandoned, return_exceptions=True)
+
+
+def _assign_skills_to_chunks(missing_skills: List[str], chunks: List[str]) -> List[List[str]]:
+    """
+    Give each missing skill to exactly one chunk, so Shot 2 cannot inject
+    the same skill into several roles of one section: the chunk with the
+    most related bullets (as in the rule-based fallback), ties going to
+    the chunk with the fewest skills so far, then the earliest.
+    """
+    assigned: List[List[str]] = [[] for _ in chunks]
+    for skill in missing_skills:
+        best = max(
+            range(len(chunks)),
+            key=lambda i: (len(find_related_bullets(skill, chunks[i])), -len(assigned[i]), -i),
+        )
+        assigned[best].append(skill)
+    return assigned
+
+
+def _merge_chunk_results(chunks: List[str], results: List[_SectionResult]) -> _SectionResult:
+    """
+    Stitch per-chunk results of a long section back together in order.
+
+    Optimized chunks replace their originals (keeping the original's
+    trailing whitespace, so role spacing survives); failed chunks stay
+    verbatim. The section succeeds if any chunk did. Change bullets and
+    addressed skills are merged in chunk order, and failed chunks'
+    reasons are kept for change_summary.
+    """
+    parts: List[str] = []
+    for chunk, result in zip(chunks, results):
+        if result.succeeded:
+            parts.append(result.optimized_text + (chunk[len(chunk.rstrip()):] or "\n"))
+        else:
+            parts.append(chunk)
+
+    failure_reasons = list(dict.fromkeys(r for res in results for r in res.failure_reasons))
+    succeeded = [res for res in results if res.succeeded]
+    if not succeeded:
+        return _SectionResult(failure_reasons=failure_reasons)
+    return _SectionResult(
+        optimized_text="".join(parts).strip(),
+        change_bullets=[b for res in succeeded for b in res.change_bullets],
+        skills_addressed=list(dict.fromkeys(s for res in succeeded for s in res.skills_addressed)),
+        shot_used=max(res.shot_used for res in succeeded),
+        failure_reasons=failure_reasons,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Skill-context matching (rule-based fallback)
 # ---------------------------------------------------------------------------
@@ -551,15 +820,46 @@ def tailor_resume(
     missing_skills: List[str],
     matched_skills: List[str],
     ats_score_before: float,
+    sections: Optional[Dict[str, str]] = None,
+    job_digest: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Synchronous wrapper around tailor_resume_async for callers without an
+    event loop (scripts). Must not be called from inside a running loop.
+    """
+    return asyncio.run(tailor_resume_async(
+        resume_text, job_text, missing_skills, matched_skills, ats_score_before, sections,
+        job_digest=job_digest,
+    ))
+
+
+async def tailor_resume_async(
+    resume_text: str,
+    job_text: str,
+    missing_skills: List[str],
+    matched_skills: List[str],
+    ats_score_before: float,
+    sections: Optional[Dict[str, str]] = None,
+    on_event: Optional[Emit] = None,
+    job_digest: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Core tailoring algorithm.
 
     Per tailorable section (EXPERIENCE, SUMMARY, PROJECTS):
-      1. Two-shot OpenAI (standard → retry on no-op/failure)
+      1. Two-shot OpenAI (standard → retry on no-op/failure), all sections
+         concurrently (at most TAILORING_SECTION_CONCURRENCY at once);
+         results are applied in section order so change_summary is
+         deterministic. An EXPERIENCE section over
+         TAILORING_CHUNK_MAX_TOKENS is split at role or bullet-group
+         boundaries (services/tailoring/chunking.py); its chunks are
+         optimized as separate units, each missing skill offered to one
+         chunk only, and stitched back in order, with their change
+         bullets merged
          - On success: write optimized section, record change_summary entries
          - On failure: record FAILURE_REASON bullets in change_summary, fall through
-      2. Rule-based bullet injection (when both shots fail or no API key)
+      2. Rule-based bullet injection (when both shots fail or no API key;
+         for a chunked EXPERIENCE, the skills of the chunks that failed)
          - Per missing_skill: find related bullet → append keyword
          - Skills with no related bullet: logged as gap
 
@@ -567,11 +867,20 @@ def tailor_resume(
       - Rule-based injections always appended explicitly
       - AI is expected to update SKILLS inline when it handles the section
 
-    Returns {tailored_text, change_summary, ats_score_before, ats_score_after}
+    `sections` may carry the resume's stored section split (parse time);
+    otherwise resume_text is parsed here. `on_event` receives progress
+    events (see services/tailoring/events.py). `job_digest` (the job's
+    requirement digest, services/tailoring/digest.py) replaces job_text in
+    the section prompts; job_text is still used for rescoring.
+
+    Returns {tailored_text, tailored_sections, change_summary,
+             ats_score_before, ats_score_after}
     """
+    from app.core.config import settings
     from app.services.ats.scorer import calculate_ats_score
+    from app.services.tailoring.shot_history import record_shot1
 
-    sections = parse_sections(resume_text)
+    sections = dict(sections) if sections is not None else parse_sections(resume_text)
     change_summary: List[Dict[str, Any]] = []
     rule_based_injected_skills: List[str] = []
 
@@ -589,22 +898,67 @@ def tailor_resume(
     # -----------------------------------------------------------------
     # Pass 1: Two-shot OpenAI per tailorable section (excluding SKILLS)
     # -----------------------------------------------------------------
-    for sec_key in list(sections.keys()):
-        base = sec_key.split("_")[0]
-        if base not in TAILORABLE_SECTIONS or base == "SKILLS":
-            continue
+    ai_keys = [
+        k for k in sections
+        if k.split("_")[0] in TAILORABLE_SECTIONS and k.split("_")[0] != "SKILLS"
+        and sections[k].strip()
+    ]
+    # Long EXPERIENCE sections are optimized as chunks (role or bullet-group
+    # boundaries), each with its own share of the missing skills; every
+    # section or chunk is one unit of work
+    units: List[Tuple[str, str, Optional[int], List[str]]] = []
+    section_chunks: Dict[str, List[str]] = {}
+    chunk_skill_shares: Dict[str, List[List[str]]] = {}
+    chunk_shot1_outcomes: Dict[str, List[bool]] = {}
+    for sec_key in ai_keys:
+        if sec_key.split("_")[0] in CHUNKED_SECTIONS:
+            body = sections[sec_key].partition("\n")[2]
+            chunks = split_section_body(body, settings.TAILORING_CHUNK_MAX_TOKENS)
+            if len(chunks) > 1:
+                section_chunks[sec_key] = chunks
+                chunk_shot1_outcomes[sec_key] = []
+                skill_shares = chunk_skill_shares[sec_key] = _assign_skills_to_chunks(missing_skills, chunks)
+                units.extend(
+                    (sec_key, chunk, i, share) for i, (chunk, share) in enumerate(zip(chunks, skill_shares))
+                )
+                continue
+        units.append((sec_key, sections[sec_key], None, missing_skills))
+
+    semaphore = asyncio.Semaphore(settings.TAILORING_SECTION_CONCURRENCY)
+
+    async def optimize(sec_key: str, text: str, chunk: Optional[int], skills: List[str]) -> _SectionResult:
+        async with semaphore:
+            return await _optimize_section(
+                section_name=sec_key.split("_")[0],
+                section_text=text,
+                job_description=job_digest or job_text,
+                matched_skills=matched_skills,
+                missing_skills=skills,
+                emit=on_event,
+                chunk=chunk,
+                shot1_outcomes=chunk_shot1_outcomes.get(sec_key),
+            )
+
+    unit_results = await asyncio.gather(*(optimize(*unit) for unit in units))
+
+    # One shot-history sample per chunked section: a no-op unless some
+    # chunk's Shot 1 made a change
+    for sec_key, outcomes in chunk_shot1_outcomes.items():
+        if outcomes:
+            await record_shot1(sec_key.split("_")[0], no_op=all(outcomes))
+    by_section: Dict[str, List[_SectionResult]] = {}
+    for (sec_key, *_), result in zip(units, unit_results):
+        by_section.setdefault(sec_key, []).append(result)
+    results = [
+        _merge_chunk_results(section_chunks[k], by_section[k]) if k in section_chunks
+        else by_section[k][0]
+        for k in ai_keys
+    ]
 
+    # Applied in section order regardless of completion order
+    for sec_key, result in zip(ai_keys, results):
+        base = sec_key.split("_")[0]
         section_text = sections[sec_key]
-        if not section_text.strip():
-            continue
-
-        result = _optimize_section(
-            section_name=base,
-            section_text=section_text,
-            job_description=job_text,
-            matched_skills=matched_skills,
-            missing_skills=missing_skills,
-        )
 
         if result.succeeded:
             # Preserve the section header line (e.g. "EXPERIENCE\n")
@@ -636,29 +990,49 @@ def tailor_resume(
                     "skill": skill,
                 })
 
-        else:
-            # Both shots failed — surface failure reasons as gap entries
-            for reason in result.failure_reasons:
-                change_summary.append({
-                    "section_name": f"{base.capitalize()} (AI Failed)",
-                    "before_text": "",
-                    "after_text": "",
-                    "reason": reason,
-                    "injected": False,
-                    "skill": "ai-failed",
-                })
-            # Fall through to rule-based below for this section
+        # Both shots failed (for the section, or for some of its chunks) —
+        # surface failure reasons as gap entries; a failed section falls
+        # through to rule-based below
+        for reason in result.failure_reasons:
+            change_summary.append({
+                "section_name": f"{base.capitalize()} (AI Failed)",
+                "before_text": "",
+                "after_text": "",
+                "reason": reason,
+                "injected": False,
+                "skill": "ai-failed",
+            })
 
     # -----------------------------------------------------------------
     # Pass 2: Rule-based bullet injection for skills AI did NOT handle
     # -----------------------------------------------------------------
-    # Only skip rule-based for EXPERIENCE if AI succeeded for EXPERIENCE.
-    # If AI was not available at all, ai_succeeded_for is empty → full rule-based.
-    run_rule_based = "EXPERIENCE" not in ai_succeeded_for
+    # (skill, text to pick its bullet from; None = the whole section).
+    # If AI failed for EXPERIENCE (or was not available at all), every
+    # missing skill falls back. If only some of its chunks failed, their
+    # skill shares do, matched against those chunks — still verbatim in
+    # the section.
+    if "EXPERIENCE" not in ai_succeeded_for:
+        fallback: List[Tuple[str, Optional[str]]] = [(skill, None) for skill in missing_skills]
+    elif experience_key in section_chunks:
+        fallback = [
+            (skill, chunk)
+            for chunk, share, result in zip(
+                section_chunks[experience_key], chunk_skill_shares[experience_key], by_section[experience_key]
+            )
+            if not result.succeeded
+            for skill in share
+        ]
+    else:
+        fallback = []
+
+    if fallback and on_event is not None:
+        await on_event({
+            "type": "rule_based_fallback", "section": "EXPERIENCE", "skills": [skill for skill, _ in fallback],
+        })
 
-    if run_rule_based and experience_key:
-        for skill in missing_skills:
-            related = find_related_bullets(skill, sections[experience_key])
+    if fallback and experience_key:
+        for skill, scope in fallback:
+            related = find_related_bullets(skill, sections[experience_key] if scope is None else scope)
             if related:
                 original_bullet = related[0]
                 tailored_bullet = _rephrase_rule_based(original_bullet, skill)
@@ -690,8 +1064,8 @@ def tailor_resume(
                     "injected": False,
                     "skill": skill,
                 })
-    elif run_rule_based:
-        for skill in missing_skills:
+    elif fallback:
+        for skill, _ in fallback:
             change_summary.append({
                 "section_name": "Skills Gap",
                 "before_text": "",
@@ -745,6 +1119,7 @@ def tailor_resume(
 
     return {
         "tailored_text": tailored_text,
+        "tailored_sections": reconstructed_section_spans(sections),
         "change_summary": change_summary,
         "ats_score_before": ats_score_before,
         "ats_score_after": score_result["overall_score"],
@@ -0,0 +1,107 @@
+"""
+Tailoring progress events, relayed from the worker to SSE clients.
+
+The worker publishes each event on a per-record Redis pub/sub channel and
+appends it to a short-lived replay log in the same step (one Lua call), so
+a client that connects late, or reconnects with Last-Event-ID, first gets
+what it missed and then live events, without gaps or duplicates. An
+event's sequence number is its position in the log.
+
+Event types: started, section_started, shot1_result, shot2_retry,
+shot2_result, rule_based_fallback, token, done, failed. In hedged shot
+mode shot2_retry may carry "speculative" (history / latency / hedge) and
+a shot that lost the race reports outcome "cancelled". Section events for
+a chunk of a long EXPERIENCE section carry its index as "chunk".
+"""
+
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+
+Emit = Callable[[Dict[str, Any]], Awaitable[None]]
+
+TERMINAL_EVENTS = ("done", "failed")
+
+_PUBLISH_LUA = """
+local seq = redis.call('RPUSH', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('PUBLISH', KEYS[2], seq .. '|' .. ARGV[1])
+return seq
+"""
+
+
+def _channel(tailored_id: str) -> str:
+    return f"tailoring:events:{tailored_id}"
+
+
+def _log_key(tailored_id: str) -> str:
+    return f"tailoring:events:{tailored_id}:log"
+
+
+async def publish_event(tailored_id: str, event: Dict[str, Any]) -> None:
+    try:
+        from app.db.redis import get_async_redis
+        await get_async_redis().eval(
+            _PUBLISH_LUA, 2, _log_key(tailored_id), _channel(tailored_id),
+            json.dumps(event), settings.TAILORING_EVENTS_TTL_SECONDS,
+        )
+    except Exception as e:
+        # Progress events must never fail a tailoring run
+        print(f"Tailoring events unavailable: {e}")
+
+
+def emitter_for(tailored_ids: Iterable[str]) -> Emit:
+    """Emit callback publishing to one or more records (batch groups share a run)."""
+    ids = [str(t) for t in tailored_ids]
+
+    async def emit(event: Dict[str, Any]) -> None:
+        for tailored_id in ids:
+            await publish_event(tailored_id, event)
+    return emit
+
+
+async def subscribe_events(
+    tailored_id: str, last_seq: int = 0,
+) -> AsyncIterator[Optional[Tuple[int, Dict[str, Any]]]]:
+    """
+    Yield (seq, event) after `last_seq`: the replay log first, then live
+    events, stopping after a terminal event. Yields None every
+    TAILORING_EVENTS_HEARTBEAT_SECONDS without traffic (keep-alive).
+    """
+    from app.db.redis import get_async_redis
+    redis = get_async_redis()
+    pubsub = redis.pubsub()
+    # Subscribe before reading the log so nothing falls in between
+    await pubsub.subscribe(_channel(tailored_id))
+    try:
+        for seq, raw in enumerate(await redis.lrange(_log_key(tailored_id), last_seq, -1), start=last_seq + 1):
+            event = json.loads(raw)
+            last_seq = seq
+            yield seq, event
+            if event.get("type") in TERMINAL_EVENTS:
+                return
+
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=settings.TAILORING_EVENTS_HEARTBEAT_SECONDS,
+            )
+            if message is None:
+                yield None
+                continue
+            seq_str, _, raw = message["data"].partition("|")
+            seq = int(seq_str)
+            if seq <= last_seq:
+                continue  # already replayed from the log
+            event = json.loads(raw)
+            last_seq = seq
+            yield seq, event
+            if event.get("type") in TERMINAL_EVENTS:
+                return
+    finally:
+        await pubsub.unsubscribe(_channel(tailored_id))
+        await pubsub.aclose()
+
+
+def format_sse(seq: int, event: Dict[str, Any]) -> str:
+    return f"id: {seq}\nevent: {event.get('type', 'message')}\ndata: {json.dumps(event)}\n\n"
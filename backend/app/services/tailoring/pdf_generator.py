@@ -4,7 +4,7 @@ Produces a clean, ATS-friendly PDF — no diff highlights.
 """
 
 import io
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -77,7 +77,16 @@ def _is_bullet(line: str) -> bool:
     return stripped.startswith(("•", "-", "*", "–", "·"))
 
 
-def text_to_flowables(text: str, styles: Dict) -> list:
+def _heading_flowables(heading: str, styles: Dict) -> list:
+    escaped = heading.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return [
+        Spacer(1, 6),
+        Paragraph(escaped.upper(), styles["heading"]),
+        HRFlowable(width="100%", thickness=0.5, color=colors.HexColor("#cccccc")),
+    ]
+
+
+def text_to_flowables(text: str, styles: Dict, detect_headings: bool = True) -> list:
     """Convert plain resume text to a list of reportlab Flowables."""
     flowables = []
     lines = text.splitlines()
@@ -92,10 +101,8 @@ def text_to_flowables(text: str, styles: Dict) -> list:
             flowables.append(Spacer(1, 4))
             continue
 
-        if _is_section_heading(stripped):
-            flowables.append(Spacer(1, 6))
-            flowables.append(Paragraph(stripped.upper(), styles["heading"]))
-            flowables.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor("#cccccc")))
+        if detect_headings and _is_section_heading(stripped):
+            flowables.extend(_heading_flowables(stripped, styles))
             continue
 
         if _is_bullet(stripped):
@@ -113,13 +120,30 @@ def text_to_flowables(text: str, styles: Dict) -> list:
     return flowables
 
 
+def sections_to_flowables(text: str, section_spans: List[Dict], styles: Dict) -> list:
+    """
+    Render using known section boundaries (tailored_document) instead of
+    re-detecting headings line by line.
+    """
+    flowables = []
+    for span in section_spans:
+        heading = text[span["start"]:span["heading_end"]].strip()
+        if heading:
+            flowables.extend(_heading_flowables(heading, styles))
+        flowables.extend(text_to_flowables(text[span["heading_end"]:span["end"]], styles, detect_headings=False))
+    return flowables
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def generate_pdf(tailored_text: str, candidate_name: str = "") -> bytes:
+def generate_pdf(tailored_text: str, candidate_name: str = "",
+                 section_spans: Optional[List[Dict]] = None) -> bytes:
     """
     Generate a PDF from tailored resume text.
+    section_spans (TailoredResume.tailored_document["sections"]) are used when
+    they cover the text; otherwise headings are detected from the text.
     Returns raw PDF bytes.
     """
     buffer = io.BytesIO()
@@ -136,7 +160,10 @@ def generate_pdf(tailored_text: str, candidate_name: str = "") -> bytes:
     )
 
     styles = _build_styles()
-    flowables = text_to_flowables(tailored_text, styles)
+    if section_spans and section_spans[-1]["end"] == len(tailored_text):
+        flowables = sections_to_flowables(tailored_text, section_spans, styles)
+    else:
+        flowables = text_to_flowables(tailored_text, styles)
 
     doc.build(flowables)
     buffer.seek(0)
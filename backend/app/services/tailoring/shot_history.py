@@ -0,0 +1,38 @@
+"""
+Recent Shot 1 outcomes per section name (SUMMARY, EXPERIENCE, ...), shared
+by all workers. Hedged shot execution starts Shot 2 together with Shot 1
+for sections whose Shot 1 usually makes no change.
+"""
+
+from typing import Optional
+
+from app.core.config import settings
+
+_KEY = "tailoring:shot1_noop:{section}"
+_SAMPLES = 200
+
+
+async def record_shot1(section_name: str, no_op: bool) -> None:
+    try:
+        from app.db.redis import get_async_redis
+        key = _KEY.format(section=section_name)
+        pipe = get_async_redis().pipeline()
+        pipe.lpush(key, int(no_op))
+        pipe.ltrim(key, 0, _SAMPLES - 1)
+        await pipe.execute()
+    except Exception as e:
+        # History must never fail a tailoring run
+        print(f"Shot history unavailable: {e}")
+
+
+async def shot1_noop_rate(section_name: str) -> Optional[float]:
+    """Share of recent Shot 1 runs that made no change; None without enough history."""
+    try:
+        from app.db.redis import get_async_redis
+        samples = await get_async_redis().lrange(_KEY.format(section=section_name), 0, -1)
+    except Exception as e:
+        print(f"Shot history unavailable: {e}")
+        return None
+    if len(samples) < settings.TAILORING_HEDGE_MIN_SAMPLES:
+        return None
+    return sum(int(s) for s in samples) / len(samples)
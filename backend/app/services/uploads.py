@@ -0,0 +1,203 @@
+"""
+Streaming upload handling for resume files.
+
+The request body is consumed in fixed-size chunks; each chunk is hashed,
+counted and streamed into blob storage (app.services.storage) without
+blocking the event loop. Uploads are rejected as early as possible:
+
+  - ContentLengthLimitMiddleware refuses oversized requests from their
+    Content-Length header, before the multipart body is read at all, and
+    counts the body bytes as they arrive (chunked or undeclared bodies),
+    aborting with 413 as soon as the limit is passed, before Starlette
+    spools the rest of the multipart body
+  - save_upload enforces the per-file limit on the bytes actually stored
+    and checks the PDF magic bytes on the first chunk, discarding the
+    partial blob on rejection
+  - save_zip_entries applies the same per-file checks to each member of a
+    ZIP archive (bulk intake), skipping rejected members
+"""
+
+import hashlib
+import os
+import zipfile
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import anyio
+from fastapi import HTTPException, UploadFile
+from starlette.responses import JSONResponse
+
+from app.core.config import settings
+from app.services.storage import get_storage
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+PDF_MAGIC = b"%PDF-"
+ZIP_MAGIC = b"PK\x03\x04"
+
+# Room for the multipart boundary and the small form fields sent with the file
+_MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadRejected(Exception):
+    status_code = 400
+
+
+class UploadTooLargeError(UploadRejected):
+    status_code = 413
+
+
+class UnsupportedFileTypeError(UploadRejected):
+    status_code = 415
+
+
+@dataclass
+class StoredUpload:
+    key: str            # blob storage key
+    size: int
+    content_hash: str   # SHA-256 hex digest
+
+
+class _UploadDigest:
+    """Running size / magic-byte / SHA-256 checks over an upload's chunks."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.head = b""
+        self.sha256 = hashlib.sha256()
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLargeError(f"Upload exceeds {self.max_bytes} bytes")
+        if len(self.head) < len(PDF_MAGIC):
+            self.head += chunk[:len(PDF_MAGIC) - len(self.head)]
+            if len(self.head) == len(PDF_MAGIC) and self.head != PDF_MAGIC:
+                raise UnsupportedFileTypeError("Only PDF files are accepted")
+        self.sha256.update(chunk)
+
+    def finish(self, key: str) -> StoredUpload:
+        if self.head != PDF_MAGIC:
+            raise UnsupportedFileTypeError("Only PDF files are accepted")
+        return StoredUpload(key=key, size=self.size, content_hash=self.sha256.hexdigest())
+
+
+def _new_key(prefix: str) -> str:
+    # The client's extension is not trusted; only PDFs get past the magic check
+    return f"{prefix}/{uuid4()}.pdf"
+
+
+async def save_upload(file: UploadFile, prefix: str = "resumes", max_bytes: Optional[int] = None) -> StoredUpload:
+    """
+    Stream `file` into storage under a fresh key, hashing as it goes.
+    Raises UploadTooLargeError / UnsupportedFileTypeError.
+    """
+    key = _new_key(prefix)
+    digest = _UploadDigest(max_bytes or settings.RESUME_MAX_UPLOAD_BYTES)
+
+    async with get_storage().writer(key) as blob:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            await blob.write(chunk)
+        stored = digest.finish(key)
+    return stored
+
+
+async def save_zip_entries(
+    archive: BinaryIO,
+    prefix: str = "resumes",
+    max_bytes: Optional[int] = None,
+    max_files: Optional[int] = None,
+) -> Tuple[List[Tuple[str, StoredUpload]], List[Dict[str, str]]]:
+    """
+    Store every PDF member of a ZIP archive, streaming each one through the
+    same checks as save_upload (archive reads run in a worker thread).
+    Returns ([(member name, stored)], [{filename, reason}]).
+    """
+    max_bytes = max_bytes or settings.RESUME_MAX_UPLOAD_BYTES
+    max_files = max_files or settings.RESUME_BULK_MAX_FILES
+    storage = get_storage()
+    stored: List[Tuple[str, StoredUpload]] = []
+    rejected: List[Dict[str, str]] = []
+
+    try:
+        zf = await anyio.to_thread.run_sync(zipfile.ZipFile, archive)
+    except zipfile.BadZipFile as e:
+        raise UnsupportedFileTypeError(f"Invalid ZIP archive: {e}")
+
+    with zf:
+        members = [m for m in zf.infolist()
+                   if not m.is_dir() and not os.path.basename(m.filename).startswith(".")
+                   and not m.filename.startswith("__MACOSX/")]
+        if len(members) > max_files:
+            raise UploadTooLargeError(f"Archive has {len(members)} files; limit is {max_files}")
+
+        for member in members:
+            # The declared size is only a first check; compressed sizes can lie
+            if member.file_size > max_bytes:
+                rejected.append({"filename": member.filename, "reason": f"exceeds {max_bytes} bytes"})
+                continue
+            key = _new_key(prefix)
+            digest = _UploadDigest(max_bytes)
+            try:
+                with zf.open(member) as src:
+                    async with storage.writer(key) as blob:
+                        while chunk := await anyio.to_thread.run_sync(src.read, UPLOAD_CHUNK_SIZE):
+                            digest.update(chunk)
+                            await blob.write(chunk)
+                        upload = digest.finish(key)
+                stored.append((member.filename, upload))
+            except (UploadRejected, zipfile.BadZipFile, OSError) as e:
+                rejected.append({"filename": member.filename, "reason": str(e)})
+
+    return stored, rejected
+
+
+class ContentLengthLimitMiddleware:
+    """
+    Pure ASGI middleware answering 413 for POSTs whose body exceeds the
+    limit of the longest matching path prefix: at once when the declared
+    Content-Length is too large, otherwise as soon as the bytes received
+    pass the limit (the HTTPException raised from `receive` aborts body
+    parsing and is rendered by the app's exception handling).
+    """
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = sorted(limits.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def _limit_for(self, path: str) -> Optional[int]:
+        for prefix, limit in self.limits:
+            if path.startswith(prefix):
+                return limit
+        return None
+
+    async def __call__(self, scope, receive, send):
+        limit = None
+        if scope["type"] == "http" and scope["method"] == "POST":
+            limit = self._limit_for(scope["path"])
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = limit + _MULTIPART_OVERHEAD
+        detail = f"Upload exceeds {limit} bytes"
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > allowed:
+                response = JSONResponse({"detail": detail}, status_code=413)
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > allowed:
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -5,15 +5,25 @@ celery_app = Celery(
     "worker",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=["app.workers.scoring", "app.workers.parsing", "app.workers.tailoring"]
+    include=[
+        "app.workers.ingestion", "app.workers.replay", "app.workers.scoring",
+        "app.workers.parsing", "app.workers.tailoring",
+    ]
 )
 
 celery_app.conf.task_routes = {
     "app.workers.ingestion.fetch_jobs_task": "main-queue",
+    "app.workers.ingestion.deactivate_stale_jobs_task": "main-queue",
+    "app.workers.replay.replay_raw_posts_task": "main-queue",
+    "app.workers.replay.replay_partition_task": "main-queue",
     "app.workers.scoring.score_job_task": "main-queue",
     "app.workers.scoring.score_all_jobs_task": "main-queue",
+    "app.workers.scoring.flush_scoring_queue_task": "main-queue",
+    "app.workers.scoring.sweep_scoring_queue_task": "main-queue",
     "app.workers.parsing.parse_resume_task": "main-queue",
+    "app.workers.parsing.parse_resume_batch_task": "main-queue",
     "app.workers.tailoring.tailor_resume_task": "main-queue",
+    "app.workers.tailoring.tailor_resume_batch_task": "main-queue",
 }
 
 celery_app.conf.update(
@@ -23,3 +33,14 @@ celery_app.conf.update(
     timezone="UTC",
     enable_utc=True,
 )
+
+celery_app.conf.beat_schedule = {
+    "deactivate-stale-jobs": {
+        "task": "app.workers.ingestion.deactivate_stale_jobs_task",
+        "schedule": settings.JOB_STALE_SWEEP_INTERVAL_MINUTES * 60,
+    },
+    "sweep-scoring-queue": {
+        "task": "app.workers.scoring.sweep_scoring_queue_task",
+        "schedule": settings.SCORING_SWEEP_INTERVAL_SECONDS,
+    },
+}
@@ -1,30 +1,45 @@
 import asyncio
 import hashlib
-from datetime import datetime
-from typing import Dict, Any, List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional
+from uuid import UUID
+from sqlalchemy import and_, or_, update, delete
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.workers.celery_app import celery_app
 from app.db.session import AsyncSessionLocal
 from app.db.mongodb import mongo_db
+from app.services.scraper.base import BaseScraper
 from app.services.scraper.recursive_scraper import RecursiveScraper
 from app.models.job import Job
 from app.models.company import Company
 from app.models.job_source import JobSource
+from app.models.job_signature import JobSignatureBucket
+from app.models.skills import JobSkill
 from app.schemas.job import JobCreate
+from app.core.config import settings
+from app.services.skills.extraction import match_skill_keywords
+from app.services.tailoring.digest import build_requirement_digest
+from app.services.dedup.simhash import (
+    simhash, hamming_distance, lsh_bands, to_signed64, from_signed64,
+)
 
-async def save_raw_job_to_mongo(raw_job: Dict[str, Any], source: str):
-    # Ensure connection
+INGEST_BATCH_SIZE = 500
+
+async def save_raw_jobs_to_mongo(raw_jobs: List[Dict[str, Any]], sources: List[str], scraper: str):
+    if not raw_jobs:
+        return
     if not mongo_db.client:
         mongo_db.connect()
-    
-    db = mongo_db.db
-    await db.raw_job_posts.insert_one({
-        "source": source,
-        "scraped_at": datetime.utcnow(),
-        "raw_data": raw_job
-    })
+
+    scraped_at = datetime.utcnow()
+    await mongo_db.db.raw_job_posts.insert_many([
+        # `scraper` lets replays pick the matching normalize_job
+        {"source": source, "scraper": scraper, "scraped_at": scraped_at, "raw_data": raw_job}
+        for raw_job, source in zip(raw_jobs, sources)
+    ], ordered=False)
 
 async def get_or_create_company(session: AsyncSession, name: str) -> Company:
     result = await session.execute(select(Company).filter(Company.name == name))
@@ -48,74 +63,290 @@ def generate_job_hash(title: str, company_name: str, location: str) -> str:
     s = f"{title.lower()}|{company_name.lower()}|{location.lower()}"
     return hashlib.md5(s.encode()).hexdigest()
 
-async def ingest_job(session: AsyncSession, job_data: JobCreate):
-    # Check deduplication
-    job_hash = generate_job_hash(job_data.title, job_data.company_name, job_data.location)
-    
-    # We use a simplified check here. In production, we might want to update existing jobs.
-    existing = await session.execute(select(Job).filter(Job.job_hash == job_hash))
-    if existing.scalars().first():
-        # print(f"Skipping duplicate job: {job_data.title} at {job_data.company_name}")
-        return
+async def find_canonical_job(session: AsyncSession, signature: int, company_id: UUID) -> Optional[UUID]:
+    """
+    Look up a canonical job at the same company whose description SimHash is
+    within DEDUP_SIMHASH_MAX_DISTANCE of `signature`.
+    Candidates come from the LSH bucket index, never a full scan. The company
+    guard keeps templated descriptions shared by different employers apart.
+    """
+    bucket_match = or_(*[
+        and_(JobSignatureBucket.band == band, JobSignatureBucket.bucket == bucket)
+        for band, bucket in lsh_bands(signature)
+    ])
+    result = await session.execute(
+        select(Job.id, Job.simhash)
+        .join(JobSignatureBucket, JobSignatureBucket.job_id == Job.id)
+        .filter(bucket_match, Job.company_id == company_id)
+        .distinct()
+    )
+
+    best_id, best_distance = None, settings.DEDUP_SIMHASH_MAX_DISTANCE + 1
+    for job_id, candidate in result.all():
+        if candidate is None:
+            continue
+        distance = hamming_distance(signature, from_signed64(candidate))
+        if distance < best_distance:
+            best_id, best_distance = job_id, distance
+    return best_id
+
+def generate_content_hash(job_data: JobCreate) -> str:
+    """
+    Hash of the fields a re-crawl can change for the same posting.
+    external_id and posted_at are excluded: sources reissue them on every crawl.
+    """
+    s = "|".join([
+        (job_data.description_text or "").strip(),
+        str(job_data.salary_min or ""),
+        str(job_data.salary_max or ""),
+        job_data.currency or "",
+    ])
+    return hashlib.sha256(s.encode()).hexdigest()
+
+def tag_job_skills(title: Optional[str], description: Optional[str]) -> List[str]:
+    """Keyword skills found in a job's title + description."""
+    return match_skill_keywords(f"{title or ''} {description or ''}")
+
+def _signature_buckets(signature: int) -> List[JobSignatureBucket]:
+    return [JobSignatureBucket(band=band, bucket=bucket) for band, bucket in lsh_bands(signature)]
 
-    company = await get_or_create_company(session, job_data.company_name)
-    source = await get_or_create_source(session, job_data.source_name)
-
-    new_job = Job(
-        title=job_data.title,
-        company_id=company.id,
-        source_id=source.id,
-        external_id=job_data.external_id,
-        location=job_data.location,
-        description_text=job_data.description_text,
-        salary_min=job_data.salary_min,
-        salary_max=job_data.salary_max,
-        currency=job_data.currency,
-        posted_at=job_data.posted_at.replace(tzinfo=None) if job_data.posted_at else datetime.utcnow(), # Ensure naive/utc match
-        job_hash=job_hash
+async def ingest_jobs(
+    session: AsyncSession,
+    jobs: List[JobCreate],
+    seen_at: Optional[datetime] = None,
+) -> Dict[str, int]:
+    """
+    Bulk upsert a batch of normalized jobs.
+
+    - Unseen job_hash    → insert (with near-duplicate linking), tag skills
+                           and build the requirement digest
+    - Same content_hash  → touch last_seen_at / is_active only (one UPDATE)
+    - Changed content    → update in place, re-tag skills, rebuild the digest
+
+    Sighting a near-duplicate also touches its canonical job's last_seen_at,
+    so the stale sweep keeps the canonical (the only copy scoring reads)
+    active while any copy is still being crawled.
+
+    `seen_at` defaults to now; replays pass the original crawl time so an
+    older post never overwrites newer content or revives a stale job.
+
+    Returns counts per outcome.
+    """
+    now = seen_at or datetime.now(timezone.utc)
+    active = now >= datetime.now(timezone.utc) - timedelta(hours=settings.JOB_STALE_AFTER_HOURS)
+    stats = {"inserted": 0, "updated": 0, "unchanged": 0, "near_duplicates": 0}
+
+    # Last occurrence wins if a batch repeats the same posting
+    by_hash: Dict[str, JobCreate] = {}
+    for job_data in jobs:
+        by_hash[generate_job_hash(job_data.title, job_data.company_name, job_data.location or "")] = job_data
+    if not by_hash:
+        return stats
+
+    existing_result = await session.execute(
+        select(Job.id, Job.job_hash, Job.content_hash, Job.canonical_job_id, Job.last_seen_at)
+        .filter(Job.job_hash.in_(list(by_hash)))
     )
-    session.add(new_job)
-    await session.commit()
-    await session.refresh(new_job)
+    existing = {row.job_hash: row for row in existing_result.all()}
+
+    # Sightings older than what is stored carry no new information
+    outdated = [h for h, row in existing.items() if row.last_seen_at and now < row.last_seen_at]
+    for job_hash in outdated:
+        del existing[job_hash]
+        del by_hash[job_hash]
+    stats["unchanged"] = len(outdated)
+
+    # Canonicals of near-duplicates sighted in this batch
+    seen_canonical_ids = {row.canonical_job_id for row in existing.values() if row.canonical_job_id}
+
+    # 1. Unchanged: a single bulk touch
+    unchanged_ids = [
+        row.id for job_hash, row in existing.items()
+        if row.content_hash == generate_content_hash(by_hash[job_hash])
+    ]
+    if unchanged_ids:
+        touch = {"last_seen_at": now}
+        if active:
+            touch["is_active"] = True
+        await session.execute(
+            update(Job)
+            .where(Job.id.in_(unchanged_ids))
+            .values(**touch)
+            .execution_options(synchronize_session=False)
+        )
+        stats["unchanged"] += len(unchanged_ids)
+
+    # 2. Changed: update in place, re-tag skills, refresh LSH buckets and digest
+    changed = [
+        (row, by_hash[job_hash]) for job_hash, row in existing.items()
+        if row.content_hash != generate_content_hash(by_hash[job_hash])
+    ]
+    if changed:
+        changed_ids = [row.id for row, _ in changed]
+        await session.execute(delete(JobSkill).where(JobSkill.job_id.in_(changed_ids)))
+        await session.execute(delete(JobSignatureBucket).where(JobSignatureBucket.job_id.in_(changed_ids)))
+
+        updates = []
+        for row, job_data in changed:
+            signature = simhash(job_data.description_text)
+            updates.append({
+                "id": row.id,
+                "description_text": job_data.description_text,
+                "requirement_digest": build_requirement_digest(job_data.title, job_data.description_text),
+                "salary_min": job_data.salary_min,
+                "salary_max": job_data.salary_max,
+                "currency": job_data.currency,
+                "content_hash": generate_content_hash(job_data),
+                "simhash": to_signed64(signature) if signature is not None else None,
+                "last_seen_at": now,
+                "is_active": active,
+            })
+            if signature is not None and row.canonical_job_id is None:
+                for bucket in _signature_buckets(signature):
+                    bucket.job_id = row.id
+                    session.add(bucket)
+            for skill in tag_job_skills(job_data.title, job_data.description_text):
+                session.add(JobSkill(job_id=row.id, skill_name=skill, weight=1.0))
+        await session.execute(update(Job), updates)
+        stats["updated"] = len(changed)
+
+    # 3. New: insert, linking near-duplicates to their canonical job
+    companies: Dict[str, Company] = {}
+    sources: Dict[str, JobSource] = {}
+    for job_hash, job_data in by_hash.items():
+        if job_hash in existing:
+            continue
+
+        if job_data.company_name not in companies:
+            companies[job_data.company_name] = await get_or_create_company(session, job_data.company_name)
+        if job_data.source_name not in sources:
+            sources[job_data.source_name] = await get_or_create_source(session, job_data.source_name)
+        company = companies[job_data.company_name]
+        source = sources[job_data.source_name]
+
+        # Near-duplicate check: syndicated copies link to the canonical job
+        signature = simhash(job_data.description_text)
+        canonical_job_id = None
+        if signature is not None:
+            canonical_job_id = await find_canonical_job(session, signature, company.id)
+
+        new_job = Job(
+            title=job_data.title,
+            company_id=company.id,
+            source_id=source.id,
+            external_id=job_data.external_id,
+            location=job_data.location,
+            description_text=job_data.description_text,
+            requirement_digest=build_requirement_digest(job_data.title, job_data.description_text),
+            salary_min=job_data.salary_min,
+            salary_max=job_data.salary_max,
+            currency=job_data.currency,
+            posted_at=job_data.posted_at.replace(tzinfo=None) if job_data.posted_at else datetime.utcnow(), # Ensure naive/utc match
+            job_hash=job_hash,
+            content_hash=generate_content_hash(job_data),
+            last_seen_at=now,
+            is_active=active,
+            simhash=to_signed64(signature) if signature is not None else None,
+            canonical_job_id=canonical_job_id,
+        )
+        if signature is not None and canonical_job_id is None:
+            # Only canonical jobs are indexed for future candidate lookups
+            new_job.signature_buckets = _signature_buckets(signature)
+        new_job.skills = [
+            JobSkill(skill_name=skill, weight=1.0)
+            for skill in tag_job_skills(job_data.title, job_data.description_text)
+        ]
+        session.add(new_job)
+        # Flush so later jobs in this batch can match against this one's buckets
+        await session.flush()
+
+        stats["inserted"] += 1
+        if canonical_job_id:
+            stats["near_duplicates"] += 1
+            seen_canonical_ids.add(canonical_job_id)
+            print(f"Ingested Job: {new_job.title} from {job_data.source_name} (near-duplicate of {canonical_job_id})")
+        else:
+            print(f"Ingested Job: {new_job.title} from {job_data.source_name}")
+
+    # 4. Canonicals of sighted near-duplicates: touch (never backwards)
+    if seen_canonical_ids:
+        touch = {"last_seen_at": now}
+        if active:
+            touch["is_active"] = True
+        await session.execute(
+            update(Job)
+            .where(
+                Job.id.in_(list(seen_canonical_ids)),
+                or_(Job.last_seen_at.is_(None), Job.last_seen_at < now),
+            )
+            .values(**touch)
+            .execution_options(synchronize_session=False)
+        )
 
-    # Extract and Save Skills
-    import re
-    from app.core.constants import SKILL_KEYWORDS
-    from app.models.skills import JobSkill
-    
-    description_lower = job_data.description_text.lower() if job_data.description_text else ""
-    title_lower = job_data.title.lower() if job_data.title else ""
-    text_corpus = f"{title_lower} {description_lower}"
-
-    for skill in SKILL_KEYWORDS:
-        if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_corpus):
-             job_skill = JobSkill(
-                 job_id=new_job.id,
-                 skill_name=skill,
-                 weight=1.0 
-             )
-             session.add(job_skill)
-    
     await session.commit()
-    print(f"Ingested Job: {new_job.title} from {job_data.source_name}")
+    return stats
+
+async def ingest_job(session: AsyncSession, job_data: JobCreate) -> Dict[str, int]:
+    return await ingest_jobs(session, [job_data])
+
+async def deactivate_stale_jobs(stale_after_hours: Optional[int] = None) -> int:
+    """
+    Bulk-mark jobs not seen by any crawl within the window as inactive,
+    so batch scoring only scans the live market. A canonical job stays
+    active while any of its near-duplicates was seen within the window
+    (ingestion touches the canonical too; this also covers sightings
+    recorded before it did).
+    """
+    hours = stale_after_hours if stale_after_hours is not None else settings.JOB_STALE_AFTER_HOURS
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    duplicate = aliased(Job)
+    live_duplicate = (
+        select(duplicate.id)
+        .where(duplicate.canonical_job_id == Job.id, duplicate.last_seen_at >= cutoff)
+        .exists()
+    )
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            update(Job)
+            .where(Job.is_active == True, Job.last_seen_at < cutoff, ~live_duplicate)
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount
+
+def get_scraper() -> BaseScraper:
+    if settings.SCRAPER_HTTP_BASE_URL:
+        from app.services.scraper.http_scraper import HttpScraper
+        return HttpScraper(settings.SCRAPER_HTTP_BASE_URL)
+    return RecursiveScraper()
 
 async def process_ingestion(query: str, location: str):
-    scraper = RecursiveScraper()
+    scraper = get_scraper()
     # Fetch
     print(f"Fetching jobs for {query} in {location}...")
     raw_jobs = await scraper.fetch_jobs(query, location)
     print(f"Found {len(raw_jobs)} jobs.")
-    
+    if getattr(scraper, "metrics", None):
+        print(f"Fetch metrics: {scraper.metrics.as_dict()}")
+
+    # 1. Normalize
+    normalized_jobs = [scraper.normalize_job(raw) for raw in raw_jobs]
+
+    # 2. Save Raw to Mongo (using normalized source name)
+    await save_raw_jobs_to_mongo(
+        raw_jobs, [job.source_name for job in normalized_jobs], type(scraper).__name__
+    )
+
+    # 3. Upsert to Postgres in batches
+    totals: Dict[str, int] = {}
     async with AsyncSessionLocal() as session:
-        for raw in raw_jobs:
-            # 1. Normalize
-            normalized_job = scraper.normalize_job(raw)
-            
-            # 2. Save Raw to Mongo (using normalized source name)
-            await save_raw_job_to_mongo(raw, normalized_job.source_name)
-            
-            # 3. Save to Postgres
-            await ingest_job(session, normalized_job)
+        for i in range(0, len(normalized_jobs), INGEST_BATCH_SIZE):
+            stats = await ingest_jobs(session, normalized_jobs[i:i + INGEST_BATCH_SIZE])
+            for key, value in stats.items():
+                totals[key] = totals.get(key, 0) + value
+    print(f"Ingestion summary: {totals}")
+    return totals
 
 @celery_app.task
 def fetch_jobs_task(query: str, location: str):
@@ -130,5 +361,18 @@ def fetch_jobs_task(query: str, location: str):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
     
-    loop.run_until_complete(process_ingestion(query, location))
-    return f"Ingested jobs for {query} in {location}"
+    totals = loop.run_until_complete(process_ingestion(query, location))
+    return f"Ingested jobs for {query} in {location}: {totals}"
+
+@celery_app.task
+def deactivate_stale_jobs_task():
+    """
+    Scheduled (celery beat) sweep: deactivate jobs unseen for JOB_STALE_AFTER_HOURS.
+    """
+    loop = asyncio.get_event_loop()
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    count = loop.run_until_complete(deactivate_stale_jobs())
+    return f"Deactivated {count} stale jobs"
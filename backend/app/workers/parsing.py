@@ -3,14 +3,16 @@ from app.db.session import AsyncSessionLocal
 from app.models.resume import Resume
 from app.models.skills import ResumeSkill
 from sqlalchemy.future import select
-import pdfminer.high_level
+from app.services.parsing.pdf_extraction import extract_pdf_text
+from app.services.storage import get_storage
 import asyncio
 from uuid import UUID
-import re
-from app.core.constants import SKILL_KEYWORDS
+from app.services.parsing.document import build_parsed_document, skill_keyword_names
+from app.core.config import settings
+from typing import List
 
 
-async def parse_resume_async(resume_id: UUID):
+async def parse_resume_async(resume_id: UUID, trigger_scoring: bool = True):
     async with AsyncSessionLocal() as session:
         result = await session.execute(select(Resume).filter(Resume.id == resume_id))
         resume = result.scalars().first()
@@ -21,11 +23,14 @@ async def parse_resume_async(resume_id: UUID):
         # Update status to PARSING
         resume.status = "PARSING"
         resume.error_reason = None
+        resume.scored_at = None
         await session.commit()
         
         try:
-            # Extract Text
-            text = pdfminer.high_level.extract_text(resume.file_path)
+            # Extract Text (process pool with size/page/time limits) from a
+            # local copy of the stored document
+            async with get_storage().local_copy(resume.file_path) as path:
+                text = await extract_pdf_text(path)
             
             if not text or not text.strip():
                 raise ValueError("Extracted text is empty")
@@ -33,42 +38,36 @@ async def parse_resume_async(resume_id: UUID):
             resume.parsed_text = text
             resume.status = "PARSED"
             
-            # --- Basic Extraction Logic ---
-            
+            # --- Structured Extraction (stored once, reused downstream) ---
+            document = build_parsed_document(text)
+            resume.parsed_document = document
+            contacts = document["contacts"]
+
             # 1. Email Extraction
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-            if email_match:
-                resume.email = email_match.group(0)
+            if "email" in contacts:
+                resume.email = contacts["email"]["value"]
                 
             # 2. Phone Extraction
-            phone_match = re.search(r'(\+\d{1,3}[-.]?)?\(?\d{3}\)?[-.]?\d{3}[-.]?\d{4}', text)
-            if phone_match:
-                resume.phone = phone_match.group(0)
+            if "phone" in contacts:
+                resume.phone = contacts["phone"]["value"]
 
             # 3. Name Extraction
-            lines = [line.strip() for line in text.split('\n') if line.strip()]
-            if lines:
-                potential_name = lines[0]
-                if len(potential_name) < 50:
-                    resume.candidate_name = potential_name.title()
+            if "name" in contacts:
+                resume.candidate_name = contacts["name"]["value"].title()
             
             # 4. Image Extraction (Simplified for brevity, assuming previous implementation works or skipped)
             # ... (Image extraction logic can remain if needed, but omitted here to focus on skills)
 
             # 5. Skill Extraction
-            extracted_skills = []
-            text_lower = text.lower()
-            for skill in SKILL_KEYWORDS:
-                # Use regex boundry to avoid partial matches (e.g. "Go" in "Good")
-                if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-                    extracted_skills.append(skill)
-                    # Persist to ResumeSkill table
-                    resume_skill = ResumeSkill(
-                        resume_id=resume.id,
-                        skill_name=skill,
-                        proficiency=1.0 # Default
-                    )
-                    session.add(resume_skill)
+            extracted_skills = skill_keyword_names(document)
+            for skill in extracted_skills:
+                # Persist to ResumeSkill table
+                resume_skill = ResumeSkill(
+                    resume_id=resume.id,
+                    skill_name=skill,
+                    proficiency=1.0 # Default
+                )
+                session.add(resume_skill)
             
             # Ensure at least some skills are found (or handle empty)
             if not extracted_skills:
@@ -83,8 +82,10 @@ async def parse_resume_async(resume_id: UUID):
             
             # TRIGGER SCORING IF SKILLS EXIST
             if extracted_skills:
-                from app.workers.scoring import score_all_jobs_task
-                score_all_jobs_task.delay(str(resume.id))
+                if not trigger_scoring:
+                    return f"Parsed successfully. Extracted {len(extracted_skills)} skills."
+                from app.workers.scoring import request_scoring
+                await request_scoring(str(resume.id))
                 return f"Parsed successfully. Extracted {len(extracted_skills)} skills. Scoring triggered."
             else:
                 resume.status = "FAILED"
@@ -109,3 +110,41 @@ def parse_resume_task(resume_id_str: str):
         asyncio.set_event_loop(loop)
         
     return loop.run_until_complete(parse_resume_async(UUID(resume_id_str)))
+
+async def parse_resume_batch_async(resume_ids: List[UUID]):
+    """
+    Parse a chunk of bulk-uploaded resumes concurrently (bounded by the PDF
+    extraction workers), then queue every successfully parsed one for
+    coalesced scoring, so the chunks of a batch (and other uploads parsed
+    at the same time) are scored together.
+    """
+    semaphore = asyncio.Semaphore(settings.PDF_EXTRACTION_WORKERS)
+
+    async def parse_one(resume_id: UUID):
+        async with semaphore:
+            return await parse_resume_async(resume_id, trigger_scoring=False)
+
+    await asyncio.gather(*(parse_one(resume_id) for resume_id in resume_ids))
+
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Resume.id).filter(Resume.id.in_(resume_ids), Resume.status == "PARSED")
+        )
+        parsed_ids = [str(resume_id) for resume_id in result.scalars().all()]
+
+    from app.workers.scoring import request_scoring
+    for resume_id in parsed_ids:
+        await request_scoring(resume_id)
+    return f"Parsed {len(parsed_ids)}/{len(resume_ids)} resumes. Scoring triggered for {len(parsed_ids)}."
+
+@celery_app.task
+def parse_resume_batch_task(resume_id_strs: List[str]):
+    """
+    Celery task to parse one chunk of a bulk resume intake.
+    """
+    loop = asyncio.get_event_loop()
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(parse_resume_batch_async([UUID(r) for r in resume_id_strs]))
@@ -0,0 +1,274 @@
+"""
+Replay archived raw_job_posts (MongoDB) into Postgres.
+
+Streams raw posts by source and time range through the *current*
+normalize_job → ingest_jobs (bulk upsert) path, so changes to
+normalization, salary parsing or skill tagging can be backfilled without
+re-scraping.
+
+Work is split into contiguous _id ranges ($bucketAuto), one per partition,
+and each partition runs in its own process (Celery worker or local process
+pool). Partitions checkpoint their last processed _id in
+`replay_checkpoints`, so an interrupted run resumes where it stopped.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from itertools import groupby
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from sqlalchemy.exc import IntegrityError
+
+from app.workers.celery_app import celery_app
+from app.db.session import AsyncSessionLocal
+from app.db.mongodb import mongo_db
+from app.services.scraper.recursive_scraper import RecursiveScraper
+from app.services.scraper.http_scraper import HttpScraper
+from app.workers.ingestion import ingest_jobs
+
+REPLAY_BATCH_SIZE = 1000
+_UPSERT_RETRIES = 3
+
+# Raw posts record the scraper class that produced them; older posts
+# predate that field and came from RecursiveScraper.
+_SCRAPERS = {
+    "RecursiveScraper": RecursiveScraper,
+    "HttpScraper": HttpScraper,
+}
+_DEFAULT_SCRAPER = "RecursiveScraper"
+
+
+def _db():
+    # Each worker process owns its client (motor is not fork-safe)
+    if not mongo_db.client:
+        mongo_db.connect()
+    return mongo_db.db
+
+
+def build_query(source: Optional[str] = None, since: Optional[str] = None,
+                until: Optional[str] = None) -> Dict[str, Any]:
+    """Mongo filter for a source and [since, until) scraped_at window (ISO strings)."""
+    query: Dict[str, Any] = {}
+    if source:
+        query["source"] = source
+    window: Dict[str, Any] = {}
+    if since:
+        window["$gte"] = datetime.fromisoformat(since)
+    if until:
+        window["$lt"] = datetime.fromisoformat(until)
+    if window:
+        query["scraped_at"] = window
+    return query
+
+
+async def plan_partitions(query: Dict[str, Any], partitions: int) -> List[Dict[str, Optional[str]]]:
+    """
+    Split the matching posts into up to `partitions` contiguous _id ranges.
+    Ranges are [lower, upper); the last one is open-ended.
+    """
+    buckets = await _db().raw_job_posts.aggregate([
+        {"$match": query},
+        {"$project": {"_id": 1}},
+        {"$bucketAuto": {"groupBy": "$_id", "buckets": partitions}},
+    ], allowDiskUse=True).to_list(None)
+
+    ranges = []
+    for i, bucket in enumerate(buckets):
+        upper = buckets[i + 1]["_id"]["min"] if i + 1 < len(buckets) else None
+        ranges.append({
+            "lower": str(bucket["_id"]["min"]),
+            "upper": str(upper) if upper is not None else None,
+        })
+    return ranges
+
+
+def _normalize(doc: Dict[str, Any], scrapers: Dict[str, Any]):
+    name = doc.get("scraper") or _DEFAULT_SCRAPER
+    if name not in scrapers:
+        scrapers[name] = _SCRAPERS.get(name, _SCRAPERS[_DEFAULT_SCRAPER])()
+    return scrapers[name].normalize_job(doc["raw_data"])
+
+
+async def _upsert_batch(docs: List[Dict[str, Any]], scrapers: Dict[str, Any],
+                        totals: Dict[str, int]) -> None:
+    # One ingest_jobs call per crawl timestamp keeps last_seen_at faithful
+    docs = sorted(docs, key=lambda d: d["scraped_at"])
+    for scraped_at, group in groupby(docs, key=lambda d: d["scraped_at"]):
+        jobs = []
+        for doc in group:
+            try:
+                jobs.append(_normalize(doc, scrapers))
+            except Exception as e:
+                totals["failed"] = totals.get("failed", 0) + 1
+                print(f"Replay: skipping raw post {doc['_id']}: {e}")
+
+        seen_at = scraped_at.replace(tzinfo=timezone.utc) if scraped_at.tzinfo is None else scraped_at
+        for attempt in range(_UPSERT_RETRIES):
+            # Parallel partitions can race on the same new job_hash/company;
+            # the retry sees the committed row and takes the update path.
+            async with AsyncSessionLocal() as session:
+                try:
+                    stats = await ingest_jobs(session, jobs, seen_at=seen_at)
+                    break
+                except IntegrityError:
+                    await session.rollback()
+                    if attempt == _UPSERT_RETRIES - 1:
+                        raise
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+
+
+async def replay_partition(
+    run_id: str,
+    index: int,
+    lower: str,
+    upper: Optional[str],
+    source: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    batch_size: int = REPLAY_BATCH_SIZE,
+) -> Dict[str, Any]:
+    """Replay one _id range, resuming from its checkpoint if present."""
+    db = _db()
+    checkpoint_id = f"{run_id}:{index}"
+    checkpoint = await db.replay_checkpoints.find_one({"_id": checkpoint_id}) or {}
+    if checkpoint.get("done"):
+        return {"partition": index, "processed": checkpoint.get("processed", 0), "resumed": True}
+
+    id_range: Dict[str, Any] = {"$gte": ObjectId(lower)}
+    if checkpoint.get("last_id"):
+        id_range = {"$gt": ObjectId(checkpoint["last_id"])}
+    if upper:
+        id_range["$lt"] = ObjectId(upper)
+
+    cursor = (
+        db.raw_job_posts.find({**build_query(source, since, until), "_id": id_range})
+        .sort("_id", 1)
+        .batch_size(batch_size)
+    )
+
+    processed = checkpoint.get("processed", 0)
+    totals: Dict[str, int] = dict(checkpoint.get("stats", {}))
+    scrapers: Dict[str, Any] = {}
+    started = time.perf_counter()
+    replayed = 0
+    batch: List[Dict[str, Any]] = []
+
+    async def flush():
+        nonlocal processed, replayed, batch
+        await _upsert_batch(batch, scrapers, totals)
+        processed += len(batch)
+        replayed += len(batch)
+        await db.replay_checkpoints.update_one(
+            {"_id": checkpoint_id},
+            {"$set": {
+                "run_id": run_id, "partition": index, "lower": lower, "upper": upper,
+                "last_id": str(batch[-1]["_id"]), "processed": processed, "stats": totals,
+                "updated_at": datetime.utcnow(),
+            }},
+            upsert=True,
+        )
+        batch = []
+
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            await flush()
+    if batch:
+        await flush()
+
+    elapsed = time.perf_counter() - started
+    await db.replay_checkpoints.update_one(
+        {"_id": checkpoint_id},
+        {"$set": {"run_id": run_id, "partition": index, "done": True, "processed": processed,
+                  "stats": totals, "updated_at": datetime.utcnow()}},
+        upsert=True,
+    )
+    rate = replayed / elapsed if elapsed > 0 else 0.0
+    print(f"Replay {run_id} partition {index}: {replayed} posts in {elapsed:.1f}s ({rate:.0f}/s) {totals}")
+    return {
+        "partition": index,
+        "processed": processed,
+        "replayed": replayed,
+        "elapsed_seconds": round(elapsed, 2),
+        "posts_per_second": round(rate, 1),
+        "stats": totals,
+    }
+
+
+async def prepare_run(run_id: str, query: Dict[str, Any], partitions: int) -> List[Dict[str, Any]]:
+    """
+    Return the partition ranges for a run. A new run is planned and its
+    ranges persisted up front; resuming a run reuses the stored ranges so
+    checkpoints stay valid even if new posts arrived meanwhile.
+    """
+    db = _db()
+    stored = await db.replay_checkpoints.find({"run_id": run_id}).sort("partition", 1).to_list(None)
+    if stored:
+        return [{"lower": cp["lower"], "upper": cp.get("upper")} for cp in stored]
+
+    ranges = await plan_partitions(query, partitions)
+    for i, r in enumerate(ranges):
+        await db.replay_checkpoints.update_one(
+            {"_id": f"{run_id}:{i}"},
+            {"$setOnInsert": {"run_id": run_id, "partition": i, "lower": r["lower"],
+                              "upper": r["upper"], "processed": 0, "stats": {}}},
+            upsert=True,
+        )
+    return ranges
+
+
+async def replay_progress(run_id: str) -> Dict[str, Any]:
+    """Aggregate checkpoint state for a run (processed posts, finished partitions)."""
+    checkpoints = await _db().replay_checkpoints.find({"run_id": run_id}).to_list(None)
+    totals: Dict[str, int] = {}
+    for cp in checkpoints:
+        for key, value in cp.get("stats", {}).items():
+            totals[key] = totals.get(key, 0) + value
+    return {
+        "run_id": run_id,
+        "partitions": len(checkpoints),
+        "partitions_done": sum(1 for cp in checkpoints if cp.get("done")),
+        "processed": sum(cp.get("processed", 0) for cp in checkpoints),
+        "stats": totals,
+    }
+
+
+def _run(coro):
+    loop = asyncio.get_event_loop()
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
+@celery_app.task
+def replay_partition_task(run_id: str, index: int, lower: str, upper: Optional[str],
+                          source: Optional[str] = None, since: Optional[str] = None,
+                          until: Optional[str] = None, batch_size: int = REPLAY_BATCH_SIZE):
+    """
+    Celery task: replay one partition. Re-sending it resumes from its checkpoint.
+    """
+    return _run(replay_partition(run_id, index, lower, upper, source, since, until, batch_size))
+
+
+@celery_app.task
+def replay_raw_posts_task(source: Optional[str] = None, since: Optional[str] = None,
+                          until: Optional[str] = None, partitions: int = 8,
+                          run_id: Optional[str] = None, batch_size: int = REPLAY_BATCH_SIZE):
+    """
+    Celery task: plan partitions and fan them out across workers.
+    Pass an existing run_id to resume an interrupted replay.
+    """
+    from celery import group
+
+    run_id = run_id or uuid.uuid4().hex
+    ranges = _run(prepare_run(run_id, build_query(source, since, until), partitions))
+    group(
+        replay_partition_task.s(run_id, i, r["lower"], r["upper"], source, since, until, batch_size)
+        for i, r in enumerate(ranges)
+    ).apply_async()
+    return {"run_id": run_id, "partitions": len(ranges)}
@@ -1,20 +1,31 @@
 from app.workers.celery_app import celery_app
+from app.core.config import settings
 from app.db.session import AsyncSessionLocal
 from app.models.job import Job
+from app.models.load_profiles import JOB_TEXT, RESUME_ANALYSIS
 from app.models.resume import Resume
 from app.models.score import ATSScore
 from app.services.scoring.ats_logic import score_resume
+from app.services.parsing.document import resume_profile
+from app.services.scoring.matrix import SkillMatrix
+from app.models.skills import JobSkill
+from sqlalchemy import delete, func, insert, update
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 import asyncio
-from uuid import UUID
+import time
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Set
+from uuid import UUID, uuid4
 
 async def perform_scoring(job_id: UUID, resume_id: UUID):
     async with AsyncSessionLocal() as session:
         # Fetch Job and Resume
-        job_result = await session.execute(select(Job).filter(Job.id == job_id))
+        job_result = await session.execute(select(Job).options(*JOB_TEXT).filter(Job.id == job_id))
         job = job_result.scalars().first()
         
-        resume_result = await session.execute(select(Resume).filter(Resume.id == resume_id))
+        resume_result = await session.execute(
+            select(Resume).options(*RESUME_ANALYSIS).filter(Resume.id == resume_id)
+        )
         resume = resume_result.scalars().first()
         
         if not job or not resume:
@@ -28,7 +39,9 @@ async def perform_scoring(job_id: UUID, resume_id: UUID):
         job_text = f"{job.title}\n{job.description_text}"
         resume_text = resume.parsed_text or ""
         
-        scores = calculate_ats_score(job_text, resume_text)
+        scores = calculate_ats_score(
+            job_text, resume_text, resume_profile(resume.parsed_document, resume.parsed_text)
+        )
         
         # Save Score
         # Update ATSScore model fields if needed, for now mapping new outputs to existing schema
@@ -63,73 +76,44 @@ def score_job_task(job_id_str: str, resume_id_str: str):
         
     return loop.run_until_complete(perform_scoring(UUID(job_id_str), UUID(resume_id_str)))
 
-async def perform_batch_scoring(resume_id: UUID):
-    from sqlalchemy import delete
-    from sqlalchemy.orm import selectinload
-    
-    async with AsyncSessionLocal() as session:
-        # 1. Fetch Resume with Skills
-        resume_result = await session.execute(
-            select(Resume).options(selectinload(Resume.skills)).filter(Resume.id == resume_id)
-        )
-        resume = resume_result.scalars().first()
-        if not resume:
-            return "Resume not found"
-            
-        resume_skill_set = {s.skill_name.lower() for s in resume.skills}
+class ScorableJob(NamedTuple):
+    id: UUID
+    skills: Set[str]          # lowercased skill names
+    text: Optional[str]       # title + description, only for legacy jobs without skills
 
-        # 2. Fetch All Active Jobs with Skills
-        # Eager load skills to avoid N+1 query problem
-        jobs_result = await session.execute(
-            select(Job).options(selectinload(Job.skills)).filter(Job.is_active == True)
-        )
-        jobs = jobs_result.scalars().all()
-        
-        if not jobs:
-            return "No active jobs found"
+def build_score_rows(resumes: List[Resume], jobs: List[ScorableJob],
+                     profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    ATSScore rows for a block of resumes (skills loaded) against jobs.
+    Skill-based scores for the whole block come from one matrix product;
+    legacy jobs without skills are text-scored per pair using the
+    resume's parse-time profile.
+    """
+    matrix = SkillMatrix([job.skills for job in jobs])
+    resume_rows = matrix.encode([{s.skill_name.lower() for s in r.skills} for r in resumes])
+    scores = matrix.scores(resume_rows)
+    rows = []
 
-        # 3. Clear existing scores for this resume (Fresh Analysis)
-        await session.execute(delete(ATSScore).where(ATSScore.resume_id == resume_id))
-        
-        # 4. Score Each Job
-        count = 0
-        
-        for job in jobs:
-            job_skill_set = {s.skill_name.lower() for s in job.skills}
-            
-            # Simple Intersection Matching
-            matched_skills = resume_skill_set.intersection(job_skill_set)
-            missing_skills = job_skill_set - resume_skill_set
-            
-            # Calculate Score
-            if not job_skill_set:
-                # If job has no specific skills required, checking text match or default
-                # For now, if no skills defined, we might give a base score or 0
-                # Let's fallback to a text-based match if DB skills are empty (legacy jobs)
-                 from app.services.ats.scorer import calculate_ats_score
-                 job_text = f"{job.title}\n{job.description_text}"
-                 resume_text = resume.parsed_text or ""
-                 legacy_scores = calculate_ats_score(job_text, resume_text)
-                 overall_score = legacy_scores["overall_score"]
-                 final_matched = legacy_scores["matched_skills"]
-                 final_missing = legacy_scores["missing_skills"]
-                 kw_score = legacy_scores["breakdown"]["keyword_match"]
-                 sem_score = legacy_scores["breakdown"]["skill_match"]
+    for i, resume in enumerate(resumes):
+        for j, job in enumerate(jobs):
+            if not job.skills:
+                # Fallback to a text-based match if DB skills are empty (legacy jobs)
+                from app.services.ats.scorer import calculate_ats_score
+                legacy_scores = calculate_ats_score(job.text or "", resume.parsed_text or "", profiles[i])
+                overall_score = legacy_scores["overall_score"]
+                final_matched = legacy_scores["matched_skills"]
+                final_missing = legacy_scores["missing_skills"]
+                kw_score = legacy_scores["breakdown"]["keyword_match"]
+                sem_score = legacy_scores["breakdown"]["skill_match"]
             else:
-                match_count = len(matched_skills)
-                total_required = len(job_skill_set)
-                
                 # Formula: (Matches / Total) * 100
                 # weighted logic can be added later using skill.weight
-                raw_score = (match_count / total_required) * 100
-                overall_score = round(raw_score, 1)
-                
-                final_matched = list(matched_skills)
-                final_missing = list(missing_skills)
+                overall_score = float(scores[i, j])
+                final_matched, final_missing = matrix.split(resume_rows[i], j)
                 kw_score = overall_score # Simplified for now
                 sem_score = overall_score # Simplified for now
 
-            ats_score = ATSScore(
+            rows.append(dict(
                 resume_id=resume.id,
                 job_id=job.id,
                 overall_score=overall_score,
@@ -137,13 +121,84 @@ async def perform_batch_scoring(resume_id: UUID):
                 semantic_score=sem_score,
                 matched_keywords=final_matched,
                 missing_keywords=final_missing,
-                insights=f"Match: {overall_score}%. Found: {len(final_matched)}/{len(job_skill_set) if job_skill_set else 'Text'} skills."
+                insights=f"Match: {overall_score}%. Found: {len(final_matched)}/{len(job.skills) if job.skills else 'Text'} skills."
+            ))
+    return rows
+
+async def iter_scorable_jobs(session, partition_size: Optional[int] = None) -> AsyncIterator[List[ScorableJob]]:
+    """
+    Stream active canonical jobs (near-duplicates are scored through their
+    canonical job) as (id, skill names) in fixed-size partitions over a
+    server-side cursor, so memory stays flat regardless of corpus size.
+    Title/description are fetched per partition only for legacy jobs
+    without skills.
+    """
+    partition_size = partition_size or settings.SCORING_JOB_PARTITION_SIZE
+    result = await session.stream(
+        select(Job.id, func.array_agg(JobSkill.skill_name).filter(JobSkill.skill_name.is_not(None)))
+        .outerjoin(JobSkill, JobSkill.job_id == Job.id)
+        .filter(Job.is_active == True, Job.canonical_job_id.is_(None))
+        .group_by(Job.id)
+        .execution_options(yield_per=partition_size)
+    )
+    async for partition in result.partitions():
+        jobs = [ScorableJob(job_id, {s.lower() for s in skills or ()}, None) for job_id, skills in partition]
+
+        legacy_ids = [job.id for job in jobs if not job.skills]
+        if legacy_ids:
+            texts_result = await session.execute(
+                select(Job.id, Job.title, Job.description_text).filter(Job.id.in_(legacy_ids))
             )
-            session.add(ats_score)
-            count += 1
-            
+            texts = {job_id: f"{title}\n{description}" for job_id, title, description in texts_result}
+            jobs = [job._replace(text=texts.get(job.id)) if not job.skills else job for job in jobs]
+        yield jobs
+
+async def perform_batch_scoring(resume_id: UUID):
+    return await perform_multi_resume_scoring([resume_id])
+
+async def perform_multi_resume_scoring(resume_ids: List[UUID]):
+    """
+    Score several resumes against all active canonical jobs. The job corpus
+    is streamed once in partitions; each partition is scored as one block
+    and its rows bulk inserted before the next is read.
+    """
+    async with AsyncSessionLocal() as session:
+        # 1. Fetch Resumes with Skills
+        resume_result = await session.execute(
+            select(Resume)
+            .options(selectinload(Resume.skills), *RESUME_ANALYSIS)
+            .filter(Resume.id.in_(resume_ids))
+        )
+        resumes = resume_result.scalars().all()
+        if not resumes:
+            return "Resume not found"
+        # Parse-time analysis of each resume, reused for every legacy (text-scored) job
+        profiles = [resume_profile(r.parsed_document, r.parsed_text) for r in resumes]
+
+        # 2. Stream Active Canonical Jobs, scoring each partition as it arrives
+        job_count = 0
+        async for jobs in iter_scorable_jobs(session):
+            if not job_count:
+                # 3. Clear existing scores for these resumes (Fresh Analysis)
+                await session.execute(delete(ATSScore).where(ATSScore.resume_id.in_([r.id for r in resumes])))
+            job_count += len(jobs)
+
+            # 4. Score the resume × job block
+            rows = build_score_rows(resumes, jobs, profiles)
+            if rows:
+                await session.execute(insert(ATSScore), rows)
+
+        # Scoring finished for these resumes, even with no jobs to score against
+        await session.execute(
+            update(Resume).where(Resume.id.in_([r.id for r in resumes])).values(scored_at=func.now())
+        )
         await session.commit()
-        return f"Batch Scored {count} jobs for Resume {resume_id}"
+        if not job_count:
+            return "No active jobs found"
+
+        if len(resumes) == 1:
+            return f"Batch Scored {job_count} jobs for Resume {resumes[0].id}"
+        return f"Batch Scored {job_count} jobs for {len(resumes)} resumes"
 
 @celery_app.task
 def score_all_jobs_task(resume_id_str: str):
@@ -159,3 +214,143 @@ def score_all_jobs_task(resume_id_str: str):
         asyncio.set_event_loop(loop)
         
     return loop.run_until_complete(perform_batch_scoring(UUID(resume_id_str)))
+
+# ---------------------------------------------------------------------------
+# Coalesced scoring: resumes parsed close together are scored as one block
+# ---------------------------------------------------------------------------
+
+SCORING_QUEUE_KEY = "scoring:pending"
+SCORING_FLUSH_KEY = "scoring:flush_scheduled"
+# Batches being scored: processing-list key → lease deadline (unix time)
+SCORING_INFLIGHT_KEY = "scoring:inflight"
+SCORING_BATCH_KEY_PREFIX = "scoring:processing:"
+
+# Push an id; the caller that claims the flush flag schedules the flush.
+# Returns {claimed_flag, queue_length}.
+_ENQUEUE_LUA = """
+redis.call('RPUSH', KEYS[1], ARGV[1])
+local claimed = redis.call('SET', KEYS[2], '1', 'NX', 'EX', ARGV[2]) and 1 or 0
+return {claimed, redis.call('LLEN', KEYS[1])}
+"""
+
+# Move up to ARGV[1] ids into the batch's processing list (KEYS[4]) and
+# lease it until ARGV[2]; release the flush flag in the same step once the
+# queue is empty, so an id pushed afterwards always schedules a new flush.
+_POP_LUA = """
+local ids = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+redis.call('LTRIM', KEYS[1], #ids, -1)
+if #ids > 0 then
+  redis.call('RPUSH', KEYS[4], unpack(ids))
+  redis.call('ZADD', KEYS[3], ARGV[2], KEYS[4])
+end
+if redis.call('LLEN', KEYS[1]) == 0 then redis.call('DEL', KEYS[2]) end
+return ids
+"""
+
+# Put a batch's ids back at the front of the queue, in order, and drop it.
+_REQUEUE_LUA = """
+local ids = redis.call('LRANGE', KEYS[3], 0, -1)
+for i = #ids, 1, -1 do redis.call('LPUSH', KEYS[1], ids[i]) end
+redis.call('DEL', KEYS[3])
+redis.call('ZREM', KEYS[2], KEYS[3])
+return #ids
+"""
+
+def _flush_flag_ttl() -> int:
+    # Safety TTL: a lost scheduled flush is re-armed by the next request
+    # or, failing that, by the periodic sweep
+    return int(settings.SCORING_BATCH_WINDOW_SECONDS) + 300
+
+async def request_scoring(resume_id: str):
+    """
+    Queue a resume for scoring against all active jobs. Ids arriving within
+    SCORING_BATCH_WINDOW_SECONDS are scored together (the job corpus is
+    loaded once per batch); a full batch is flushed immediately.
+    """
+    from app.db.redis import get_async_redis
+
+    redis = get_async_redis()
+    claimed, length = await redis.eval(
+        _ENQUEUE_LUA, 2, SCORING_QUEUE_KEY, SCORING_FLUSH_KEY, resume_id, _flush_flag_ttl()
+    )
+    if claimed:
+        flush_scoring_queue_task.apply_async(countdown=settings.SCORING_BATCH_WINDOW_SECONDS)
+    elif length % settings.SCORING_BATCH_MAX_SIZE == 0:
+        flush_scoring_queue_task.delay()
+
+async def flush_scoring_queue():
+    """
+    Score one batch of queued resumes; re-arms itself if more are waiting.
+
+    The batch's ids stay in a leased processing list until it is scored.
+    If scoring fails they go back to the front of the queue, where the
+    periodic sweep picks them up; if the worker dies, the sweep requeues
+    them once the lease (SCORING_BATCH_LEASE_SECONDS) runs out.
+    """
+    from app.db.redis import get_async_redis
+
+    redis = get_async_redis()
+    batch_key = f"{SCORING_BATCH_KEY_PREFIX}{uuid4().hex}"
+    ids = await redis.eval(
+        _POP_LUA, 4, SCORING_QUEUE_KEY, SCORING_FLUSH_KEY, SCORING_INFLIGHT_KEY, batch_key,
+        settings.SCORING_BATCH_MAX_SIZE, time.time() + settings.SCORING_BATCH_LEASE_SECONDS,
+    )
+    if await redis.exists(SCORING_FLUSH_KEY) and await redis.llen(SCORING_QUEUE_KEY):
+        flush_scoring_queue_task.delay()
+    if not ids:
+        return "Scoring queue empty"
+    # Re-parsed resumes can be queued twice within a window
+    resume_ids = [UUID(r) for r in dict.fromkeys(ids)]
+    try:
+        result = await perform_multi_resume_scoring(resume_ids)
+    except BaseException:
+        await redis.eval(_REQUEUE_LUA, 3, SCORING_QUEUE_KEY, SCORING_INFLIGHT_KEY, batch_key)
+        raise
+    # Acknowledge: the batch is scored
+    pipe = redis.pipeline()
+    pipe.delete(batch_key)
+    pipe.zrem(SCORING_INFLIGHT_KEY, batch_key)
+    await pipe.execute()
+    return result
+
+async def sweep_scoring_queue():
+    """
+    Periodic safety net for the coalesced queue: requeue batches whose
+    lease expired (their worker died mid-batch), then flush anything left
+    waiting without a scheduled flush (a lost countdown, a failed batch).
+    """
+    from app.db.redis import get_async_redis
+
+    redis = get_async_redis()
+    expired = await redis.zrangebyscore(SCORING_INFLIGHT_KEY, "-inf", time.time())
+    for batch_key in expired:
+        await redis.eval(_REQUEUE_LUA, 3, SCORING_QUEUE_KEY, SCORING_INFLIGHT_KEY, batch_key)
+    if not await redis.llen(SCORING_QUEUE_KEY):
+        return f"Scoring queue empty ({len(expired)} expired batches requeued)"
+    # Hold the flush flag so the flush keeps re-arming until the queue drains
+    await redis.set(SCORING_FLUSH_KEY, "1", ex=_flush_flag_ttl())
+    return await flush_scoring_queue()
+
+@celery_app.task
+def flush_scoring_queue_task():
+    """
+    Celery task to drain one batch from the coalesced scoring queue.
+    """
+    loop = asyncio.get_event_loop()
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(flush_scoring_queue())
+
+@celery_app.task
+def sweep_scoring_queue_task():
+    """
+    Celery beat task: recover expired batches and flush a stalled scoring queue.
+    """
+    loop = asyncio.get_event_loop()
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(sweep_scoring_queue())
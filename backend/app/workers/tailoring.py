@@ -4,16 +4,34 @@ from app.models.tailored_resume import TailoredResume
 from app.models.resume import Resume
 from app.models.job import Job
 from app.models.score import ATSScore
+from app.models.load_profiles import JOB_PROMPT, RESUME_ANALYSIS, TAILORED_CONTENT
+from app.services.parsing.document import document_sections, resume_profile
+from app.services.llm.scheduler import BULK, use_lane
+from app.services.tailoring.digest import build_requirement_digest, estimate_tokens
+from app.services.tailoring.events import emitter_for, publish_event
+from app.core.config import settings
+from sqlalchemy import update
 from sqlalchemy.future import select
 import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 
+def _build_digest(job_id: UUID, title: str, description: Optional[str]) -> str:
+    """Digest for a job ingested before digests existed (stored by the caller)."""
+    digest = build_requirement_digest(title, description)
+    full_tokens = estimate_tokens(f"{title}\n{description or ''}")
+    print(f"Requirement digest for job {job_id}: {full_tokens} → {estimate_tokens(digest)} tokens")
+    return digest
+
+
 async def perform_tailoring(tailored_resume_id: UUID):
     async with AsyncSessionLocal() as session:
         # 1. Load TailoredResume record
         result = await session.execute(
-            select(TailoredResume).filter(TailoredResume.id == tailored_resume_id)
+            select(TailoredResume)
+            .options(*TAILORED_CONTENT)
+            .filter(TailoredResume.id == tailored_resume_id)
         )
         tailored = result.scalars().first()
         if not tailored:
@@ -21,12 +39,12 @@ async def perform_tailoring(tailored_resume_id: UUID):
 
         # 2. Load Resume and Job
         resume_result = await session.execute(
-            select(Resume).filter(Resume.id == tailored.resume_id)
+            select(Resume).options(*RESUME_ANALYSIS).filter(Resume.id == tailored.resume_id)
         )
         resume = resume_result.scalars().first()
 
         job_result = await session.execute(
-            select(Job).filter(Job.id == tailored.job_id)
+            select(Job).options(*JOB_PROMPT).filter(Job.id == tailored.job_id)
         )
         job = job_result.scalars().first()
 
@@ -34,8 +52,13 @@ async def perform_tailoring(tailored_resume_id: UUID):
             tailored.status = "FAILED"
             tailored.error_message = "Resume or Job not found"
             await session.commit()
+            await publish_event(str(tailored.id), {"type": "failed", "error": tailored.error_message})
             return "Resume or Job not found"
 
+        # Progress for GET /resumes/tailored/{id}/events
+        emit = emitter_for([tailored.id])
+        await emit({"type": "started"})
+
         # 3. Load existing ATSScore for this resume+job
         score_result = await session.execute(
             select(ATSScore)
@@ -50,7 +73,10 @@ async def perform_tailoring(tailored_resume_id: UUID):
             # No existing score — run scoring inline
             from app.services.ats.scorer import calculate_ats_score
             job_text = f"{job.title}\n{job.description_text or ''}"
-            score_data = calculate_ats_score(job_text, resume.parsed_text or "")
+            score_data = calculate_ats_score(
+                job_text, resume.parsed_text or "",
+                resume_profile(resume.parsed_document, resume.parsed_text),
+            )
             missing_skills = score_data["missing_skills"]
             matched_skills = score_data["matched_skills"]
             ats_before = score_data["overall_score"]
@@ -61,24 +87,37 @@ async def perform_tailoring(tailored_resume_id: UUID):
 
         try:
             # 4. Run tailoring engine
-            from app.services.tailoring.engine import tailor_resume
+            from app.services.tailoring.engine import tailor_resume_async
             job_text = f"{job.title}\n{job.description_text or ''}"
+            if job.requirement_digest is None:
+                # Committed with the result below
+                job.requirement_digest = _build_digest(job.id, job.title, job.description_text)
 
-            result_data = tailor_resume(
+            result_data = await tailor_resume_async(
                 resume_text=tailored.original_text,
                 job_text=job_text,
                 missing_skills=missing_skills,
                 matched_skills=matched_skills,
                 ats_score_before=ats_before,
+                # Section boundaries found at parse time (None if stale → re-parsed)
+                sections=document_sections(resume.parsed_document, tailored.original_text),
+                on_event=emit,
+                job_digest=job.requirement_digest,
             )
 
             # 5. Persist results
             tailored.tailored_text = result_data["tailored_text"]
+            tailored.tailored_document = {"sections": result_data["tailored_sections"]}
             tailored.change_summary = result_data["change_summary"]
             tailored.ats_score_before = result_data["ats_score_before"]
             tailored.ats_score_after = result_data["ats_score_after"]
             tailored.status = "DRAFT"
             await session.commit()
+            await emit({
+                "type": "done", "status": "DRAFT",
+                "ats_score_before": tailored.ats_score_before,
+                "ats_score_after": tailored.ats_score_after,
+            })
 
             return (
                 f"Tailored resume {tailored_resume_id}: "
@@ -99,6 +138,7 @@ async def perform_tailoring(tailored_resume_id: UUID):
                 }
             ]
             await session.commit()
+            await emit({"type": "failed", "error": str(e)})
             return f"Failed: {str(e)}"
 
 
@@ -113,3 +153,196 @@ def tailor_resume_task(tailored_resume_id_str: str):
         asyncio.set_event_loop(loop)
 
     return loop.run_until_complete(perform_tailoring(UUID(tailored_resume_id_str)))
+
+
+# ---------------------------------------------------------------------------
+# Batch tailoring: one resume against many jobs
+# ---------------------------------------------------------------------------
+
+def _failed_values(tailored_id: UUID, message: str) -> Dict[str, Any]:
+    return {
+        "id": tailored_id,
+        "status": "FAILED",
+        "error_message": message,
+        "change_summary": [{
+            "section_name": "Error",
+            "before_text": "",
+            "after_text": "",
+            "reason": f"Tailoring failed: {message}",
+            "injected": False,
+            "skill": "",
+        }],
+    }
+
+async def perform_batch_tailoring(resume_id: UUID, tailored_resume_ids: List[UUID]):
+    """
+    Tailor one resume for several jobs. The resume, its sections and its
+    profile are loaded once; jobs whose section prompts would be identical
+    (same job digest — or job text when there is none — and the same
+    matched/missing skill sets) share one engine run, groups run
+    concurrently up to TAILORING_BATCH_CONCURRENCY, and every
+    TailoredResume row is written in one bulk UPDATE. A job whose scoring
+    fails is marked FAILED on its own.
+    """
+    from app.services.ats.scorer import calculate_ats_score
+    from app.services.tailoring.engine import tailor_resume_async
+
+    async with AsyncSessionLocal() as session:
+        resume_result = await session.execute(
+            select(Resume).options(*RESUME_ANALYSIS).filter(Resume.id == resume_id)
+        )
+        resume = resume_result.scalars().first()
+
+        rows_result = await session.execute(
+            select(TailoredResume.id, TailoredResume.job_id)
+            .filter(TailoredResume.id.in_(tailored_resume_ids), TailoredResume.status == "PENDING")
+        )
+        pending = rows_result.all()
+        if not pending:
+            return "No pending tailored resumes"
+        if not resume:
+            await session.execute(
+                update(TailoredResume),
+                [_failed_values(t_id, "Resume or Job not found") for t_id, _ in pending],
+            )
+            await session.commit()
+            for t_id, _ in pending:
+                await publish_event(str(t_id), {"type": "failed", "error": "Resume or Job not found"})
+            return "Resume not found"
+
+        job_ids = [job_id for _, job_id in pending]
+        jobs_result = await session.execute(
+            select(Job.id, Job.title, Job.description_text, Job.requirement_digest).filter(Job.id.in_(job_ids))
+        )
+        job_texts: Dict[UUID, str] = {}
+        job_digests: Dict[UUID, str] = {}
+        new_digests: List[Dict[str, Any]] = []
+        for j_id, title, description, digest in jobs_result:
+            job_texts[j_id] = f"{title}\n{description or ''}"
+            if digest is None:
+                digest = _build_digest(j_id, title, description)
+                new_digests.append({"id": j_id, "requirement_digest": digest})
+            job_digests[j_id] = digest
+
+        # Latest ATSScore per job (newest first, first one wins)
+        scores_result = await session.execute(
+            select(ATSScore)
+            .filter(ATSScore.resume_id == resume_id, ATSScore.job_id.in_(job_ids))
+            .order_by(ATSScore.created_at.desc())
+        )
+        latest_scores: Dict[UUID, ATSScore] = {}
+        for score in scores_result.scalars():
+            latest_scores.setdefault(score.job_id, score)
+
+        resume_text = resume.parsed_text or ""
+        sections = document_sections(resume.parsed_document, resume_text)
+        profile = resume_profile(resume.parsed_document, resume.parsed_text)
+
+        updates: List[Dict[str, Any]] = []
+        # (prompt job text, matched, missing) → [(tailored_id, job_id, ats_before)]
+        groups: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], List[Tuple[UUID, UUID, float]]] = {}
+        for tailored_id, job_id in pending:
+            if job_id not in job_texts:
+                updates.append(_failed_values(tailored_id, "Resume or Job not found"))
+                continue
+            ats_score = latest_scores.get(job_id)
+            if ats_score:
+                matched, missing = ats_score.matched_keywords or [], ats_score.missing_keywords or []
+                ats_before = ats_score.overall_score
+            else:
+                # No existing score — run scoring inline
+                try:
+                    score_data = calculate_ats_score(job_texts[job_id], resume_text, profile)
+                except Exception as e:
+                    updates.append(_failed_values(tailored_id, f"Scoring failed: {e}"))
+                    continue
+                matched, missing = score_data["matched_skills"], score_data["missing_skills"]
+                ats_before = score_data["overall_score"]
+            # Everything the section prompts are built from
+            prompt_job_text = job_digests[job_id] or job_texts[job_id]
+            key = (prompt_job_text, tuple(sorted(matched)), tuple(sorted(missing)))
+            groups.setdefault(key, []).append((tailored_id, job_id, ats_before))
+
+        semaphore = asyncio.Semaphore(settings.TAILORING_BATCH_CONCURRENCY)
+
+        async def tailor_group(matched: Tuple[str, ...], missing: Tuple[str, ...], members):
+            # Members share the prompts; the first one's job text is used for them
+            _, lead_job_id, lead_before = members[0]
+            emit = emitter_for([t_id for t_id, _, _ in members])
+            async with semaphore:
+                await emit({"type": "started"})
+                try:
+                    result = await tailor_resume_async(
+                        resume_text=resume_text,
+                        job_text=job_texts[lead_job_id],
+                        missing_skills=list(missing),
+                        matched_skills=list(matched),
+                        ats_score_before=lead_before,
+                        sections=sections,
+                        on_event=emit,
+                        job_digest=job_digests[lead_job_id],
+                    )
+                except Exception as e:
+                    return [_failed_values(t_id, str(e)) for t_id, _, _ in members]
+
+            values = []
+            for t_id, job_id, ats_before in members:
+                try:
+                    # Each member is rescored against its own posting
+                    ats_after = result["ats_score_after"] if job_id == lead_job_id else \
+                        calculate_ats_score(job_texts[job_id], result["tailored_text"])["overall_score"]
+                except Exception as e:
+                    values.append(_failed_values(t_id, f"Scoring failed: {e}"))
+                    continue
+                values.append({
+                    "id": t_id,
+                    "tailored_text": result["tailored_text"],
+                    "tailored_document": {"sections": result["tailored_sections"]},
+                    "change_summary": result["change_summary"],
+                    "ats_score_before": ats_before,
+                    "ats_score_after": ats_after,
+                    "status": "DRAFT",
+                })
+            return values
+
+        # Bulk lane: yields LLM capacity to interactive single-resume runs
+        with use_lane(BULK):
+            group_results = await asyncio.gather(
+                *(tailor_group(matched, missing, members) for (_, matched, missing), members in groups.items())
+            )
+        for values in group_results:
+            updates.extend(values)
+
+        if new_digests:
+            await session.execute(update(Job), new_digests)
+        await session.execute(update(TailoredResume), updates)
+        await session.commit()
+
+        for values in updates:
+            if values["status"] == "DRAFT":
+                event = {"type": "done", "status": "DRAFT", "ats_score_before": values["ats_score_before"],
+                         "ats_score_after": values["ats_score_after"]}
+            else:
+                event = {"type": "failed", "error": values["error_message"]}
+            await publish_event(str(values["id"]), event)
+
+        drafted = sum(1 for v in updates if v["status"] == "DRAFT")
+        return (
+            f"Batch tailored resume {resume_id}: {drafted}/{len(updates)} drafted "
+            f"in {len(groups)} prompt groups"
+        )
+
+
+@celery_app.task
+def tailor_resume_batch_task(resume_id_str: str, tailored_resume_id_strs: List[str]):
+    """
+    Celery task: tailor one resume for many jobs (PENDING → DRAFT).
+    """
+    loop = asyncio.get_event_loop()
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(
+        perform_batch_tailoring(UUID(resume_id_str), [UUID(t) for t in tailored_resume_id_strs])
+    )
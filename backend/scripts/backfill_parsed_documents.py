@@ -0,0 +1,48 @@
+"""
+Build Resume.parsed_document for PARSED resumes that predate it (or were
+built under an older skills taxonomy). Consumers fall back to re-analyzing
+parsed_text until this has run.
+
+  python scripts/backfill_parsed_documents.py
+"""
+
+import asyncio
+import os
+import sys
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+from sqlalchemy.future import select
+
+from app.db.session import AsyncSessionLocal
+from app.models.load_profiles import RESUME_ANALYSIS
+from app.models.resume import Resume
+from app.services.parsing.document import build_parsed_document, is_current
+
+BATCH_SIZE = 100
+
+
+async def main():
+    updated = 0
+    last_id = None
+    async with AsyncSessionLocal() as session:
+        while True:
+            query = select(Resume).options(*RESUME_ANALYSIS).filter(Resume.status == "PARSED").order_by(Resume.id).limit(BATCH_SIZE)
+            if last_id is not None:
+                query = query.filter(Resume.id > last_id)
+            resumes = (await session.execute(query)).scalars().all()
+            if not resumes:
+                break
+            for resume in resumes:
+                if resume.parsed_text and not is_current(resume.parsed_document, resume.parsed_text):
+                    resume.parsed_document = build_parsed_document(resume.parsed_text)
+                    updated += 1
+            last_id = resumes[-1].id
+            await session.commit()
+            print(f"  ...{updated} documents built")
+    print(f"Done: {updated} resumes backfilled")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
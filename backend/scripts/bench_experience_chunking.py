@@ -0,0 +1,129 @@
+"""
+Tailoring a senior resume (many roles in EXPERIENCE) with and without
+chunked section optimization, against the in-process LLM stand-in
+(scripts/llm_standin_server.py).
+
+The stand-in rewrites whatever section it is sent. Its response time grows
+with the response length (--ms-per-token), and it cuts responses off at the
+request's max_tokens, as a provider does. An unchunked long EXPERIENCE
+section is therefore slow, and it fails to parse once its rewrite
+outgrows the 1200-token cap. For each mode the script reports the
+run latency, the model calls made, whether EXPERIENCE was AI-optimized,
+and whether every role heading survived stitching, in order.
+
+  python scripts/bench_experience_chunking.py --roles 12
+  python scripts/bench_experience_chunking.py --roles 6 --chunk-tokens 400
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from llm_standin_server import StandIn, make_server
+
+_STACKS = [
+    ("Python", "Django", "PostgreSQL"), ("Go", "Kafka", "Kubernetes"),
+    ("Java", "Spring", "Oracle"), ("TypeScript", "React", "GraphQL"),
+    ("Terraform", "AWS", "Docker"), ("Scala", "Spark", "Airflow"),
+]
+
+
+def senior_resume(roles: int, bullets: int) -> str:
+    lines = ["Alex Senior", "alex@example.com", "", "SUMMARY",
+             "Principal engineer with two decades across backend, data and platform teams.", "",
+             "EXPERIENCE"]
+    for i in range(roles):
+        a, b, c = _STACKS[i % len(_STACKS)]
+        lines.append(f"Staff Engineer, Company {i + 1} ({2023 - 2 * i} - {2025 - 2 * i})")
+        for j in range(bullets):
+            lines.append(
+                f"- Led workstream {j + 1} delivering {a} services on {b}, "
+                f"cutting {c} costs and on-call load for the platform group"
+            )
+        lines.append("")
+    lines += ["SKILLS", "Python, Go, Java, TypeScript, AWS, Kubernetes, Kafka", ""]
+    return "\n".join(lines)
+
+
+async def run_mode(label: str, chunk_tokens: int, args, standin: StandIn, resume: str) -> None:
+    from app.core.config import settings
+    from app.services.llm import close_openai_clients
+    from app.services.skills.extraction import match_skill_keywords
+    from app.services.tailoring.digest import build_requirement_digest
+    from app.services.tailoring.engine import tailor_resume_async
+
+    settings.TAILORING_CHUNK_MAX_TOKENS = chunk_tokens
+    settings.TAILORING_SECTION_CONCURRENCY = args.concurrency
+
+    with open(os.path.join("app", "services", "scraper", "data", "dubai_tech_jobs.json")) as f:
+        job = json.load(f)[0]
+    job_text = f"{job['title']}\n{job['description']}"
+    job_skills = match_skill_keywords(job_text)
+    resume_skills = set(match_skill_keywords(resume))
+
+    calls_before = len(standin.calls)
+    started = time.perf_counter()
+    result = await tailor_resume_async(
+        resume_text=resume, job_text=job_text,
+        missing_skills=[s for s in job_skills if s not in resume_skills],
+        matched_skills=[s for s in job_skills if s in resume_skills],
+        ats_score_before=0.0, job_digest=build_requirement_digest(job["title"], job["description"]),
+    )
+    elapsed = time.perf_counter() - started
+    await close_openai_clients()
+
+    calls = standin.calls[calls_before:]
+    truncated = sum(1 for c in calls if c.get("finish_reason") == "length")
+    ai_optimized = any(
+        c["section_name"] == "Experience" and c["skill"] == "ai-optimized" for c in result["change_summary"]
+    )
+    headings = [l for l in resume.splitlines() if l.startswith("Staff Engineer")]
+    tailored = result["tailored_text"]
+    positions = [tailored.find(h) for h in headings]
+    in_order = all(p >= 0 for p in positions) and positions == sorted(positions)
+    print(
+        f"{label:<10} {elapsed:6.2f}s  model calls {len(calls):>3} (truncated {truncated:>2})  "
+        f"EXPERIENCE {'AI-optimized' if ai_optimized else 'rule-based fallback'}  "
+        f"role headings {'intact, in order' if in_order else 'MISSING/REORDERED'}"
+    )
+
+
+def main(args):
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.port}/v1"
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+
+    resume = senior_resume(args.roles, args.bullets)
+    experience = resume.split("EXPERIENCE\n", 1)[1].split("SKILLS\n", 1)[0]
+    print(
+        f"{args.roles} roles x {args.bullets} bullets: EXPERIENCE ~{len(experience) // 4} tokens; "
+        f"stand-in {args.latency}s + {args.ms_per_token}ms per completion token"
+    )
+    for label, chunk_tokens in (("unchunked", 0), ("chunked", args.chunk_tokens)):
+        standin = StandIn(0, 128, args.latency, shot1_accept_rate=1.0, ms_per_token=args.ms_per_token)
+        server = make_server(standin, args.port)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            asyncio.run(run_mode(label, chunk_tokens, args, standin, resume))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chunked vs whole-section EXPERIENCE tailoring")
+    parser.add_argument("--roles", type=int, default=12)
+    parser.add_argument("--bullets", type=int, default=5)
+    parser.add_argument("--chunk-tokens", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, default=6)
+    parser.add_argument("--port", type=int, default=8092)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--ms-per-token", type=float, default=2.0)
+    main(parser.parse_args())
@@ -0,0 +1,73 @@
+"""
+Benchmark the PDF extraction engine across layout profiles.
+
+Runs every PDF in a directory through extract_pdf_text once per profile and
+reports throughput plus skill parity against the "accurate" profile (the
+fast profile is only worth enabling if it finds the same skills).
+
+  python scripts/bench_pdf_extraction.py ./uploads
+"""
+
+import asyncio
+import glob
+import os
+import sys
+import time
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+from app.services.parsing.pdf_extraction import PROFILES, PDFExtractionError, extract_pdf_text
+from app.services.skills.extraction import match_skill_keywords
+
+
+async def bench(paths, profile):
+    skills, pages, failures = {}, 0, {}
+    started = time.perf_counter()
+    for path in paths:
+        try:
+            text = await extract_pdf_text(path, profile=profile)
+        except PDFExtractionError as e:
+            failures[e.reason] = failures.get(e.reason, 0) + 1
+            continue
+        pages += text.count("\f")
+        skills[path] = set(match_skill_keywords(text))
+    return skills, pages, failures, time.perf_counter() - started
+
+
+async def main(directory):
+    paths = sorted(glob.glob(os.path.join(directory, "**", "*.pdf"), recursive=True))
+    if not paths:
+        print(f"No PDFs found under {directory}")
+        return
+
+    # Warm the pool so process spawn time is not charged to the first profile
+    try:
+        await extract_pdf_text(paths[0])
+    except PDFExtractionError:
+        pass
+
+    results = {}
+    for profile in PROFILES:
+        skills, pages, failures, elapsed = await bench(paths, profile)
+        results[profile] = skills
+        print(f"{profile:>9}: {len(skills)}/{len(paths)} docs in {elapsed:.2f}s "
+              f"({len(skills) / elapsed:.1f} docs/s, {pages / elapsed:.1f} pages/s) failures={failures}")
+
+    baseline = results["accurate"]
+    for profile in PROFILES:
+        if profile == "accurate":
+            continue
+        mismatched = [p for p in baseline if results[profile].get(p) != baseline[p]]
+        print(f"Skill parity {profile} vs accurate: {len(baseline) - len(mismatched)}/{len(baseline)} identical")
+        for path in mismatched:
+            lost = baseline[path] - results[profile].get(path, set())
+            gained = results[profile].get(path, set()) - baseline[path]
+            print(f"  {os.path.basename(path)}: lost={sorted(lost)} gained={sorted(gained)}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python scripts/bench_pdf_extraction.py <pdf_dir>")
+        sys.exit(1)
+    asyncio.run(main(sys.argv[1]))
@@ -0,0 +1,113 @@
+"""
+Tailoring latency, serial vs hedged shot execution, against the in-process
+LLM stand-in (scripts/llm_standin_server.py) with a configurable share of
+slow responses and Shot 1 no-ops.
+
+Each run tails the two sample resumes to one bundled job through the real
+engine (response cache off). The script reports p50/p95/p99/max per mode,
+plus the number of model calls, since hedging trades extra calls for a
+shorter tail. Shot history (speculation for sections that usually no-op)
+needs Redis; without it, only latency-triggered hedging applies.
+
+  python scripts/bench_tailoring_latency.py --runs 40
+  python scripts/bench_tailoring_latency.py --slow-rate 0.2 --slow-latency 4 --hedge-after 1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from llm_standin_server import SAMPLE_RESUMES, StandIn, make_server
+
+
+def percentile(sorted_values, pct: float) -> float:
+    k = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+async def run_mode(mode: str, args, standin: StandIn) -> None:
+    from app.core.config import settings
+    from app.services.llm import close_openai_clients
+    from app.services.skills.extraction import match_skill_keywords
+    from app.services.tailoring.digest import build_requirement_digest
+    from app.services.tailoring.engine import tailor_resume_async
+
+    settings.TAILORING_SHOT_MODE = mode
+    settings.TAILORING_HEDGE_AFTER_SECONDS = args.hedge_after
+
+    with open(os.path.join("app", "services", "scraper", "data", "dubai_tech_jobs.json")) as f:
+        job = json.load(f)[0]
+    job_text = f"{job['title']}\n{job['description']}"
+    digest = build_requirement_digest(job["title"], job["description"])
+    job_skills = match_skill_keywords(job_text)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    durations = []
+
+    async def one(i: int):
+        resume = SAMPLE_RESUMES[i % len(SAMPLE_RESUMES)]
+        resume_skills = set(match_skill_keywords(resume))
+        async with semaphore:
+            started = time.perf_counter()
+            await tailor_resume_async(
+                resume_text=resume, job_text=job_text,
+                missing_skills=[s for s in job_skills if s not in resume_skills],
+                matched_skills=[s for s in job_skills if s in resume_skills],
+                ats_score_before=0.0, job_digest=digest,
+            )
+            durations.append(time.perf_counter() - started)
+
+    calls_before = len(standin.calls)
+    await asyncio.gather(*(one(i) for i in range(args.runs)))
+    await close_openai_clients()
+
+    durations.sort()
+    print(
+        f"{mode:<8} runs {len(durations):>4}  p50 {percentile(durations, 50):6.2f}s  "
+        f"p95 {percentile(durations, 95):6.2f}s  p99 {percentile(durations, 99):6.2f}s  "
+        f"max {durations[-1]:6.2f}s  model calls {len(standin.calls) - calls_before}"
+    )
+
+
+def main(args):
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.port}/v1"
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ["OPENAI_MAX_CONNECTIONS"] = "100"
+
+    print(
+        f"Stand-in: {args.latency}s per response, {args.slow_rate:.0%} take {args.slow_latency}s, "
+        f"Shot 1 accepts {args.shot1_accept_rate:.0%}; hedge after {args.hedge_after}s"
+    )
+    for mode in ("serial", "hedged"):
+        # Same response sequence for both modes
+        standin = StandIn(0, 128, args.latency, args.slow_rate, args.slow_latency,
+                          args.shot1_accept_rate, seed=args.seed)
+        server = make_server(standin, args.port)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            asyncio.run(run_mode(mode, args, standin))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serial vs hedged tailoring latency")
+    parser.add_argument("--runs", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8091)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--slow-rate", type=float, default=0.1)
+    parser.add_argument("--slow-latency", type=float, default=3.0)
+    parser.add_argument("--shot1-accept-rate", type=float, default=0.5)
+    parser.add_argument("--hedge-after", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=7)
+    main(parser.parse_args())
@@ -0,0 +1,67 @@
+"""
+Check the scraper's job index against the original linear scan.
+
+For every query term, RecursiveScraper used to keep the jobs whose
+lowercased "title description" contained the term as a substring. This
+script runs the same scan and JobIndex.term_postings over a dataset and
+reports any term whose result sets differ. With no terms given, it checks
+a fixed list of short, partial and punctuated terms plus every
+whitespace-free word (and its 3-character slices) from the dataset's titles.
+
+  python scripts/check_job_index_parity.py
+  python scripts/check_job_index_parity.py ./dump.jsonl ops script end
+"""
+
+import os
+import sys
+import time
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+from app.services.scraper.job_index import JobIndex, iter_json_records, iter_json_spans
+
+DEFAULT_DATASET = os.path.join("app", "services", "scraper", "data", "dubai_tech_jobs.json")
+DEFAULT_TERMS = [
+    "ops", "script", "end", "dev", "engineer", "python", "c++", "c#", ".net", "node.js",
+    "ci/cd", "a", "e", "ai", "go", "ml", "data", "aed", "senior", "(remote)", "--", "zzz",
+]
+
+
+def main(path, terms):
+    jobs = list(iter_json_records(path))
+    corpora = [f"{job.get('title', '')} {job.get('description', '')}".lower() for job in jobs]
+    if not terms:
+        terms = list(DEFAULT_TERMS)
+        for job in jobs:
+            for word in job.get("title", "").lower().split():
+                terms.append(word)
+                terms.extend(word[k:k + 3] for k in range(0, len(word) - 2, 2))
+        terms = list(dict.fromkeys(terms))
+
+    started = time.perf_counter()
+    index = JobIndex(path, iter_json_spans(path))
+    built = time.perf_counter() - started
+
+    mismatched = 0
+    started = time.perf_counter()
+    for term in terms:
+        expected = {i for i, corpus in enumerate(corpora) if term.lower() in corpus}
+        got = set(index.term_postings(term))
+        if got != expected:
+            mismatched += 1
+            print(f"MISMATCH {term!r}: scan {len(expected)} jobs, index {len(got)} jobs")
+    elapsed = time.perf_counter() - started
+
+    # Records read back by offset must equal the streamed ones
+    readback_ok = index.get_jobs(range(len(index))) == jobs
+    print(
+        f"{len(jobs)} jobs indexed in {built:.2f}s; {len(terms)} terms checked in {elapsed:.2f}s: "
+        f"{len(terms) - mismatched} identical, {mismatched} mismatched; "
+        f"records read back {'identical' if readback_ok else 'DIFFERENT'}"
+    )
+    sys.exit(1 if mismatched or not readback_ok else 0)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DATASET, sys.argv[2:])
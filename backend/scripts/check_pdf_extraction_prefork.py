@@ -0,0 +1,48 @@
+"""
+Run extract_pdf_text inside a prefork pool child, as the Celery worker
+does (`celery worker` defaults to billiard's prefork pool, whose children
+are daemonic processes).
+
+Extraction must start its worker processes from there and return text;
+a failure to do so must not be reported as a malformed PDF.
+
+  python scripts/check_pdf_extraction_prefork.py ./uploads/resume.pdf
+"""
+
+import asyncio
+import os
+import sys
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+
+def extract_in_child(path):
+    import multiprocessing
+
+    from app.services.parsing.pdf_extraction import PDFExtractionError, extract_pdf_text
+
+    try:
+        text = asyncio.run(extract_pdf_text(path))
+    except PDFExtractionError as e:
+        return multiprocessing.current_process().daemon, e.reason, 0
+    return multiprocessing.current_process().daemon, "ok", len(text)
+
+
+def main(paths):
+    from billiard import Pool
+
+    failed = False
+    with Pool(processes=1) as pool:
+        for path in paths:
+            daemon, outcome, chars = pool.apply(extract_in_child, (path,))
+            print(f"{os.path.basename(path):<30} daemonic child={daemon}  {outcome:<18} {chars} chars")
+            failed |= outcome == "extraction_failed"
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python scripts/check_pdf_extraction_prefork.py <pdf> [<pdf> ...]")
+        sys.exit(2)
+    main(sys.argv[1:])
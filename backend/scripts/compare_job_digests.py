@@ -0,0 +1,94 @@
+"""
+Compare tailoring prompt size with the full job description vs the
+per-job requirement digest, over the bundled job dataset (or any JSON list
+of {"title", "description"}).
+
+For every job: tokens of the job text as prompts embedded it before the
+digest (title + description, cut at 1500 characters), tokens of the
+digest, and the share of the job's skills the digest still names. Totals
+are also given per Shot 1 prompt (system + user message) for a sample
+resume section. Tokens are estimated at ~4 characters each.
+
+  python scripts/compare_job_digests.py
+  python scripts/compare_job_digests.py --max-tokens 150 --show 3
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+from app.services.skills.extraction import match_skill_keywords
+from app.services.tailoring.digest import build_requirement_digest, estimate_tokens
+from app.services.tailoring.engine import _SHOT1_SYSTEM, _SHOT1_USER, _build_user_message
+
+DATASET = os.path.join("app", "services", "scraper", "data", "dubai_tech_jobs.json")
+
+SAMPLE_SECTION = (
+    "EXPERIENCE\n"
+    "Backend Engineer, Acme Corp (2020 - 2024)\n"
+    "- Built REST APIs in Python and Django serving 2M requests per day\n"
+    "- Moved batch jobs to Celery workers backed by Redis\n"
+    "- Deployed services with Docker on AWS"
+)
+
+
+def main(path: str, max_tokens: int, show: int):
+    with open(path, "r", encoding="utf-8") as f:
+        jobs = json.load(f)
+
+    full_total = digest_total = prompt_full_total = prompt_digest_total = 0
+    skills_total = skills_kept = 0
+    print(f"{'job':<40} {'full':>6} {'digest':>7} {'skills kept':>12}")
+    for i, job in enumerate(jobs):
+        job_text = f"{job['title']}\n{job.get('description') or ''}"
+        digest = build_requirement_digest(job["title"], job.get("description"), max_tokens)
+
+        # What the prompt embedded before: the job text cut at 1500 characters
+        full = estimate_tokens(job_text.strip()[:1500])
+        compact = estimate_tokens(digest)
+        skills = set(match_skill_keywords(job_text))
+        kept = skills & set(match_skill_keywords(digest))
+
+        prompt_full = estimate_tokens(_SHOT1_SYSTEM) + estimate_tokens(
+            _build_user_message(_SHOT1_USER, SAMPLE_SECTION, job_text, ["Python"], ["Kubernetes"])
+        )
+        prompt_digest = estimate_tokens(_SHOT1_SYSTEM) + estimate_tokens(
+            _build_user_message(_SHOT1_USER, SAMPLE_SECTION, digest, ["Python"], ["Kubernetes"])
+        )
+
+        full_total += full
+        digest_total += compact
+        prompt_full_total += prompt_full
+        prompt_digest_total += prompt_digest
+        skills_total += len(skills)
+        skills_kept += len(kept)
+
+        label = f"{job['title']} @ {job.get('company', '')}"[:40]
+        print(f"{label:<40} {full:>6} {compact:>7} {len(kept):>5}/{len(skills):<6}")
+        if i < show:
+            print(f"\n{digest}\n")
+
+    def reduction(before: int, after: int) -> str:
+        return f"{(1 - after / before) * 100:.1f}%" if before else "n/a"
+
+    print()
+    print(f"Jobs:                       {len(jobs)} (digest budget {max_tokens} tokens)")
+    print(f"Job text tokens:            {full_total:,} → {digest_total:,} ({reduction(full_total, digest_total)} less)")
+    print(f"Shot 1 prompt tokens:       {prompt_full_total:,} → {prompt_digest_total:,} "
+          f"({reduction(prompt_full_total, prompt_digest_total)} less)")
+    print(f"Job skills named in digest: {skills_kept}/{skills_total}")
+
+
+if __name__ == "__main__":
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="Job description vs requirement digest prompt size")
+    parser.add_argument("--file", default=DATASET, help="JSON list of jobs (title, description)")
+    parser.add_argument("--max-tokens", type=int, default=settings.TAILORING_DIGEST_MAX_TOKENS)
+    parser.add_argument("--show", type=int, default=0, help="Print the first N digests")
+    args = parser.parse_args()
+    main(args.file, args.max_tokens, args.show)
@@ -0,0 +1,361 @@
+"""
+Local stand-in for the OpenAI chat completions API that checks prompt
+prefix sharing.
+
+Every request's messages are flattened the way a provider sees them
+(system, then user) and compared with all earlier requests. The longest
+byte-identical prefix is reported per call, and returned as
+usage.prompt_tokens_details.cached_tokens with provider rules (nothing
+below --min-cached-tokens, then whole --cache-block blocks; ~4 characters
+per token). Shot 1 prompts are answered NO_SAFE_CHANGES_POSSIBLE (or,
+for --shot1-accept-rate of them, an edited section) and Shot 2 prompts
+with a lightly edited section, so both templates are exercised.
+--slow-rate of responses take --slow-latency seconds instead of
+--latency, and --error-rate of requests fail with 500. --ms-per-token
+adds generation time per completion token, and responses longer than the
+request's max_tokens are cut off (finish_reason "length"), as a provider
+would. Streaming (with stream_options.include_usage) is supported.
+
+  python scripts/llm_standin_server.py --port 8090
+  OPENAI_BASE_URL=http://localhost:8090/v1 celery -A app.workers.celery_app worker ...
+
+--verify starts the server in-process and runs the tailorable sections
+of three sample resumes (one with an EXPERIENCE section long enough to be
+chunked) through the engine's section optimizer against one bundled job.
+It checks that every call of a shot shares the system prompt and the
+whole job block as a byte-identical prefix, and that calls for one resume
+also share its matched skills (exit status 1 if not). It needs no network
+or spaCy model: resumes are not rescored.
+
+  python scripts/llm_standin_server.py --verify
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+_SECTION_RE = re.compile(r'(?:Original Resume Section|Resume Section \(SOURCE OF TRUTH\)):\s*"""\n(.*?)\n"""', re.DOTALL)
+
+
+def _common_prefix(a: str, b: str) -> int:
+    # Binary search over slice comparisons (C speed) instead of a char loop
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+class StandIn:
+    def __init__(self, min_cached_tokens: int, cache_block: int, latency: float,
+                 slow_rate: float = 0.0, slow_latency: float = 0.0, shot1_accept_rate: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0, ms_per_token: float = 0.0):
+        self.min_cached_tokens = min_cached_tokens
+        self.cache_block = cache_block
+        self.latency = latency
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.shot1_accept_rate = shot1_accept_rate
+        self.error_rate = error_rate
+        self.ms_per_token = ms_per_token
+        self._random = random.Random(seed)
+        self.calls = []
+        self._prompts = set()  # distinct flattened prompts seen so far
+        self._lock = threading.Lock()
+
+    def record(self, messages) -> dict:
+        system = next((m["content"] for m in messages if m["role"] == "system"), "")
+        flat = "".join(m["content"] for m in messages)
+        with self._lock:
+            prefix = max((_common_prefix(flat, p) for p in self._prompts), default=0)
+            call = {"system": system, "flat": flat, "prefix_chars": prefix}
+            self.calls.append(call)
+            self._prompts.add(flat)
+        prefix_tokens = prefix // 4
+        cached = 0
+        if prefix_tokens >= self.min_cached_tokens:
+            cached = prefix_tokens - prefix_tokens % self.cache_block if self.cache_block else prefix_tokens
+        call["cached_tokens"] = cached
+        call["prompt_tokens"] = (len(flat) + 3) // 4
+        return call
+
+    def fails(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def delay(self) -> float:
+        with self._lock:
+            slow = self._random.random() < self.slow_rate
+        return self.slow_latency if slow else self.latency
+
+    def answer(self, messages) -> str:
+        system = next((m["content"] for m in messages if m["role"] == "system"), "")
+        user = next((m["content"] for m in messages if m["role"] == "user"), "")
+        match = _SECTION_RE.search(user)
+        section = match.group(1) if match else ""
+        if "Your previous attempts" not in system:
+            with self._lock:
+                accept = self._random.random() < self.shot1_accept_rate
+            if not accept:
+                return "NO_SAFE_CHANGES_POSSIBLE"
+            return (
+                f'Optimized Section:\n"""\n{section.rstrip()}\n- Tailored by the stand-in server\n"""\n\n'
+                "Change Summary:\n- Added one bullet\n"
+            )
+        return (
+            f'Optimized Section:\n"""\n{section.rstrip()}\n- Tailored by the stand-in server\n"""\n\n'
+            "Changes Made:\n- Added one bullet\n\nSkills Addressed:\n- none\n"
+        )
+
+
+def make_handler(standin: StandIn):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str = "application/json"):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/stats"):
+                calls = [{k: v for k, v in c.items() if k not in ("system", "flat")} for c in standin.calls]
+                return self._send(200, json.dumps(calls).encode())
+            self._send(404, b"{}")
+
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                return self._send(404, b"{}")
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if standin.fails():
+                return self._send(500, b'{"error": {"message": "stand-in failure", "type": "server_error"}}')
+            messages = body["messages"]
+            call = standin.record(messages)
+            content = standin.answer(messages)
+            finish_reason = "stop"
+            if body.get("max_tokens") and len(content) > body["max_tokens"] * 4:
+                content, finish_reason = content[:body["max_tokens"] * 4], "length"
+            call["finish_reason"] = finish_reason
+            usage = {
+                "prompt_tokens": call["prompt_tokens"],
+                "completion_tokens": (len(content) + 3) // 4,
+                "total_tokens": call["prompt_tokens"] + (len(content) + 3) // 4,
+                "prompt_tokens_details": {"cached_tokens": call["cached_tokens"]},
+            }
+            time.sleep(standin.delay() + usage["completion_tokens"] * standin.ms_per_token / 1000)
+            base = {"id": f"standin-{len(standin.calls)}", "created": int(time.time()), "model": body["model"]}
+
+            if not body.get("stream"):
+                return self._send(200, json.dumps({
+                    **base, "object": "chat.completion", "usage": usage,
+                    "choices": [{"index": 0, "finish_reason": finish_reason,
+                                 "message": {"role": "assistant", "content": content}}],
+                }).encode())
+
+            events = []
+            for i in range(0, len(content), 40):
+                events.append({**base, "object": "chat.completion.chunk", "choices": [
+                    {"index": 0, "finish_reason": None, "delta": {"content": content[i:i + 40]}}
+                ]})
+            events.append({**base, "object": "chat.completion.chunk",
+                           "choices": [{"index": 0, "finish_reason": finish_reason, "delta": {}}]})
+            if (body.get("stream_options") or {}).get("include_usage"):
+                events.append({**base, "object": "chat.completion.chunk", "choices": [], "usage": usage})
+            payload = "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+            self._send(200, payload.encode(), "text/event-stream")
+
+    return Handler
+
+
+class StandInServer(ThreadingHTTPServer):
+    # Tailoring runs open many connections at once; the default backlog (5)
+    # would add SYN-retry delays to the measured latency
+    request_queue_size = 256
+    daemon_threads = True
+
+
+def make_server(standin: StandIn, port: int, host: str = "127.0.0.1") -> StandInServer:
+    return StandInServer((host, port), make_handler(standin))
+
+
+SAMPLE_RESUMES = [
+    (
+        "Jane Doe\njane@example.com\n\n"
+        "SUMMARY\nBackend engineer with six years building Python services.\n\n"
+        "EXPERIENCE\nBackend Engineer, Acme (2019 - 2024)\n"
+        "- Built REST APIs in Python and Django\n- Ran PostgreSQL schema migrations\n\n"
+        "PROJECTS\n- Open source task queue built on Redis\n\n"
+        "SKILLS\nPython, Django, PostgreSQL, Redis\n"
+    ),
+    (
+        "John Roe\njohn@example.com\n\n"
+        "SUMMARY\nPlatform engineer focused on containers and cloud.\n\n"
+        "EXPERIENCE\nDevOps Engineer, Globex (2018 - 2024)\n"
+        "- Deployed services with Docker on AWS\n- Automated builds with Jenkins\n\n"
+        "PROJECTS\n- Terraform modules for staging environments\n\n"
+        "SKILLS\nDocker, AWS, Jenkins, Terraform\n"
+    ),
+]
+
+
+def _long_resume(roles: int = 8) -> str:
+    lines = ["Sam Long", "sam@example.com", "", "SUMMARY", "Staff engineer across backend and platform teams.", "",
+             "EXPERIENCE"]
+    for i in range(roles):
+        lines.append(f"Senior Engineer, Company {i + 1} ({2022 - 2 * i} - {2024 - 2 * i})")
+        lines += [f"- Built Python services on AWS for product line {j + 1}, cutting latency and cost"
+                  for j in range(5)]
+        lines.append("")
+    lines += ["SKILLS", "Python, AWS", ""]
+    return "\n".join(lines)
+
+
+def verify(standin: StandIn, port: int) -> bool:
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{port}/v1"
+    # Byte-identical requests must reach the server, not the response cache
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+
+    import asyncio
+    from app.core.config import settings
+    from app.services.llm import close_openai_clients
+    from app.services.parsing.sections import parse_sections
+    from app.services.skills.extraction import match_skill_keywords
+    from app.services.tailoring.chunking import CHUNKED_SECTIONS, split_section_body
+    from app.services.tailoring.digest import build_requirement_digest
+    from app.services.tailoring.engine import (
+        PROMPT_VERSION, TAILORABLE_SECTIONS, _assign_skills_to_chunks, _optimize_section,
+    )
+
+    with open(os.path.join("app", "services", "scraper", "data", "dubai_tech_jobs.json")) as f:
+        job = json.load(f)[0]
+    job_text = f"{job['title']}\n{job['description']}"
+    digest = build_requirement_digest(job["title"], job["description"])
+    job_skills = match_skill_keywords(job_text)
+
+    async def tailor_sections(resume: str) -> None:
+        # The units tailor_resume_async would send, without rescoring
+        resume_skills = set(match_skill_keywords(resume))
+        matched = [s for s in job_skills if s in resume_skills]
+        missing = [s for s in job_skills if s not in resume_skills]
+        units = []
+        for key, text in parse_sections(resume).items():
+            base = key.split("_")[0]
+            if base not in TAILORABLE_SECTIONS or base == "SKILLS" or not text.strip():
+                continue
+            chunks = split_section_body(text.partition("\n")[2], settings.TAILORING_CHUNK_MAX_TOKENS) \
+                if base in CHUNKED_SECTIONS else [text]
+            if len(chunks) > 1:
+                shares = _assign_skills_to_chunks(missing, chunks)
+                units += [(base, chunk, i, share) for i, (chunk, share) in enumerate(zip(chunks, shares))]
+            else:
+                units.append((base, text, None, missing))
+        await asyncio.gather(*(
+            _optimize_section(
+                section_name=base, section_text=text, job_description=digest,
+                matched_skills=matched, missing_skills=share, chunk=chunk,
+                shot1_outcomes=[] if chunk is not None else None,
+            )
+            for base, text, chunk, share in units
+        ))
+
+    per_resume = []
+
+    async def run():
+        for resume in SAMPLE_RESUMES + [_long_resume()]:
+            before = len(standin.calls)
+            await tailor_sections(resume)
+            per_resume.append(standin.calls[before:])
+        await close_openai_clients()
+    asyncio.run(run())
+
+    print(f"Prompt version {PROMPT_VERSION}: {len(standin.calls)} calls")
+    ok = True
+    shortest_shared = None
+    shots = (
+        ("Shot 1", "Job Description (Reference Only)", "Original Resume Section"),
+        ("Shot 2", "Target Job Description", "Resume Section (SOURCE OF TRUTH)"),
+    )
+    for shot, marker, section_marker in shots:
+        calls = [c for c in standin.calls if marker in c["flat"]]
+        if not calls:
+            print(f"{shot}: no calls")
+            ok = False
+            continue
+        common = min(_common_prefix(calls[0]["flat"], c["flat"]) for c in calls)
+        # System prompt + job block: everything up to the skill lists
+        required = calls[0]["flat"].index("Matched Skills")
+        mean_len = sum(len(c["flat"]) for c in calls) / len(calls)
+        passed = common >= required
+        # Within one resume (sections and chunks), up to the section itself
+        for resume_calls in per_resume:
+            resume_calls = [c for c in resume_calls if marker in c["flat"]]
+            if len(resume_calls) > 1:
+                run_common = min(_common_prefix(resume_calls[0]["flat"], c["flat"]) for c in resume_calls)
+                passed = passed and run_common >= resume_calls[0]["flat"].index(section_marker)
+        ok = ok and passed
+        shortest_shared = min(common, shortest_shared or common)
+        print(
+            f"{shot}: {len(calls)} calls, shared prefix {common} chars (~{common // 4} tokens, "
+            f"{common / mean_len:.0%} of the mean prompt), system + job block {required} chars"
+            f"{', matched skills shared per resume' if passed else ''}: {'OK' if passed else 'NOT SHARED'}"
+        )
+    cached = sum(c["cached_tokens"] for c in standin.calls)
+    prompt = sum(c["prompt_tokens"] for c in standin.calls)
+    print(f"Cached prompt tokens reported: {cached}/{prompt} "
+          f"(min {standin.min_cached_tokens}, block {standin.cache_block})")
+    if shortest_shared is not None and shortest_shared // 4 < standin.min_cached_tokens:
+        print(f"Note: the job-level prefix (~{shortest_shared // 4} tokens) is under the "
+              f"{standin.min_cached_tokens}-token caching minimum; only prompts that repeat a longer "
+              f"prefix are reported as cached")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenAI chat completions stand-in with prefix checks")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--min-cached-tokens", type=int, default=1024,
+                        help="Shortest prefix reported as cached (OpenAI: 1024)")
+    parser.add_argument("--cache-block", type=int, default=128, help="Cached tokens are whole blocks")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Share of responses that are slow")
+    parser.add_argument("--slow-latency", type=float, default=0.0, help="Seconds a slow response takes")
+    parser.add_argument("--shot1-accept-rate", type=float, default=0.0,
+                        help="Share of Shot 1 prompts answered with an edit")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with 500")
+    parser.add_argument("--ms-per-token", type=float, default=0.0,
+                        help="Generation time per completion token (milliseconds)")
+    parser.add_argument("--verify", action="store_true", help="Run the prefix check and exit")
+    args = parser.parse_args()
+
+    standin = StandIn(
+        args.min_cached_tokens, args.cache_block, args.latency,
+        args.slow_rate, args.slow_latency, args.shot1_accept_rate, args.error_rate,
+        ms_per_token=args.ms_per_token,
+    )
+    server = make_server(standin, args.port, "127.0.0.1" if args.verify else "0.0.0.0")
+    if not args.verify:
+        print(f"LLM stand-in on http://localhost:{args.port}/v1 (GET /v1/stats for per-call prefixes)")
+        server.serve_forever()
+    else:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            sys.exit(0 if verify(standin, args.port) else 1)
+        finally:
+            server.shutdown()
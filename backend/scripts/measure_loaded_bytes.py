@@ -0,0 +1,106 @@
+"""
+Measure how many column bytes the hot endpoints and the scoring worker pull
+into ORM objects, with the deferred large columns as mapped (default) or
+with every column undeferred (--undefer-all, the pre-deferral behaviour).
+
+Needs a populated database (at least one PARSED resume and some jobs). The
+worker measurement re-scores that resume (same rows, rewritten).
+
+  python scripts/measure_loaded_bytes.py
+  python scripts/measure_loaded_bytes.py --undefer-all
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+import httpx
+from sqlalchemy import desc, event
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session, undefer
+
+from app.core.config import settings
+from app.db.base_class import Base
+from app.db.session import AsyncSessionLocal
+from app.main import app
+from app.models.resume import Resume
+from app.models.tailored_resume import TailoredResume
+
+_loaded = {"objects": 0, "bytes": 0}
+
+
+def _value_size(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (dict, list)):
+        return len(json.dumps(value, default=str))
+    return len(str(value))
+
+
+@event.listens_for(Base, "load", propagate=True)
+def _count_loaded(target, context):
+    _loaded["objects"] += 1
+    _loaded["bytes"] += sum(
+        _value_size(v) for k, v in vars(target).items() if not k.startswith("_sa_")
+    )
+
+
+def _undefer_all(orm_execute_state):
+    if orm_execute_state.is_select:
+        orm_execute_state.statement = orm_execute_state.statement.options(undefer("*"))
+
+
+async def measure(label, coro_fn):
+    _loaded.update(objects=0, bytes=0)
+    await coro_fn()
+    print(f"{label:<45} {_loaded['objects']:>7} objects {_loaded['bytes']:>12,} bytes")
+
+
+async def main(undefer_all: bool):
+    if undefer_all:
+        event.listen(Session, "do_orm_execute", _undefer_all)
+
+    async with AsyncSessionLocal() as session:
+        resume_id = await session.scalar(
+            select(Resume.id).filter(Resume.status == "PARSED").order_by(desc(Resume.uploaded_at)).limit(1)
+        )
+        tailored_id = await session.scalar(select(TailoredResume.id).limit(1))
+    if not resume_id:
+        print("No PARSED resume found; upload one first")
+        return
+
+    api = settings.API_V1_STR
+    paths = [
+        f"{api}/jobs/?limit=100",
+        f"{api}/resumes/latest",
+        f"{api}/resumes/{resume_id}",
+        f"{api}/scoring/resume/{resume_id}",
+        f"{api}/scoring/stats/{resume_id}",
+        f"{api}/resumes/tailored",
+    ]
+    if tailored_id:
+        paths.append(f"{api}/resumes/tailored/{tailored_id}")
+
+    print(f"Column mode: {'undefer all' if undefer_all else 'deferred (default)'}")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://measure") as client:
+        for path in paths:
+            async def call(path=path):
+                response = await client.get(path)
+                response.raise_for_status()
+            await measure(f"GET {path}", call)
+
+    from app.workers.scoring import perform_batch_scoring
+    await measure("worker: perform_batch_scoring", lambda: perform_batch_scoring(resume_id))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bytes loaded into ORM objects per hot path")
+    parser.add_argument("--undefer-all", action="store_true", help="Load every column (baseline)")
+    args = parser.parse_args()
+    asyncio.run(main(args.undefer_all))
@@ -0,0 +1,88 @@
+"""
+Replay archived raw_job_posts from MongoDB into Postgres.
+
+Examples:
+  # Full rebuild across 8 local processes
+  python scripts/replay_raw_jobs.py --partitions 8
+
+  # Backfill one source for a time window via Celery workers
+  python scripts/replay_raw_jobs.py --source LinkedIn --since 2026-09-01 --until 2026-10-01 --celery
+
+  # Resume an interrupted run
+  python scripts/replay_raw_jobs.py --run-id <run_id>
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+from app.workers.replay import (
+    REPLAY_BATCH_SIZE, build_query, prepare_run, replay_partition,
+)
+
+
+def _run_partition(args):
+    # Runs in a fresh (spawned) process with its own Mongo client and DB pool
+    return asyncio.run(replay_partition(*args))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay raw_job_posts into Postgres")
+    parser.add_argument("--source", help="Only replay posts from this source")
+    parser.add_argument("--since", help="ISO datetime (inclusive) of scraped_at")
+    parser.add_argument("--until", help="ISO datetime (exclusive) of scraped_at")
+    parser.add_argument("--partitions", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--batch-size", type=int, default=REPLAY_BATCH_SIZE)
+    parser.add_argument("--run-id", help="Resume an existing run")
+    parser.add_argument("--celery", action="store_true", help="Dispatch partitions to Celery workers")
+    args = parser.parse_args()
+
+    run_id = args.run_id or uuid.uuid4().hex
+
+    if args.celery:
+        from app.workers.replay import replay_raw_posts_task
+        res = replay_raw_posts_task.delay(
+            args.source, args.since, args.until, args.partitions, run_id, args.batch_size
+        )
+        print(f"Replay dispatched: run_id={run_id} task={res.id}")
+        print("Progress: python -c \"import asyncio; from app.workers.replay import replay_progress; "
+              f"print(asyncio.run(replay_progress('{run_id}')))\"")
+        return
+
+    query = build_query(args.source, args.since, args.until)
+    ranges = asyncio.run(prepare_run(run_id, query, args.partitions))
+    print(f"Replay run {run_id}: {len(ranges)} partitions")
+
+    started = time.perf_counter()
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(ranges) or 1, mp_context=ctx) as pool:
+        futures = [
+            pool.submit(_run_partition, (run_id, i, r["lower"], r["upper"], args.source,
+                                         args.since, args.until, args.batch_size))
+            for i, r in enumerate(ranges)
+        ]
+        results = []
+        for future in as_completed(futures):
+            results.append(future.result())
+            print(f"  {results[-1]}")
+
+    elapsed = time.perf_counter() - started
+    replayed = sum(r.get("replayed", 0) for r in results)
+    totals = {}
+    for r in results:
+        for key, value in r.get("stats", {}).items():
+            totals[key] = totals.get(key, 0) + value
+    rate = replayed / elapsed if elapsed > 0 else 0.0
+    print(f"Done: {replayed} posts replayed in {elapsed:.1f}s ({rate:.0f} posts/s) {totals}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Local stand-in for a job listing site.
+
+Serves the bundled dataset (or SCRAPER_DATASET_PATH) as paginated HTML in
+the markup HttpScraper expects, over HTTP/1.1 keep-alive, with ETag and
+Last-Modified validators and 304 responses for conditional requests.
+
+  python scripts/serve_jobs_html.py --port 8081
+  SCRAPER_HTTP_BASE_URL=http://localhost:8081 python scripts/run_pipeline.py
+"""
+
+import argparse
+import hashlib
+import html
+import os
+import sys
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+from app.services.scraper.recursive_scraper import RecursiveScraper
+from app.services.scraper.job_index import get_job_index
+
+PAGE_SIZE = 10
+
+
+def render_page(jobs, page: int, params: dict) -> bytes:
+    start = (page - 1) * PAGE_SIZE
+    chunk = jobs[start:start + PAGE_SIZE]
+    parts = ["<!DOCTYPE html><html><head><title>Jobs</title></head><body><main>"]
+    for job in chunk:
+        e = lambda v: html.escape(str(v or ""))
+        parts.append(
+            f'<article class="job" data-external-id="{e(job.get("external_id"))}">'
+            f'<h2 class="title">{e(job["title"])}</h2>'
+            f'<span class="company">{e(job["company"])}</span>'
+            f'<span class="location">{e(job["location"])}</span>'
+            f'<span class="salary">{e(job.get("salary"))}</span>'
+            f'<span class="source">{e(job.get("source"))}</span>'
+            f'<time class="posted-at" datetime="{e(job.get("posted_at"))}"></time>'
+            f'<div class="description">{e(job["description"])}</div>'
+            "</article>"
+        )
+    if start + PAGE_SIZE < len(jobs):
+        parts.append(f'<a rel="next" href="/jobs?{urlencode({**params, "page": page + 1})}">Next</a>')
+    parts.append("</main></body></html>")
+    return "".join(parts).encode()
+
+
+def make_handler(data_path: str):
+    last_modified = formatdate(os.path.getmtime(data_path), usegmt=True)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != "/jobs":
+                self.send_error(404)
+                return
+            qs = {k: v[0] for k, v in parse_qs(url.query).items()}
+            page = int(qs.pop("page", "1"))
+            query, location = qs.get("q", "*"), qs.get("location", "*")
+
+            index = get_job_index(data_path)
+            if query == "*":
+                jobs = list(index.iter_jobs())
+            else:
+                loc = None if location == "*" or "uae" in location.lower() else location.lower()
+                jobs = index.search(query.lower().split(), loc)
+
+            body = render_page(jobs, page, {"q": query, "location": location})
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", last_modified)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def start_server(port: int = 0, data_path: str = None) -> ThreadingHTTPServer:
+    """Start the stand-in server on a background thread; returns the server."""
+    data_path = data_path or RecursiveScraper().data_path
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(data_path))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+    server = start_server(args.port)
+    print(f"Serving jobs at http://127.0.0.1:{server.server_address[1]}/jobs")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
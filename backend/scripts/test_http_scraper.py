@@ -0,0 +1,51 @@
+"""
+Exercise HttpScraper against the local stand-in server (serve_jobs_html.py).
+
+Checks that every dataset job is parsed from the paginated HTML, that a
+second crawl is answered with 304s, and prints throughput and bytes saved.
+"""
+
+import asyncio
+import os
+import sys
+
+# Ensure app in path
+sys.path.append(os.getcwd())
+
+from scripts.serve_jobs_html import start_server
+from app.services.scraper.http_scraper import HttpScraper, MemoryValidatorStore, close_http_clients
+from app.services.scraper.recursive_scraper import RecursiveScraper
+
+
+async def test_http_scraper():
+    server = start_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    store = MemoryValidatorStore()
+    expected = await RecursiveScraper().fetch_jobs("*", "Dubai")
+
+    try:
+        cold = HttpScraper(base_url, validator_store=store)
+        jobs = await cold.fetch_jobs("*", "Dubai")
+        print(f"Cold crawl: {cold.metrics.as_dict()}")
+        assert len(jobs) == len(expected), f"expected {len(expected)} jobs, got {len(jobs)}"
+        assert [j["title"] for j in jobs] == [j["title"] for j in expected]
+        assert jobs[0]["description"] == expected[0]["description"]
+        cold.normalize_job(jobs[0])
+
+        warm = HttpScraper(base_url, validator_store=store)
+        jobs_again = await warm.fetch_jobs("*", "Dubai")
+        print(f"Warm crawl: {warm.metrics.as_dict()}")
+        assert jobs_again == jobs
+        assert warm.metrics.pages_fetched == 0
+        assert warm.metrics.bytes_saved == cold.metrics.bytes_received
+
+        filtered = await HttpScraper(base_url, validator_store=store).fetch_jobs("Python", "Dubai")
+        print(f"Fetched {len(filtered)} jobs for query='Python'")
+        print("✅ HttpScraper OK")
+    finally:
+        await close_http_clients()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_http_scraper())